@@ -0,0 +1,462 @@
+"""
+Extractor Benchmark
+===================
+
+Replays saved Groww and Pulse pages through every extractor and reports,
+per extractor:
+- wall time, end to end
+- WebDriver round trips (commands sent to chromedriver)
+- peak RSS of this process plus Chrome
+- field-level accuracy against golden outputs
+
+Goldens are drafted by groww_embedded and pulse_html_parser, so those two
+are reference-only: they are timed but not scored, since scoring them
+against their own output would always pass.
+
+Fixtures are replayed from file:// with all http(s) requests blocked, so
+runs need no network and are repeatable. Results are stored as a JSON
+baseline; later runs are compared against it and regressions fail the run.
+
+Files (in BENCHMARK_DIR, default ./benchmarks):
+    groww.html, pulse.html                 Recorded page sources
+    groww.golden.json, pulse.golden.json   Expected output (review by hand)
+    baseline.json                          Last accepted results
+
+Usage:
+    python benchmark_extractors.py record            # save live pages (needs network)
+    python benchmark_extractors.py golden            # draft golden outputs from the offline parsers
+    python benchmark_extractors.py run               # compare against baseline.json
+    python benchmark_extractors.py run --update      # accept results as the new baseline
+    python benchmark_extractors.py run --only groww_embedded,pulse_html_parser
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+from browser_pool import BrowserSession, _process_tree_rss_mb, find_free_port
+from groww_embedded import parse_groww_page
+from groww_html_parser import GROWW_URL, GrowwPageParser
+from news_timeline import normalize_headline
+from pulse_html_parser import PULSE_URL, PulsePageParser
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "benchmarks")
+SITE_URLS = {'groww': GROWW_URL, 'pulse': PULSE_URL}
+
+# Replays must never reach the live sites
+OFFLINE_PATTERNS = ['http://*', 'https://*']
+
+# Fields that legitimately differ between runs ("2 hours ago" is relative
+# to the clock) and are left out of accuracy
+VOLATILE_FIELDS = {'time_ago', 'time', 'id', 'scraped_at', 'scrape_timestamp'}
+
+# Record key used to match extracted rows to golden rows, per section
+KEY_FIELDS = {'news': 'headline', 'articles': 'headline'}
+
+# Regression thresholds for run (compared with baseline.json)
+MAX_ACCURACY_DROP = 0.01
+MAX_SLOWDOWN = 1.5
+MAX_EXTRA_CALLS = 1.2
+
+
+class _ReplayDriver:
+    """Driver proxy for scripts that launch and quit their own Chrome"""
+
+    def __init__(self, driver, url: str):
+        self._driver = driver
+        self._url = url
+
+    def get(self, url):
+        self._driver.get(self._url)
+
+    def quit(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def _groww_fixed(parse_mode):
+    def run(driver, url):
+        from groww_scraper_fixed import GrowwScraperFixed
+        scraper = GrowwScraperFixed(headless=True, driver=driver, parse_mode=parse_mode)
+        scraper.url = url
+        return scraper.scrape_all()
+    return run
+
+
+def _grownews(driver, url):
+    from grownews import GrowwStockNewsScraper
+    scraper = GrowwStockNewsScraper(headless=True, driver=driver)
+    scraper.url = url
+    if not scraper._init_driver() or not scraper.navigate_to_page():
+        return {}
+    return {'news': (scraper.scrape_all_news() or {}).get('news_items', [])}
+
+
+def _groww_simplified(driver, url):
+    from selenium.webdriver.support.ui import WebDriverWait
+    from groww_simplified_scraper import GrowwStockNewsScraper
+    scraper = GrowwStockNewsScraper(headless=True)
+    scraper.url = url
+    scraper.driver = driver
+    scraper.wait = WebDriverWait(driver, 20)
+    if not scraper.navigate_to_page():
+        return {}
+    return {'news': (scraper.scrape_all_news() or {}).get('news_items', [])}
+
+
+def _scrape_groww(driver, url):
+    import scrape_groww
+    original = scrape_groww.setup_driver
+    scrape_groww.setup_driver = lambda headless=False: _ReplayDriver(driver, url)
+    try:
+        data = scrape_groww.scrape_groww(headless=True)
+    finally:
+        scrape_groww.setup_driver = original
+    return {'indices': data['indices'], 'news': data['news']}
+
+
+def _pulse_browser(extraction_mode):
+    def run(driver, url):
+        from pulse_zerodha_scraper import PulseZerodhaScraper
+        scraper = PulseZerodhaScraper(headless=True, driver=driver, extraction_mode=extraction_mode)
+        scraper.url = url
+        if not scraper._init_driver() or not scraper.navigate_to_page():
+            return {}
+        return {'articles': (scraper.scrape_all_news() or {}).get('articles', [])}
+    return run
+
+
+# name -> (site, needs_browser, run). Offline runs get (html, original_url);
+# browser runs get (driver, file_url).
+EXTRACTORS: Dict[str, tuple] = {
+    'groww_embedded': ('groww', False, lambda html, url: parse_groww_page(html, url)),
+    'groww_html_parser': ('groww', False, lambda html, url: GrowwPageParser(html, url).parse_all()),
+    'groww_scraper_fixed.snapshot': ('groww', True, _groww_fixed('snapshot')),
+    'groww_scraper_fixed.live': ('groww', True, _groww_fixed('live')),
+    'grownews': ('groww', True, _grownews),
+    'groww_simplified_scraper': ('groww', True, _groww_simplified),
+    'scrape_groww': ('groww', True, _scrape_groww),
+    'pulse_html_parser': ('pulse', False, lambda html, url: {'articles': PulsePageParser(html, url).parse_articles()}),
+    'pulse_zerodha_scraper.script': ('pulse', True, _pulse_browser('script')),
+    'pulse_zerodha_scraper.dom': ('pulse', True, _pulse_browser('dom')),
+}
+
+# Offline parsers that draft each site's golden output; they are not scored
+GOLDEN_SOURCES = {'groww': 'groww_embedded', 'pulse': 'pulse_html_parser'}
+REFERENCE_EXTRACTORS = set(GOLDEN_SOURCES.values())
+
+
+def _path(name: str) -> str:
+    return os.path.join(BENCHMARK_DIR, name)
+
+
+def _load_json(name: str) -> Optional[Dict]:
+    try:
+        with open(_path(name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _save_json(name: str, data: Dict):
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    with open(_path(name), 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _replay_file(site: str, html: str) -> str:
+    """Write a copy of the fixture whose relative links resolve like the live page"""
+    base = f'<base href="{SITE_URLS[site]}">'
+    if re.search(r'<head[^>]*>', html, re.IGNORECASE):
+        html = re.sub(r'(<head[^>]*>)', lambda m: m.group(1) + base, html, count=1, flags=re.IGNORECASE)
+    else:
+        html = base + html
+    handle, path = tempfile.mkstemp(prefix=f'replay-{site}-', suffix='.html')
+    with os.fdopen(handle, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return path
+
+
+@contextmanager
+def _count_commands(driver):
+    """Count WebDriver commands (WebElement calls go through driver.execute too)"""
+    counter = {'calls': 0}
+    if driver is None:
+        yield counter
+        return
+    execute = driver.execute
+
+    def counting(*args, **kwargs):
+        counter['calls'] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = counting
+    try:
+        yield counter
+    finally:
+        del driver.execute
+
+
+@contextmanager
+def _peak_rss(interval: float = 0.05):
+    """Sample RSS of this process and its children (Chrome) while the block runs"""
+    peak = {'mb': _process_tree_rss_mb(os.getpid())}
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(interval):
+            peak['mb'] = max(peak['mb'], _process_tree_rss_mb(os.getpid()))
+
+    thread = threading.Thread(target=sample, daemon=True)
+    thread.start()
+    try:
+        yield peak
+    finally:
+        stop.set()
+        thread.join()
+        peak['mb'] = max(peak['mb'], _process_tree_rss_mb(os.getpid()))
+
+
+def _record_key(section: str, record: Dict) -> str:
+    if KEY_FIELDS.get(section, 'name') == 'headline':
+        return normalize_headline(record.get('headline', ''))
+    return ' '.join(str(record.get('name', '')).split()).upper()
+
+
+def score(output: Dict[str, List[Dict]], golden: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    """
+    Field-level accuracy of an extractor's output
+
+    Rows are matched to golden rows by name (indices, stocks) or normalized
+    headline (news, articles). Only sections the extractor produced, and
+    fields it emits for that section, are scored (the rest are listed as
+    missing_fields); volatile fields are ignored. A golden row the
+    extractor didn't find counts every scored field as wrong.
+
+    Returns:
+        dict: {"sections": {section: {"rows", "found", "fields",
+        "correct", "accuracy", "missing_fields"}}, "accuracy"}
+    """
+    sections = {}
+    total_fields = total_correct = 0
+    for section, expected in golden.items():
+        if not isinstance(expected, list) or section not in output:
+            continue
+        rows = [r for r in output.get(section) or [] if isinstance(r, dict)]
+        extracted = {_record_key(section, r): r for r in rows}
+        emitted = {field for r in rows for field in r}
+        wanted = {field for r in expected for field in r} - VOLATILE_FIELDS
+        fields = correct = found = 0
+        for row in expected:
+            match = extracted.get(_record_key(section, row))
+            found += match is not None
+            for field, value in row.items():
+                if field not in wanted or field not in emitted:
+                    continue
+                fields += 1
+                if match is not None and str(match.get(field, '')).strip() == str(value).strip():
+                    correct += 1
+        sections[section] = {
+            'rows': len(expected),
+            'found': found,
+            'fields': fields,
+            'correct': correct,
+            'accuracy': round(correct / fields, 4) if fields else (1.0 if not expected else 0.0),
+            'missing_fields': sorted(wanted - emitted) if rows else []
+        }
+        total_fields += fields
+        total_correct += correct
+    return {
+        'sections': sections,
+        'accuracy': round(total_correct / total_fields, 4) if total_fields else None
+    }
+
+
+def run_extractor(name: str, html: str, golden: Dict, session: Optional[BrowserSession]) -> Dict[str, Any]:
+    """Run one extractor against its site's fixture and measure it"""
+    site, needs_browser, run = EXTRACTORS[name]
+    driver = session.driver if needs_browser else None
+    replay = None
+    error = None
+    output = {}
+
+    if needs_browser:
+        replay = _replay_file(site, html)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': OFFLINE_PATTERNS})
+
+    try:
+        with _peak_rss() as peak, _count_commands(driver) as commands:
+            start = time.perf_counter()
+            try:
+                if needs_browser:
+                    output = run(driver, 'file://' + replay) or {}
+                else:
+                    output = run(html, SITE_URLS[site]) or {}
+            except Exception as e:
+                logger.error(f"{name} failed: {e}", exc_info=True)
+                error = f"{type(e).__name__}: {e}"
+            wall = time.perf_counter() - start
+    finally:
+        if replay:
+            os.remove(replay)
+            try:
+                driver.get('about:blank')
+            except Exception:
+                pass
+
+    result = {
+        'site': site,
+        'wall_seconds': round(wall, 3),
+        'webdriver_calls': commands['calls'],
+        'peak_rss_mb': round(peak['mb'], 1),
+        'items': {k: len(v) for k, v in output.items() if isinstance(v, list)},
+        'error': error
+    }
+    if name in REFERENCE_EXTRACTORS:
+        result.update({'sections': {}, 'accuracy': None, 'reference': True})
+    else:
+        result.update(score(output, golden or {}))
+    return result
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict]) -> List[str]:
+    """Regressions of results against baseline, as readable lines"""
+    problems = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current['error'] and not previous.get('error'):
+            problems.append(f"{name}: now fails ({current['error']})")
+        if previous.get('accuracy') is not None and (current['accuracy'] or 0) < previous['accuracy'] - MAX_ACCURACY_DROP:
+            problems.append(f"{name}: accuracy {previous['accuracy']} -> {current['accuracy']}")
+        if current['wall_seconds'] > previous['wall_seconds'] * MAX_SLOWDOWN + 0.5:
+            problems.append(f"{name}: wall time {previous['wall_seconds']}s -> {current['wall_seconds']}s")
+        if current['webdriver_calls'] > previous['webdriver_calls'] * MAX_EXTRA_CALLS + 5:
+            problems.append(f"{name}: WebDriver calls {previous['webdriver_calls']} -> {current['webdriver_calls']}")
+    return problems
+
+
+def _fixture(site: str) -> Optional[str]:
+    try:
+        with open(_path(f'{site}.html'), 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def record(headless: bool = True, settle_seconds: float = 10):
+    """Save the live pages' rendered HTML as fixtures (needs network)"""
+    from page_readiness import scroll_until_stable
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    session = BrowserSession(0, find_free_port(), headless=headless)
+    try:
+        for site, url in SITE_URLS.items():
+            session.driver.get(url)
+            time.sleep(settle_seconds)
+            if site == 'groww':
+                scroll_until_stable(session.driver, 'Stocks in news', r'\d+\s*(?:minutes?|hours?|days?)\s*ago')
+            with open(_path(f'{site}.html'), 'w', encoding='utf-8') as f:
+                f.write(session.driver.page_source)
+            print(f"Recorded {_path(site + '.html')}")
+    finally:
+        session.close()
+
+
+def golden():
+    """Draft golden outputs from the offline parsers (review and correct them)"""
+    for site, name in GOLDEN_SOURCES.items():
+        html = _fixture(site)
+        if html is None:
+            print(f"No fixture for {site}, run 'record' first")
+            continue
+        output = EXTRACTORS[name][2](html, SITE_URLS[site])
+        _save_json(f'{site}.golden.json', {k: v for k, v in output.items() if isinstance(v, list)})
+        print(f"Wrote {_path(site + '.golden.json')} from {name}")
+
+
+def run(only: Optional[List[str]] = None, update: bool = False, headless: bool = True) -> int:
+    """
+    Benchmark extractors against fixtures
+
+    Returns:
+        int: Process exit code (1 if any regression against the baseline)
+    """
+    names = [n for n in EXTRACTORS if not only or n in only]
+    fixtures = {site: _fixture(site) for site in SITE_URLS}
+    goldens = {site: _load_json(f'{site}.golden.json') for site in SITE_URLS}
+
+    session = None
+    if any(EXTRACTORS[n][1] and fixtures[EXTRACTORS[n][0]] for n in names):
+        session = BrowserSession(0, find_free_port(), headless=headless)
+
+    # Scrapers install their own block lists; keep those offline too
+    os.environ["BLOCK_EXTRA_PATTERNS"] = ','.join(
+        [p for p in os.getenv("BLOCK_EXTRA_PATTERNS", '').split(',') if p] + OFFLINE_PATTERNS
+    )
+
+    results = {}
+    try:
+        for name in names:
+            site = EXTRACTORS[name][0]
+            if fixtures[site] is None:
+                print(f"skip {name}: no {_path(site + '.html')}")
+                continue
+            if goldens[site] is None:
+                print(f"note: no {_path(site + '.golden.json')}, accuracy not scored")
+            results[name] = run_extractor(name, fixtures[site], goldens[site], session)
+            r = results[name]
+            accuracy = 'reference' if r.get('reference') else r['accuracy']
+            print(f"{name:34s} {r['wall_seconds']:8.2f}s {r['webdriver_calls']:6d} calls "
+                  f"{r['peak_rss_mb']:7.1f} MB  accuracy {accuracy}  {r['items']}"
+                  + (f"  ERROR {r['error']}" if r['error'] else ''))
+    finally:
+        if session:
+            session.close()
+
+    baseline = _load_json('baseline.json') or {}
+    problems = compare(results, baseline)
+    for line in problems:
+        print(f"REGRESSION {line}")
+
+    if update:
+        _save_json('baseline.json', {**baseline, **results})
+        print(f"Baseline updated: {_path('baseline.json')}")
+        return 0
+    return 1 if problems else 0
+
+
+def main():
+    """Command-line entry point"""
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Benchmark Groww and Pulse extractors on recorded pages")
+    parser.add_argument('command', choices=['record', 'golden', 'run'])
+    parser.add_argument('--only', help="Comma-separated extractor names")
+    parser.add_argument('--update', action='store_true', help="Store results as the new baseline")
+    parser.add_argument('--show-browser', action='store_true', help="Run Chrome with a window")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(headless=not args.show_browser)
+    elif args.command == 'golden':
+        golden()
+    else:
+        only = [n.strip() for n in args.only.split(',')] if args.only else None
+        sys.exit(run(only, update=args.update, headless=not args.show_browser))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,662 @@
+"""
+Browser Session Pool
+====================
+
+Pool of long-lived headless Chrome sessions that scrapers borrow and return
+instead of launching a fresh browser for every request.
+
+Each session gets:
+- Its own debugging port (no more collisions on 9222)
+- Its own temporary profile directory
+- A health check before it is handed out
+- Recycling after N navigations or once Chrome's RSS crosses a ceiling
+
+TabPool has the same interface but lends out windows of one shared Chrome
+process, so several sources load side by side for roughly the memory of a
+single browser. Each tab's driver is a TabDriver: it shares the browser's
+WebDriver session and switches to its own window before every command, so
+scrapers on different threads interleave command by command. Page loads and
+readiness waits poll with short commands instead of holding the session.
+
+Usage:
+    pool = BrowserPool(size=1)      # or TabPool(size=2)
+    with pool.session() as session:
+        scraper = PulseZerodhaScraper(headless=True, driver=session.driver)
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.mobile import Mobile
+from selenium.webdriver.remote.switch_to import SwitchTo
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+from groww_network import enable_network_logging
+from page_readiness import eager_options
+
+logger = logging.getLogger(__name__)
+
+# How often a loading tab is checked; other tabs run commands in between
+TAB_POLL_SECONDS = 0.1
+
+
+def find_free_port() -> int:
+    """Ask the OS for a free TCP port on localhost"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _process_tree_rss_mb(root_pid) -> float:
+    """
+    Sum resident memory of a process and all its descendants (Linux only)
+
+    Args:
+        root_pid: PID of the chromedriver process
+
+    Returns:
+        float: RSS in MB, or 0.0 if /proc is unavailable
+    """
+    total_kb = 0
+    pending = [root_pid]
+    seen = set()
+
+    while pending:
+        pid = pending.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+
+        try:
+            for tid in os.listdir(f"/proc/{pid}/task"):
+                with open(f"/proc/{pid}/task/{tid}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+
+    return total_kb / 1024.0
+
+
+class BrowserSession:
+    """A single pooled Chrome instance"""
+
+    def __init__(self, slot, debug_port, headless=True, network_logging=False):
+        """Launch Chrome for this pool slot (network_logging: keep the performance log)"""
+        self.slot = slot
+        self.debug_port = debug_port
+        self.headless = headless
+        self.network_logging = network_logging
+        self.navigations = 0
+        self.created_at = datetime.now()
+        self.driver = None
+        self._profile_dir = tempfile.mkdtemp(prefix=f"chrome-pool-{slot}-")
+
+        try:
+            self.driver = webdriver.Chrome(service=Service(), options=self._build_options())
+            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        except Exception:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            raise
+
+        logger.info(f"Browser session {slot} started on debugging port {debug_port}")
+
+    def _build_options(self):
+        """Chrome flags shared by every pooled session"""
+        # Eager: get() returns at DOMContentLoaded; page_readiness waits
+        # for the content each scraper actually needs
+        options = eager_options(webdriver.ChromeOptions())
+        if self.network_logging:
+            # Only GROWW_PARSE_MODE=network reads it; ChromeDriver buffers
+            # every Network.* event until the log is drained
+            enable_network_logging(options)
+        if self.headless:
+            options.add_argument('--headless=new')
+            options.add_argument('--disable-gpu')
+
+        # Essential flags for containerized Chrome
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-setuid-sandbox')
+        options.add_argument(f'--remote-debugging-port={self.debug_port}')
+        options.add_argument('--no-zygote')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-software-rasterizer')
+        options.add_argument('--disable-features=VizDisplayCompositor')
+        options.add_argument(f'--user-data-dir={self._profile_dir}')
+
+        # Anti-bot detection
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument('--window-size=1280,720')
+        return options
+
+    def is_healthy(self) -> bool:
+        """Check the browser still answers WebDriver commands"""
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def rss_mb(self) -> float:
+        """Resident memory of chromedriver plus all Chrome child processes"""
+        try:
+            return _process_tree_rss_mb(self.driver.service.process.pid)
+        except Exception:
+            return 0.0
+
+    def reset(self):
+        """Drop page state so the next borrower starts from a blank tab"""
+        self.driver.implicitly_wait(0)
+        self.driver.delete_all_cookies()
+        self.driver.get("about:blank")
+        # Discard the previous borrower's network log
+        if self.network_logging:
+            try:
+                self.driver.get_log('performance')
+            except Exception:
+                pass
+
+    def close(self):
+        """Quit Chrome and remove the profile directory"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+        shutil.rmtree(self._profile_dir, ignore_errors=True)
+        logger.info(f"Browser session {self.slot} closed after {self.navigations} navigations")
+
+    def stats(self) -> dict:
+        """Summary for the health endpoint"""
+        return {
+            'slot': self.slot,
+            'debug_port': self.debug_port,
+            'navigations': self.navigations,
+            'rss_mb': round(self.rss_mb(), 1),
+            'age_seconds': round((datetime.now() - self.created_at).total_seconds(), 1)
+        }
+
+
+class SharedBrowserSession(BrowserSession):
+    """A Chrome instance whose windows are lent out as tabs"""
+
+    def __init__(self, slot, debug_port, headless=True, network_logging=False):
+        """Launch Chrome; its first window stays open to keep the session alive"""
+        super().__init__(slot, debug_port, headless, network_logging)
+        self.lock = threading.RLock()  # One WebDriver command at a time
+        self.home_handle = self.driver.current_window_handle
+        self.current_handle = self.home_handle
+
+    def _build_options(self):
+        options = super()._build_options()
+        # chromedriver runs one command at a time per session and, under
+        # "eager", holds it while the current tab loads; TabDriver.get()
+        # waits for each tab itself so other tabs keep working meanwhile
+        options.page_load_strategy = 'none'
+        # Tabs load side by side; don't throttle the ones in the background
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-backgrounding-occluded-windows')
+        options.add_argument('--disable-renderer-backgrounding')
+        return options
+
+    def is_healthy(self) -> bool:
+        # window_handles doesn't depend on which window is current
+        try:
+            with self.lock:
+                return self.home_handle in self.driver.window_handles
+        except Exception:
+            return False
+
+    def clear_shared_state(self):
+        """Clear cookies and drain the performance log (only with no tab lent out)"""
+        with self.lock:
+            if self.current_handle != self.home_handle:
+                self.driver.switch_to.window(self.home_handle)
+                self.current_handle = self.home_handle
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            if self.network_logging:
+                self.driver.get_log('performance')
+
+    def open_window(self) -> str:
+        """Open a new window and return its handle"""
+        with self.lock:
+            self.driver.switch_to.new_window('window')
+            self.current_handle = self.driver.current_window_handle
+            return self.current_handle
+
+
+class TabDriver(webdriver.Chrome):
+    """WebDriver for one window of a SharedBrowserSession"""
+
+    # page_readiness polls for async script results instead of blocking
+    # the shared session with execute_async_script
+    script_poll_seconds = TAB_POLL_SECONDS
+
+    def __init__(self, browser: SharedBrowserSession, handle: str):
+        """
+        Bind to an open window (no new WebDriver session is started)
+
+        Args:
+            browser: Browser owning the window
+            handle: Window handle this driver sends its commands to
+        """
+        self.__dict__.update(browser.driver.__dict__)
+        self._switch_to = SwitchTo(self)
+        self._mobile = Mobile(self)
+        self._shared_browser = browser
+        self.handle = handle
+
+    def execute(self, driver_command, params=None):
+        """Switch to this tab's window, then run the command"""
+        browser = self._shared_browser
+        with browser.lock:
+            if browser.current_handle != self.handle:
+                super().execute(Command.SWITCH_TO_WINDOW, {'handle': self.handle})
+                browser.current_handle = self.handle
+            return super().execute(driver_command, params)
+
+    def get(self, url: str) -> None:
+        """
+        Load url, returning at DOMContentLoaded like the "eager" strategy
+
+        The shared session is only held for each short command, never for
+        the whole load, so pages in other tabs load at the same time.
+
+        Raises:
+            WebDriverException: The navigation failed (e.g. DNS error)
+            TimeoutException: Still loading after the page load timeout
+        """
+        result = self.execute_cdp_cmd('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            raise WebDriverException(f"unknown error: {result['errorText']}")
+
+        deadline = time.time() + self.timeouts.page_load
+        while self.execute_script("return document.readyState") == 'loading':
+            if time.time() > deadline:
+                raise TimeoutException(f"Timed out loading {url}")
+            time.sleep(TAB_POLL_SECONDS)
+
+    def quit(self) -> None:
+        """Close this tab only; the shared browser keeps running"""
+        self.close()
+
+
+class BrowserTab:
+    """One window of a SharedBrowserSession, lent out like a BrowserSession"""
+
+    def __init__(self, browser: SharedBrowserSession, slot):
+        """Open a window in the shared browser"""
+        self.browser = browser
+        self.slot = slot
+        self.navigations = 0
+        self.created_at = datetime.now()
+        self.handle = browser.open_window()
+        self.driver = TabDriver(browser, self.handle)
+        logger.info(f"Browser tab {slot} opened")
+
+    def is_healthy(self) -> bool:
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def rss_mb(self) -> float:
+        """Resident memory of the whole shared browser"""
+        return self.browser.rss_mb()
+
+    def reset(self):
+        """Blank the tab for the next borrower"""
+        self.driver.implicitly_wait(0)
+        # Only this tab's state: cookies belong to the shared profile and
+        # other tabs may be mid-scrape, so TabPool clears them once idle
+        self.driver.execute_script(
+            "try { sessionStorage.clear(); localStorage.clear(); } catch (e) {}"
+        )
+        self.driver.get("about:blank")
+        # The performance log is shared by every tab, so it isn't drained
+        # here; TabPool drains it once no tab is lent out
+
+    def close(self):
+        """Close the window (the browser keeps running)"""
+        try:
+            with self.browser.lock:
+                self.driver.close()
+                self.browser.current_handle = None
+        except Exception:
+            pass
+        logger.info(f"Browser tab {self.slot} closed after {self.navigations} navigations")
+
+    def stats(self) -> dict:
+        """Summary for the health endpoint"""
+        return {
+            'slot': self.slot,
+            'tab': True,
+            'navigations': self.navigations,
+            'age_seconds': round((datetime.now() - self.created_at).total_seconds(), 1)
+        }
+
+
+class BrowserPool:
+    """Fixed-size pool of reusable BrowserSession objects"""
+
+    def __init__(self, size=1, headless=True, max_navigations=50, max_rss_mb=450,
+                 debug_port_base=9222, acquire_timeout=600, network_logging=False):
+        """
+        Initialize the pool (sessions are launched lazily or via warm())
+
+        Args:
+            size: Maximum number of concurrent Chrome instances
+            headless: Run Chrome headless
+            max_navigations: Recycle a session after this many page loads
+            max_rss_mb: Recycle a session once its process tree exceeds this RSS
+            debug_port_base: Slot N uses debugging port debug_port_base + N
+            acquire_timeout: Seconds to wait for a free session
+            network_logging: Launch Chrome with the network performance log
+                (needed by GROWW_PARSE_MODE=network)
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.network_logging = network_logging
+        self.max_navigations = max_navigations
+        self.max_rss_mb = max_rss_mb
+        self.debug_port_base = debug_port_base
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Lock()
+        self._available = threading.Semaphore(self.size)
+        self._idle = []
+        self._in_use = {}
+        self._free_slots = list(range(self.size))
+        self._closed = False
+
+        self.sessions_created = 0
+        self.sessions_recycled = 0
+
+    def _launch(self) -> BrowserSession:
+        """Start a new session in a free slot"""
+        with self._lock:
+            slot = self._free_slots.pop(0)
+        try:
+            session = BrowserSession(slot, self.debug_port_base + slot, self.headless, self.network_logging)
+        except Exception:
+            with self._lock:
+                self._free_slots.append(slot)
+            raise
+        self.sessions_created += 1
+        return session
+
+    def _retire(self, session, reason):
+        """Close a session and give its slot back"""
+        logger.info(f"Recycling browser session {session.slot}: {reason}")
+        session.close()
+        self.sessions_recycled += 1
+        with self._lock:
+            self._free_slots.append(session.slot)
+
+    def _recycle_reason(self, session):
+        """Return why a session should be recycled, or None to keep it"""
+        if session.navigations >= self.max_navigations:
+            return f"{session.navigations} navigations"
+        rss = session.rss_mb()
+        if self.max_rss_mb and rss > self.max_rss_mb:
+            return f"RSS {rss:.0f} MB over {self.max_rss_mb} MB"
+        return None
+
+    def warm(self, count=None):
+        """Pre-launch sessions so the first request skips Chrome startup"""
+        count = self.size if count is None else min(count, self.size)
+        for _ in range(count):
+            # Take a lease so warming never races a real borrower for a slot
+            if not self._available.acquire(blocking=False):
+                return
+            try:
+                with self._lock:
+                    if self._closed or len(self._idle) + len(self._in_use) >= count:
+                        return
+                session = self._launch()
+                with self._lock:
+                    self._idle.append(session)
+            except Exception as e:
+                logger.error(f"Error warming browser pool: {e}")
+                return
+            finally:
+                self._available.release()
+        logger.info(f"Browser pool warmed with {count} session(s)")
+
+    def acquire(self) -> BrowserSession:
+        """
+        Borrow a healthy session, launching or replacing one if needed
+
+        Raises:
+            TimeoutError: No session became free within acquire_timeout
+            RuntimeError: The pool has been shut down
+        """
+        if not self._available.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No browser session free after {self.acquire_timeout}s")
+
+        try:
+            if self._closed:
+                raise RuntimeError("Browser pool is shut down")
+
+            session = None
+            with self._lock:
+                if self._idle:
+                    session = self._idle.pop()
+
+            if session is not None and not session.is_healthy():
+                self._retire(session, "failed health check")
+                session = None
+
+            if session is None:
+                session = self._launch()
+
+            with self._lock:
+                self._in_use[session.slot] = session
+            return session
+
+        except Exception:
+            self._available.release()
+            raise
+
+    def release(self, session: BrowserSession, navigations=1):
+        """
+        Return a borrowed session to the pool
+
+        Args:
+            session: Session obtained from acquire()
+            navigations: Page loads performed during this lease
+        """
+        with self._lock:
+            self._in_use.pop(session.slot, None)
+        session.navigations += navigations
+
+        try:
+            reason = "pool shut down" if self._closed else self._recycle_reason(session)
+            if reason is None:
+                try:
+                    session.reset()
+                except Exception as e:
+                    reason = f"reset failed ({e})"
+
+            if reason is None:
+                with self._lock:
+                    self._idle.append(session)
+            else:
+                self._retire(session, reason)
+        finally:
+            self._available.release()
+
+    @contextmanager
+    def session(self):
+        """Context manager wrapping acquire()/release()"""
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def shutdown(self):
+        """Close all idle sessions; busy ones are closed when released"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for session in idle:
+            session.close()
+
+    def in_use_count(self) -> int:
+        """Number of sessions currently borrowed"""
+        with self._lock:
+            return len(self._in_use)
+
+    def stats(self) -> dict:
+        """Pool summary for the health endpoint"""
+        with self._lock:
+            idle = list(self._idle)
+            in_use = list(self._in_use.values())
+        return {
+            'size': self.size,
+            'idle': len(idle),
+            'in_use': len(in_use),
+            'sessions_created': self.sessions_created,
+            'sessions_recycled': self.sessions_recycled,
+            'max_navigations': self.max_navigations,
+            'max_rss_mb': self.max_rss_mb,
+            'network_logging': self.network_logging,
+            'sessions': [s.stats() for s in idle + in_use]
+        }
+
+
+class TabPool(BrowserPool):
+    """BrowserPool whose sessions are tabs of one shared Chrome"""
+
+    def __init__(self, size=2, headless=True, max_navigations=50, max_rss_mb=450,
+                 debug_port_base=9222, acquire_timeout=600, network_logging=False):
+        """
+        Initialize the pool (Chrome is launched lazily or via warm())
+
+        Args:
+            size: Maximum number of tabs open at once
+            headless: Run Chrome headless
+            max_navigations: Restart the browser after this many page loads
+                across all tabs
+            max_rss_mb: Restart the browser once its process tree exceeds this RSS
+            debug_port_base: Debugging port of the shared browser
+            acquire_timeout: Seconds to wait for a free tab
+            network_logging: Launch Chrome with the network performance log
+
+        Timeouts set through a tab (implicitly_wait, page load timeout) are
+        WebDriver session settings and apply to every tab.
+        """
+        super().__init__(size, headless, max_navigations, max_rss_mb, debug_port_base, acquire_timeout,
+                         network_logging)
+        self._browser = None
+        self._browser_lock = threading.Lock()
+        self.tabs_opened = 0
+
+    def _shared_browser(self) -> SharedBrowserSession:
+        """The running browser, launched or replaced if needed"""
+        with self._browser_lock:
+            if self._browser is not None and not self._browser.is_healthy():
+                logger.info("Shared browser failed health check, relaunching")
+                self._browser.close()
+                self._browser = None
+                self.sessions_recycled += 1
+            if self._browser is None:
+                self._browser = SharedBrowserSession(0, self.debug_port_base, self.headless, self.network_logging)
+                self.sessions_created += 1
+            return self._browser
+
+    def _launch(self) -> BrowserTab:
+        """Open a tab in a free slot"""
+        browser = self._shared_browser()
+        with self._lock:
+            slot = self._free_slots.pop(0)
+        try:
+            tab = BrowserTab(browser, slot)
+        except Exception:
+            with self._lock:
+                self._free_slots.append(slot)
+            raise
+        self.tabs_opened += 1
+        return tab
+
+    def _retire(self, session, reason):
+        """Close a tab; restart the browser once no tab is left if it needs it"""
+        logger.info(f"Closing browser tab {session.slot}: {reason}")
+        session.close()
+        with self._lock:
+            self._free_slots.append(session.slot)
+            tabs_open = len(self._idle) + len(self._in_use)
+
+        with self._browser_lock:
+            browser = self._browser
+            if tabs_open or browser is None:
+                return
+            browser_reason = "pool shut down" if self._closed else super()._recycle_reason(browser)
+            if browser_reason:
+                logger.info(f"Recycling shared browser: {browser_reason}")
+                browser.close()
+                self._browser = None
+                self.sessions_recycled += 1
+
+    def _recycle_reason(self, session):
+        """Tabs are closed when the browser they live in is due for a restart"""
+        if session.browser is not self._browser:
+            return "browser was relaunched"
+        return super()._recycle_reason(session.browser)
+
+    def release(self, session: BrowserTab, navigations=1):
+        """Return a borrowed tab; its page loads count toward the browser's limit"""
+        session.browser.navigations += navigations
+        super().release(session, navigations)
+
+        # Cookies and the performance log are shared by every tab, so clear
+        # them only while none is lent out
+        with self._lock:
+            if self._in_use or session.browser is not self._browser:
+                return
+            try:
+                session.browser.clear_shared_state()
+            except Exception as e:
+                logger.warning(f"Could not clear shared browser state: {e}")
+
+    def shutdown(self):
+        """Close idle tabs and, once no tab is busy, the browser"""
+        super().shutdown()
+        with self._lock:
+            busy = bool(self._in_use)
+        with self._browser_lock:
+            if not busy and self._browser is not None:
+                self._browser.close()
+                self._browser = None
+
+    def stats(self) -> dict:
+        """Pool summary for the health endpoint"""
+        stats = super().stats()
+        browser = self._browser
+        stats['mode'] = 'tabs'
+        stats['tabs_opened'] = self.tabs_opened
+        stats['browser'] = browser.stats() if browser is not None else None
+        return stats
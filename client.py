@@ -11,6 +11,7 @@ Usage:
 import requests
 import json
 import sys
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -120,6 +121,90 @@ class NewsAPIClient:
             print(f"❌ Error: {e}")
             return None
     
+    def submit_job(self, sources: str = "groww,pulse", refresh: bool = False) -> Optional[dict]:
+        """
+        Submit a background scrape job
+        
+        Args:
+            sources: Comma-separated sources ("groww", "pulse")
+            refresh: Bypass the server-side cache
+        
+        Returns:
+            dict: {"job_id", "status", "status_url", ...} or None if error
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/jobs",
+                params={'sources': sources, 'refresh': str(refresh).lower()},
+                timeout=30
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            print(f"❌ Error submitting job: {e}")
+            return None
+    
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """
+        Get a job's status, per-source progress and results
+        
+        Returns:
+            dict: Job details or None if error (including unknown/expired jobs)
+        """
+        try:
+            response = self.session.get(f"{self.base_url}/jobs/{job_id}", timeout=30)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            print(f"❌ Error fetching job: {e}")
+            return None
+    
+    def wait_for_job(self, job_id: str, poll_interval: float = 5, timeout: float = 600) -> Optional[dict]:
+        """
+        Poll a job until it finishes
+        
+        Args:
+            job_id: Id returned by submit_job()
+            poll_interval: Seconds between polls
+            timeout: Give up after this many seconds
+        
+        Returns:
+            dict: Final job details or None on error/timeout
+        """
+        deadline = time.time() + timeout
+        last_progress = None
+        
+        while time.time() < deadline:
+            job = self.get_job(job_id)
+            if job is None:
+                return None
+        
+            progress = {s: p.get('status') for s, p in job.get('progress', {}).items()}
+            if progress != last_progress:
+                print(f"   Job {job_id[:8]}: {job.get('status')} {progress}")
+                last_progress = progress
+        
+            if job.get('status') in ('completed', 'partial', 'failed'):
+                return job
+            time.sleep(poll_interval)
+        
+        print(f"❌ Job {job_id} did not finish within {timeout:.0f} seconds")
+        return None
+    
+    def run_job(self, sources: str = "groww,pulse", refresh: bool = False,
+                poll_interval: float = 5, timeout: float = 600) -> Optional[dict]:
+        """
+        Submit a job and wait for it, without holding a connection open
+        
+        Returns:
+            dict: Final job details (results under "results") or None if error
+        """
+        submitted = self.submit_job(sources, refresh=refresh)
+        if not submitted:
+            return None
+        print(f"⏳ Submitted job {submitted['job_id']} for {sources}")
+        return self.wait_for_job(submitted['job_id'], poll_interval=poll_interval, timeout=timeout)
+    
     def display_news(self, data: dict, source: str = "all"):
         """Display news in a readable format"""
         if not data:
@@ -14,17 +14,21 @@ Usage:
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.service import Service
 import json
-import time
 from datetime import datetime
 import logging
 import re
 import tempfile
 import shutil
 
+from browser_pool import find_free_port
+from groww_embedded import GrowwEmbeddedExtractor
+from groww_html_parser import GROWW_PAGE_URL
+from page_readiness import eager_options, scroll_until_stable, summarize, wait_for_dom_quiet, wait_until_ready
+from resource_blocking import apply_blocking, page_weight
+from scrape_tracing import traced
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -35,18 +39,36 @@ logger = logging.getLogger(__name__)
 class GrowwStockNewsScraper:
     """Scraper for Groww Stock News section"""
     
-    def __init__(self, headless=False):
-        """Initialize the scraper"""
-        self.url = "https://groww.in/share-market-today"
+    def __init__(self, headless=False, driver=None, url=None):
+        """
+        Initialize the scraper
+        
+        Args:
+            headless: Run Chrome headless when launching our own driver
+            driver: Optional WebDriver borrowed from a BrowserPool; it is
+                reused as-is and left running on cleanup()
+            url: Page to load instead of GROWW_URL (e.g. standin_server.py)
+        """
+        self.url = url or GROWW_PAGE_URL
         self.headless = headless
-        self.driver = None
+        self.driver = driver
         self.wait = None
         self._profile_dir = None
+        self._owns_driver = driver is None
+        self.readiness = []  # Reports from each readiness wait
+        self.blocking = None  # Resource blocking status for this driver
     
+    @traced('groww._init_driver')
     def _init_driver(self):
         """Initialize web driver"""
+        if not self._owns_driver:
+            self.wait = WebDriverWait(self.driver, 20)
+            self.blocking = apply_blocking(self.driver, 'groww')
+            logger.info("Using pooled WebDriver")
+            return True
+        
         try:
-            options = webdriver.ChromeOptions()
+            options = eager_options(webdriver.ChromeOptions())
             if self.headless:
                 options.add_argument('--headless=new')
                 options.add_argument('--disable-gpu')
@@ -55,7 +77,7 @@ class GrowwStockNewsScraper:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-setuid-sandbox')
-            options.add_argument('--remote-debugging-port=9222')
+            options.add_argument(f'--remote-debugging-port={find_free_port()}')
             options.add_argument('--no-zygote')
             options.add_argument('--disable-extensions')
             options.add_argument('--disable-background-networking')
@@ -78,6 +100,7 @@ class GrowwStockNewsScraper:
             service = Service()
             self.driver = webdriver.Chrome(service=service, options=options)
             self.wait = WebDriverWait(self.driver, 20)
+            self.blocking = apply_blocking(self.driver, 'groww')
             
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
@@ -88,51 +111,39 @@ class GrowwStockNewsScraper:
             logger.error(f"Error initializing WebDriver: {e}")
             return False
     
+    @traced('groww.navigate_to_page')
     def navigate_to_page(self):
         """Navigate to Groww share market page"""
         try:
             logger.info(f"Navigating to: {self.url}")
             self.driver.get(self.url)
             
-            # Wait for page to load
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            logger.info("Initial page load complete")
-            
-            # Wait for JavaScript to execute and content to load
-            time.sleep(5)
+            # Ready once news metadata is rendered and the DOM has settled
+            report = wait_until_ready(
+                self.driver,
+                selectors=['body'],
+                text_pattern=r'\d+\s*(?:minutes?|hours?|days?)\s*ago|CNBC|Business Standard',
+                label='groww news'
+            )
+            self.readiness.append(report)
+            if report['ready']:
+                logger.info("News content detected on page")
+            else:
+                logger.warning("News content not confirmed before deadline, but continuing...")
             
-            # Scroll down gradually to trigger lazy loading
+            # Scroll straight to "Stocks in news" and only as far as lazy
+            # loading still adds items or page height
             logger.info("Scrolling to load content...")
-            scroll_pause = 1
-            scroll_height = self.driver.execute_script("return document.body.scrollHeight")
-            current_position = 0
-            scroll_step = 500
-            
-            while current_position < scroll_height:
-                self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-                time.sleep(scroll_pause)
-                current_position += scroll_step
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height > scroll_height:
-                    scroll_height = new_height
-            
-            # Scroll back up a bit and wait for content to settle
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(3)
-            
-            # Try to wait for news-related elements
-            try:
-                # Wait for any element that might indicate news section
-                self.wait.until(
-                    EC.any_of(
-                        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'ago')]")),
-                        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'CNBC')]")),
-                        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Business Standard')]"))
-                    )
-                )
-                logger.info("News content detected on page")
-            except TimeoutException:
-                logger.warning("Timeout waiting for news content, but continuing...")
+            report = scroll_until_stable(
+                self.driver,
+                target_text='Stocks in news',
+                item_pattern=r'\d+\s*(?:minutes?|hours?|days?)\s*ago',
+                min_items=10,
+                label='stocks in news'
+            )
+            self.readiness.append(report)
+            if report['reason'] == 'error':
+                self._scroll_stepwise()
             
             logger.info("Page loaded and scrolled successfully")
             return True
@@ -141,6 +152,26 @@ class GrowwStockNewsScraper:
             logger.error(f"Error loading page: {e}")
             return False
     
+    def _scroll_stepwise(self, scroll_step=500):
+        """Fallback lazy-load pass: fixed steps down the whole page"""
+        scroll_height = self.driver.execute_script("return document.body.scrollHeight")
+        current_position = 0
+        
+        while current_position < scroll_height:
+            self.driver.execute_script(f"window.scrollTo(0, {current_position});")
+            report = wait_for_dom_quiet(self.driver, label=f'scroll {current_position}')
+            report['steps'] = 1
+            self.readiness.append(report)
+            current_position += scroll_step
+            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            if new_height > scroll_height:
+                scroll_height = new_height
+        
+        # Scroll back up a bit and wait for content to settle
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+        self.readiness.append(wait_for_dom_quiet(self.driver, label='settle'))
+    
+    @traced('groww.find_news_section')
     def find_news_section(self):
         """
         Find the 'Stocks in news' section container
@@ -277,6 +308,7 @@ class GrowwStockNewsScraper:
             logger.error(f"Error finding news section: {e}")
             return None
     
+    @traced('groww.scrape_news_items')
     def scrape_news_items(self, container=None):
         """
         Scrape all news items from the page
@@ -878,6 +910,35 @@ class GrowwStockNewsScraper:
             logger.debug(f"Error extracting news from container: {e}")
             return None
     
+    @traced('groww.scrape_embedded_news')
+    def scrape_embedded_news(self):
+        """
+        Read "Stocks in news" from the page's embedded __NEXT_DATA__ JSON
+        
+        Returns:
+            list: News item dictionaries, or [] if the blob has no news
+        """
+        try:
+            rows = GrowwEmbeddedExtractor(self.driver.page_source).extract().get('news', [])
+        except Exception as e:
+            logger.debug(f"Embedded news extraction failed: {e}")
+            return []
+        
+        news_items = [
+            {
+                'source': row['source'],
+                'time': row['time_ago'],
+                'headline': row['headline'],
+                'stock_name': row['related_stock'],
+                'stock_change': row['stock_change'],
+                'stock_change_pct': row['stock_change_pct']
+            }
+            for row in rows
+        ]
+        if news_items:
+            logger.info(f"Extracted {len(news_items)} news items from embedded page data")
+        return news_items
+    
     def debug_page_content(self):
         """Debug method to inspect what's actually on the page"""
         try:
@@ -926,6 +987,7 @@ class GrowwStockNewsScraper:
         except Exception as e:
             logger.error(f"Error in debug_page_content: {e}")
     
+    @traced('groww.scrape_all_news')
     def scrape_all_news(self):
         """
         Main method to scrape all stock news
@@ -937,11 +999,15 @@ class GrowwStockNewsScraper:
             # Debug page content if no items found initially
             logger.info("Starting news scraping...")
             
-            # Find news section container
-            container = self.find_news_section()
+            # Prefer the page's embedded JSON; fall back to DOM heuristics
+            news_items = self.scrape_embedded_news()
             
-            # Scrape news items
-            news_items = self.scrape_news_items(container)
+            if not news_items:
+                # Find news section container
+                container = self.find_news_section()
+                
+                # Scrape news items
+                news_items = self.scrape_news_items(container)
             
             # If no items found, run debug
             if len(news_items) == 0:
@@ -952,7 +1018,9 @@ class GrowwStockNewsScraper:
                 'scrape_timestamp': datetime.now().isoformat(),
                 'url': self.url,
                 'total_news_items': len(news_items),
-                'news_items': news_items
+                'news_items': news_items,
+                'readiness': summarize(self.readiness),
+                'network': {**(self.blocking or {}), 'page': page_weight(self.driver)}
             }
             
             return result
@@ -990,9 +1058,10 @@ class GrowwStockNewsScraper:
             logger.error(f"Error taking screenshot: {e}")
             return None
     
+    @traced('groww.cleanup')
     def cleanup(self):
-        """Close browser"""
-        if self.driver:
+        """Close browser (pooled drivers are left for the pool to reset)"""
+        if self.driver and self._owns_driver:
             try:
                 self.driver.quit()
                 logger.info("Browser closed")
@@ -0,0 +1,348 @@
+"""
+Groww Embedded Data Extractor
+=============================
+
+Groww's share-market-today page is a server-rendered Next.js app that ships
+its initial data as JSON in <script id="__NEXT_DATA__">. This module reads
+that blob and maps it straight into the scraper's response dicts:
+- indices
+- news (stocks in news)
+- top_gainers / top_losers / most_bought / most_traded
+
+Records carry the usual display strings plus typed numeric fields. Indices
+are filtered and ordered by INDEX_KEYWORDS (GROWW_INDICES), as in the DOM
+parser. Any
+section missing from the blob falls back to the DOM heuristics in
+groww_html_parser.GrowwPageParser.
+
+Usage:
+    data = parse_groww_page(html)
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import re
+
+from groww_html_parser import (GrowwPageParser, GROWW_URL, STOCK_SECTIONS, index_keywords, match_index_name,
+                               pick_index_rows)
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ['indices', 'news'] + list(STOCK_SECTIONS)
+
+# Sub-objects whose fields are merged into the parent record
+_NESTED_KEYS = ('company', 'stats', 'livePrice', 'priceData', 'liveData', 'header', 'stock')
+
+_NAME_KEYS = ('companyShortName', 'companyName', 'displayName', 'indexName', 'shortName', 'name', 'symbol', 'nseScriptCode')
+_PRICE_KEYS = ('ltp', 'lastPrice', 'currentPrice', 'close', 'value', 'price')
+_CHANGE_KEYS = ('dayChange', 'netChange', 'absoluteChange', 'change')
+_PCT_KEYS = ('dayChangePerc', 'dayChangePercent', 'changePerc', 'percentChange', 'changePercent', 'pChange')
+_HEADLINE_KEYS = ('title', 'headline', 'newsTitle')
+_SOURCE_KEYS = ('source', 'publisher', 'sourceName', 'newsSource')
+_TIME_KEYS = ('pubDate', 'publishedAt', 'publishedDate', 'publishTime', 'createdAt', 'time')
+
+_NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+_NUMBER_PATTERN = re.compile(r'[-+]?\d[\d,]*\.?\d*')
+
+
+def parse_number(value) -> Optional[float]:
+    """Parse "₹1,010.50", "-0.40%" or 1010.5 into a float"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER_PATTERN.search(str(value).replace('−', '-'))
+    if not match:
+        return None
+    try:
+        return float(match.group(0).replace(',', ''))
+    except ValueError:
+        return None
+
+
+def parse_change(text) -> tuple:
+    """
+    Split a change string like "+120.30 (0.50%)" or "-0.40%"
+
+    Returns:
+        tuple: (absolute_change, percent_change), either may be None
+    """
+    if not text:
+        return None, None
+    text = str(text).replace('−', '-')
+    pct_match = re.search(r'\(?\s*([-+]?\d[\d,]*\.?\d*)\s*%\s*\)?', text)
+    pct = parse_number(pct_match.group(1)) if pct_match else None
+    rest = text[:pct_match.start()] if pct_match else text
+    absolute = parse_number(rest) if _NUMBER_PATTERN.search(rest) else None
+    # A bare percentage carries the sign of the move
+    if pct is not None and absolute is not None and absolute < 0 < pct:
+        pct = -pct
+    return absolute, pct
+
+
+def add_numeric_fields(data: Dict) -> Dict:
+    """Add typed numeric fields to DOM-parsed records (in place)"""
+    for index in data.get('indices', []):
+        index.setdefault('value_num', parse_number(index.get('value')))
+        change, pct = parse_change(index.get('change'))
+        index.setdefault('change_num', change)
+        index.setdefault('change_pct', pct)
+
+    for key in STOCK_SECTIONS:
+        for stock in data.get(key, []):
+            stock.setdefault('price_num', parse_number(stock.get('price')))
+            change, pct = parse_change(stock.get('change'))
+            stock.setdefault('change_num', change)
+            stock.setdefault('change_pct', pct)
+
+    for item in data.get('news', []):
+        item.setdefault('stock_change_pct', parse_number(item.get('stock_change')))
+
+    return data
+
+
+def _first(record: Dict, keys) -> Any:
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _flatten(record: Dict) -> Dict:
+    """Merge known nested sub-objects into one flat dict"""
+    flat = {}
+    for key, value in record.items():
+        if key in _NESTED_KEYS and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat.setdefault(sub_key, sub_value)
+        else:
+            flat.setdefault(key, value)
+    return flat
+
+
+def _format_signed(change, pct) -> str:
+    """Render "+120.30 (0.50%)" like the page does"""
+    if change is None and pct is None:
+        return ""
+    if change is None:
+        return f"{pct:+.2f}%"
+    if pct is None:
+        return f"{change:+,.2f}"
+    return f"{change:+,.2f} ({abs(pct):.2f}%)"
+
+
+def _time_ago(value, now=None) -> str:
+    """Convert an epoch (s/ms) or ISO timestamp into "N hours ago" text"""
+    if value in (None, ''):
+        return ""
+    try:
+        if isinstance(value, (int, float)) or str(value).isdigit():
+            seconds = float(value)
+            if seconds > 1e12:
+                seconds /= 1000.0
+            published = datetime.fromtimestamp(seconds, tz=timezone.utc)
+        else:
+            published = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return str(value)
+
+    delta = (now or datetime.now(timezone.utc)) - published
+    minutes = int(delta.total_seconds() // 60)
+    if minutes < 60:
+        return f"{max(minutes, 0)} minute{'s' if minutes != 1 else ''} ago"
+    hours = minutes // 60
+    if hours < 24:
+        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+    days = hours // 24
+    return f"{days} day{'s' if days != 1 else ''} ago"
+
+
+def _section_for_key(key: str) -> Optional[str]:
+    """Map a JSON key such as "TOP_GAINERS" or "stocksInNews" to a section"""
+    norm = re.sub(r'[^a-z]', '', key.lower())
+    if 'gainer' in norm:
+        return 'top_gainers'
+    if 'loser' in norm:
+        return 'top_losers'
+    if 'bought' in norm:
+        return 'most_bought'
+    if 'traded' in norm or 'mostactive' in norm:
+        return 'most_traded'
+    if 'news' in norm:
+        return 'news'
+    if 'indices' in norm or 'index' in norm:
+        return 'indices'
+    return None
+
+
+class GrowwEmbeddedExtractor:
+    """Maps Groww's __NEXT_DATA__ blob into response sections"""
+
+    def __init__(self, html: str = None, blob: Dict = None, keywords: Optional[List[str]] = None):
+        """
+        Load the embedded data
+
+        Args:
+            html: Page source containing <script id="__NEXT_DATA__">
+            blob: Already-decoded JSON (skips HTML parsing)
+            keywords: Index names to extract, in order (default INDEX_KEYWORDS)
+        """
+        self.blob = blob if blob is not None else self.find_blob(html or '')
+        self.keywords = index_keywords(keywords)
+
+    @staticmethod
+    def find_blob(html: str) -> Optional[Dict]:
+        """Decode the __NEXT_DATA__ script, or None if absent/invalid"""
+        match = _NEXT_DATA_PATTERN.search(html)
+        if not match:
+            return None
+        try:
+            return json.loads(match.group(1))
+        except ValueError as e:
+            logger.warning(f"Invalid __NEXT_DATA__ JSON: {e}")
+            return None
+
+    def _record_lists(self):
+        """Yield (section, list_of_dicts) for every list under a known key"""
+        stack = [(self.blob, None)]
+        while stack:
+            node, section = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    stack.append((value, _section_for_key(str(key)) or section))
+            elif isinstance(node, list):
+                records = [item for item in node if isinstance(item, dict)]
+                if section and records and len(records) == len(node):
+                    yield section, records
+                for item in node:
+                    if isinstance(item, (dict, list)):
+                        stack.append((item, section))
+
+    def _index(self, record: Dict) -> Optional[Dict]:
+        flat = _flatten(record)
+        # Same names the DOM cards show, e.g. "NIFTY" from symbol when
+        # displayName is "NIFTY 50"
+        name = match_index_name((flat.get(key) for key in _NAME_KEYS), self.keywords)
+        value = parse_number(_first(flat, _PRICE_KEYS))
+        if name is None or value is None:
+            return None
+        change = parse_number(_first(flat, _CHANGE_KEYS))
+        pct = parse_number(_first(flat, _PCT_KEYS))
+        return {
+            "name": name,
+            "value": f"{value:,.2f}",
+            "change": _format_signed(change, pct),
+            "value_num": value,
+            "change_num": change,
+            "change_pct": pct
+        }
+
+    def _stock(self, record: Dict) -> Optional[Dict]:
+        flat = _flatten(record)
+        name = _first(flat, _NAME_KEYS)
+        price = parse_number(_first(flat, _PRICE_KEYS))
+        if not isinstance(name, str) or price is None:
+            return None
+        change = parse_number(_first(flat, _CHANGE_KEYS))
+        pct = parse_number(_first(flat, _PCT_KEYS))
+        return {
+            "name": name,
+            "price": f"₹{price:,.2f}",
+            "change": _format_signed(change, pct),
+            "price_num": price,
+            "change_num": change,
+            "change_pct": pct
+        }
+
+    def _news(self, record: Dict) -> Optional[Dict]:
+        headline = _first(record, _HEADLINE_KEYS)
+        if not isinstance(headline, str) or len(headline.strip()) < 15:
+            return None
+        source = _first(record, _SOURCE_KEYS)
+        if isinstance(source, dict):
+            source = _first(source, ('name', 'title'))
+
+        # Related stock is inline / in company+stats, or the first of a list
+        stock = _flatten(record)
+        for key in ('stocks', 'companies', 'relatedStocks'):
+            candidate = record.get(key)
+            if isinstance(candidate, list) and candidate and isinstance(candidate[0], dict):
+                stock = _flatten(candidate[0])
+                break
+        stock_name = _first(stock, ('companyShortName', 'companyName', 'displayName', 'symbol', 'nseScriptCode'))
+        pct = parse_number(_first(stock, _PCT_KEYS))
+
+        return {
+            "source": str(source or ""),
+            "time_ago": _time_ago(_first(record, _TIME_KEYS)),
+            "headline": headline.strip(),
+            "related_stock": str(stock_name or ""),
+            "stock_change": f"{pct:.2f}%" if pct is not None else "",
+            "stock_change_pct": pct
+        }
+
+    def extract(self) -> Dict[str, List[Dict]]:
+        """
+        Map the blob into sections
+
+        Returns:
+            dict: section -> records, only for sections found in the blob
+        """
+        if not self.blob:
+            return {}
+
+        builders = {'indices': self._index, 'news': self._news}
+        sections = {}
+        for section, records in self._record_lists():
+            build = builders.get(section, self._stock)
+            rows = [row for row in (build(r) for r in records) if row]
+            if section == 'indices':
+                rows = pick_index_rows(rows, self.keywords)
+            # Several lists can sit under one key (e.g. tabs); keep the fullest
+            if len(rows) > len(sections.get(section, [])):
+                sections[section] = rows
+        return sections
+
+
+def parse_groww_page(html: str, url: str = GROWW_URL) -> Dict:
+    """
+    Extract every section from a Groww page, preferring embedded JSON
+
+    Args:
+        html: Page source
+        url: Page URL (reported in metadata)
+
+    Returns:
+        dict: Same structure as GrowwScraperFixed.data, with
+        metadata.extraction recording "embedded" or "dom" per section
+    """
+    embedded = GrowwEmbeddedExtractor(html).extract()
+    missing = [s for s in SECTIONS if s not in embedded]
+
+    data = {
+        "metadata": {
+            "url": url,
+            "scraped_at": datetime.now().isoformat(),
+            "version": "embedded-1.0" if not missing else "snapshot-1.0",
+            "extraction": {s: ('embedded' if s in embedded else 'dom') for s in SECTIONS}
+        }
+    }
+    dom = {}
+    if missing:
+        logger.info(f"Embedded data missing {missing}, using DOM heuristics")
+        dom = GrowwPageParser(html, url).parse_all()
+
+    for section in SECTIONS:
+        data[section] = embedded[section] if section in embedded else dom.get(section, [])
+
+    if missing:
+        add_numeric_fields(data)
+
+    return data
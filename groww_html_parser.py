@@ -0,0 +1,364 @@
+"""
+Groww Snapshot Parser
+=====================
+
+Offline parsing engine for https://groww.in/share-market-today. Takes one
+HTML snapshot (driver.page_source or a saved .html file) and extracts:
+- Market indices
+- Stocks in news
+- Top gainers / top losers
+- Most bought / most traded
+
+Everything runs in-process on html_dom, so the browser can be released as
+soon as the snapshot is taken, and saved pages can be parsed with no browser.
+
+Usage:
+    python groww_html_parser.py saved_page.html
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+import os
+import re
+import sys
+
+from html_dom import parse_html
+
+GROWW_URL = "https://groww.in/share-market-today"
+# Page the scrapers load (GROWW_URL env points them at standin_server.py)
+GROWW_PAGE_URL = os.getenv("GROWW_URL") or GROWW_URL
+
+DEFAULT_INDEX_KEYWORDS = ['NIFTY', 'BANKNIFTY', 'SENSEX', 'FINNIFTY', 'MIDCPNIFTY', 'BANKEX']
+
+# Index tickers to extract, e.g. GROWW_INDICES="NIFTY,NIFTY IT,NIFTY NEXT 50,INDIA VIX"
+INDEX_KEYWORDS = [
+    ' '.join(k.split()).upper()
+    for k in os.getenv("GROWW_INDICES", ",".join(DEFAULT_INDEX_KEYWORDS)).split(',') if k.strip()
+]
+
+STOCK_SECTIONS = {
+    'top_gainers': 'Top Gainers',
+    'top_losers': 'Top Losers',
+    'most_bought': 'Most Bought',
+    'most_traded': 'Most Traded',
+}
+
+_PCT_PATTERN = re.compile(r'([-+]?\d+\.?\d*%)')
+
+
+def parse_index_card(text: str, keywords) -> Optional[Dict]:
+    """
+    Parse an index ticker card ("NIFTY\\n24,000.50\\n+120.30 (0.50%)")
+
+    Args:
+        text: Visible text of a candidate element
+        keywords: Index names (uppercase) to accept as the first line
+
+    Returns:
+        dict or None: {"name", "value", "change"}
+    """
+    if not text or len(text) >= 200:
+        return None
+    lines = text.strip().split('\n')
+    name = ' '.join(lines[0].split()).upper()
+    if len(lines) < 2 or name not in keywords:
+        return None
+    return {
+        "name": name,
+        "value": lines[1] if len(lines) > 1 else "",
+        "change": lines[2] if len(lines) > 2 else ""
+    }
+
+
+def index_keywords(keywords=None) -> List[str]:
+    """Normalized index names to extract, in output order (default INDEX_KEYWORDS)"""
+    return [' '.join(k.split()).upper() for k in (keywords or INDEX_KEYWORDS)]
+
+
+def match_index_name(names, keywords) -> Optional[str]:
+    """First of names that is a configured index (keywords as from index_keywords())"""
+    for name in names:
+        if isinstance(name, str):
+            name = ' '.join(name.split()).upper()
+            if name in keywords:
+                return name
+    return None
+
+
+def pick_index_rows(rows: List[Dict], keywords=None) -> List[Dict]:
+    """First row per configured index name, in keyword order"""
+    found = {}
+    for row in rows:
+        found.setdefault(row['name'], row)
+    return [found[k] for k in index_keywords(keywords) if k in found]
+
+
+def pick_index_cards(texts, keywords=None) -> List[Dict]:
+    """
+    First card per index name from candidate texts, in one pass
+
+    Args:
+        texts: Visible text of candidate elements in document order
+        keywords: Index names to extract (default INDEX_KEYWORDS)
+
+    Returns:
+        list: Index cards in keyword order
+    """
+    keywords = index_keywords(keywords)
+    remaining = set(keywords)
+    found = {}
+
+    for text in texts:
+        if not remaining:
+            break
+        card = parse_index_card(text, remaining)
+        if card:
+            found[card['name']] = card
+            remaining.discard(card['name'])
+
+    return [found[k] for k in keywords if k in found]
+
+
+def parse_news_card(text: str) -> Optional[Dict]:
+    """
+    Parse a "Stocks in news" card ("Source · 2 hours ago\\nHeadline\\nStock 1.2%")
+
+    Args:
+        text: Visible text of a candidate element
+
+    Returns:
+        dict or None: {"source", "time_ago", "headline", "related_stock", "stock_change"}
+    """
+    if not text or len(text) < 30 or len(text) > 500:
+        return None
+
+    # Check if it looks like a news item (has source, time pattern)
+    if '·' not in text or ('hour' not in text.lower() and 'ago' not in text.lower()):
+        return None
+
+    lines = text.split('\n')
+
+    # Find the line with source and time
+    source_line_idx = -1
+    for i, line in enumerate(lines):
+        if '·' in line and ('ago' in line or 'hour' in line):
+            source_line_idx = i
+            break
+
+    if source_line_idx == -1:
+        return None
+
+    parts = lines[source_line_idx].split('·')
+    source = parts[0].strip()
+    time_ago = parts[1].strip() if len(parts) > 1 else ""
+
+    # Headline is usually next line
+    headline = ""
+    if source_line_idx + 1 < len(lines):
+        headline = lines[source_line_idx + 1].strip()
+
+    if not headline or len(headline) < 15:
+        return None
+
+    # Stock info (has %)
+    stock_name = ""
+    stock_change = ""
+    for line in lines:
+        if '%' in line and any(c.isdigit() for c in line):
+            pct_match = _PCT_PATTERN.search(line)
+            if pct_match:
+                stock_change = pct_match.group(1)
+                stock_name = line.strip().replace(stock_change, '').strip()
+            break
+
+    return {
+        "source": source,
+        "time_ago": time_ago,
+        "headline": headline,
+        "related_stock": stock_name,
+        "stock_change": stock_change
+    }
+
+
+def parse_stock_card(text: str) -> Optional[Dict]:
+    """
+    Parse a stock link card ("Reliance\\n₹2,950.10\\n+1.25%")
+
+    Args:
+        text: Visible text of an <a> element
+
+    Returns:
+        dict or None: {"name", "price", "change"}
+    """
+    if not text or ('₹' not in text and '%' not in text) or '\n' not in text:
+        return None
+
+    lines = [l.strip() for l in text.split('\n') if l.strip()]
+    if len(lines) < 2:
+        return None
+
+    name = lines[0]
+    # Skip if name is too long (probably not a stock card)
+    if len(name) > 50:
+        return None
+
+    price = ""
+    change = ""
+    for line in lines[1:]:
+        if '₹' in line and not price:
+            price = line
+        elif '%' in line or (any(c in line for c in ['-', '+']) and any(c.isdigit() for c in line)):
+            change = line
+
+    if not (price or change):
+        return None
+    return {"name": name, "price": price, "change": change}
+
+
+def section_for_heading(text: str) -> Optional[str]:
+    """Return the stock section key if text is a section heading"""
+    text = re.sub(r'\s+', ' ', text or '').strip().lower()
+    if not text or len(text) > 60:
+        return None
+    for key, title in STOCK_SECTIONS.items():
+        if text == title.lower() or text.startswith(title.lower() + ' '):
+            return key
+    return None
+
+
+def group_stock_links(events, limit: int = 10) -> Dict[str, List[Dict]]:
+    """
+    Attribute stock links to sections in document order
+
+    Each stock link belongs to the nearest preceding section heading. If
+    no headings are present the page is treated the way the live scraper
+    always did: the first stock links fill every section.
+
+    Args:
+        events: ("heading", section_key) and ("link", text) pairs in
+            document order
+        limit: Maximum rows per section
+
+    Returns:
+        dict: section key -> stock dicts
+    """
+    sections = {key: [] for key in STOCK_SECTIONS}
+    seen = {key: set() for key in STOCK_SECTIONS}
+    unsectioned = []
+    unsectioned_seen = set()
+    current = None
+
+    for kind, value in events:
+        if kind == 'heading':
+            current = value
+            continue
+
+        stock = parse_stock_card(value)
+        if not stock:
+            continue
+
+        if current is None:
+            if stock['name'] not in unsectioned_seen and len(unsectioned) < limit:
+                unsectioned_seen.add(stock['name'])
+                unsectioned.append(stock)
+            continue
+
+        if stock['name'] not in seen[current] and len(sections[current]) < limit:
+            seen[current].add(stock['name'])
+            sections[current].append(stock)
+
+    if not any(sections.values()):
+        return {key: list(unsectioned) for key in STOCK_SECTIONS}
+    return sections
+
+
+class GrowwPageParser:
+    """Extracts all Groww sections from a single HTML snapshot"""
+
+    def __init__(self, html: str, url: str = GROWW_URL):
+        """
+        Parse the snapshot
+
+        Args:
+            html: Page source
+            url: URL the snapshot was taken from (reported in metadata)
+        """
+        self.url = url
+        self.root = parse_html(html)
+
+    @classmethod
+    def from_file(cls, path: str, url: str = GROWW_URL) -> 'GrowwPageParser':
+        """Build a parser from a saved .html file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), url)
+
+    def parse_indices(self, keywords=None) -> List[Dict]:
+        """First card per index keyword, in keyword order"""
+        return pick_index_cards((div.text for div in self.root.iter('div')), keywords)
+
+    def parse_news(self, limit: int = 15) -> List[Dict]:
+        """Stocks-in-news cards in document order, deduplicated by headline"""
+        news_items = []
+        seen_headlines = set()
+
+        for div in self.root.iter('div'):
+            item = parse_news_card(div.text)
+            if not item or item['headline'] in seen_headlines:
+                continue
+            seen_headlines.add(item['headline'])
+            news_items.append(item)
+            if len(news_items) >= limit:
+                break
+
+        return news_items
+
+    def _stock_events(self):
+        """Section headings and stock links in document order"""
+        for node in self.root.iter():
+            if node.tag in ('a', 'nav', 'button'):
+                if node.tag == 'a':
+                    yield 'link', node.text
+                continue
+            key = section_for_heading(node.own_text)
+            if key:
+                yield 'heading', key
+
+    def parse_stock_sections(self, limit: int = 10) -> Dict[str, List[Dict]]:
+        """Collect all four stock tables in one document-order traversal"""
+        return group_stock_links(self._stock_events(), limit)
+
+    def parse_stock_section(self, section_title: str, limit: int = 10) -> List[Dict]:
+        """Rows for a single section by title (e.g. "Top Gainers")"""
+        for key, title in STOCK_SECTIONS.items():
+            if title.lower() == section_title.lower():
+                return self.parse_stock_sections(limit)[key]
+        return []
+
+    def parse_all(self) -> Dict:
+        """Same structure as GrowwScraperFixed.data"""
+        data = {
+            "metadata": {
+                "url": self.url,
+                "scraped_at": datetime.now().isoformat(),
+                "version": "snapshot-1.0"
+            },
+            "indices": self.parse_indices(),
+            "news": self.parse_news(),
+        }
+        data.update(self.parse_stock_sections())
+        return data
+
+
+def main():
+    """Parse a saved Groww page and print the extracted JSON"""
+    if len(sys.argv) < 2:
+        print("Usage: python groww_html_parser.py saved_page.html")
+        sys.exit(1)
+
+    data = GrowwPageParser.from_file(sys.argv[1]).parse_all()
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
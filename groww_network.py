@@ -0,0 +1,224 @@
+"""
+Groww Network Capture
+=====================
+
+Groww fills its market tables and news cards from background API calls.
+Instead of reverse-engineering rendered text, this module records the
+browser's network responses through ChromeDriver's performance log,
+fetches each JSON body over DevTools and maps the payloads into the
+scraper's sections with the same record mapping as the embedded
+__NEXT_DATA__ extractor:
+- indices
+- news (stocks in news)
+- top_gainers / top_losers / most_bought / most_traded
+
+A payload only feeds the section whose endpoint it came from (see
+SECTION_ENDPOINTS); responses from other endpoints are ignored. Payloads
+give exact numbers and complete lists (no 10-item caps). Any section no
+allowlisted response covered falls back to parse_groww_page() on the
+page source.
+
+The driver must be launched with enable_network_logging(options).
+
+Usage:
+    capture = NetworkCapture(driver)
+    driver.get(GROWW_URL)
+    data = parse_groww_network(capture.collect(), driver.page_source)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+import base64
+import json
+import logging
+import re
+
+from groww_embedded import GrowwEmbeddedExtractor, SECTIONS, parse_groww_page
+from groww_html_parser import GROWW_PAGE_URL, GROWW_URL
+
+logger = logging.getLogger(__name__)
+
+# Responses worth decoding: Groww's own hosts (plus a GROWW_URL stand-in),
+# XHR/fetch or JSON bodies
+API_URL_PATTERN = re.compile(
+    r'^https?://(([\w-]+\.)*groww\.in|' + re.escape(urlsplit(GROWW_PAGE_URL).netloc) + ')/', re.IGNORECASE
+)
+_JSON_TYPES = ('application/json', 'text/json', '+json')
+
+
+def _endpoint(*patterns: str):
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
+
+# Endpoints each section is read from, matched against "path?query". Keep
+# in step with Groww's API; the last pattern of each matches stand-in
+# payloads (standin/groww/api/<section>.json, see standin_server.py)
+SECTION_ENDPOINTS = {
+    'indices': _endpoint(r'/stocks_data/v\d+/accord_points/.*/latest_indices_ohlc',
+                         r'/stocks_data/v\d+/global_instruments', r'/api/indices$'),
+    'news': _endpoint(r'/groww_news/v\d+/stocks_news/', r'/api/news$'),
+    'top_gainers': _endpoint(r'[?&]discovery_?filter_?types=TOP_GAINERS\b', r'/api/top_gainers$'),
+    'top_losers': _endpoint(r'[?&]discovery_?filter_?types=TOP_LOSERS\b', r'/api/top_losers$'),
+    'most_bought': _endpoint(r'[?&]discovery_?filter_?types=POPULAR_STOCKS_MOST_BOUGHT\b', r'/api/most_bought$'),
+    'most_traded': _endpoint(r'[?&]discovery_?filter_?types=MOST_VALUABLE\b', r'/api/most_traded$'),
+}
+
+
+def enable_network_logging(options):
+    """Turn on ChromeDriver's network performance log (returns the options)"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+    return options
+
+
+class NetworkCapture:
+    """Collects JSON response bodies from a driver's performance log"""
+
+    def __init__(self, driver, url_pattern=API_URL_PATTERN):
+        """
+        Start capturing (discards log entries from earlier pages)
+
+        Args:
+            driver: Chrome WebDriver launched with enable_network_logging()
+            url_pattern: Compiled regex a response URL must match
+        """
+        self.driver = driver
+        self.url_pattern = url_pattern
+        self._pending: Dict[str, str] = {}  # requestId -> url, body not loaded yet
+        self._finished = set()
+        self._seen = set()
+        self.drain()
+
+    def drain(self):
+        """Drop buffered log entries"""
+        try:
+            self.driver.get_log('performance')
+        except Exception as e:
+            logger.warning(f"Performance log unavailable: {e}")
+
+    def _is_json(self, params: Dict) -> bool:
+        response = params.get('response', {})
+        mime = (response.get('mimeType') or '').lower()
+        return params.get('type') in ('XHR', 'Fetch') or any(t in mime for t in _JSON_TYPES)
+
+    def collect(self) -> List[Tuple[str, Any]]:
+        """
+        Decode every JSON response finished since the last call
+
+        Returns:
+            list: (url, payload) pairs in arrival order
+        """
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.warning(f"Could not read performance log: {e}")
+            return []
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if self.url_pattern.match(url) and self._is_json(params):
+                    self._pending[params['requestId']] = url
+            elif method == 'Network.loadingFinished':
+                self._finished.add(params.get('requestId'))
+
+        responses = []
+        for request_id in [r for r in self._pending if r in self._finished]:
+            url = self._pending.pop(request_id)
+            if request_id in self._seen:
+                continue
+            self._seen.add(request_id)
+            try:
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                text = body.get('body', '')
+                if body.get('base64Encoded'):
+                    text = base64.b64decode(text).decode('utf-8', 'replace')
+                responses.append((url, json.loads(text)))
+            except Exception as e:
+                # Evicted bodies, non-JSON "XHR" responses, redirects
+                logger.debug(f"Skipping response {url}: {e}")
+
+        logger.info(f"Captured {len(responses)} JSON responses ({len(self._pending)} still loading)")
+        return responses
+
+
+def section_for_url(url: str, endpoints: Dict[str, Pattern] = SECTION_ENDPOINTS) -> Optional[str]:
+    """Section an API URL is allowlisted for, or None"""
+    parts = urlsplit(url)
+    target = parts.path + ('?' + parts.query if parts.query else '')
+    for section, pattern in endpoints.items():
+        if pattern.search(target):
+            return section
+    return None
+
+
+def extract_network_sections(responses: List[Tuple[str, Any]],
+                             endpoints: Dict[str, Pattern] = SECTION_ENDPOINTS) -> Dict[str, List[Dict]]:
+    """
+    Map captured payloads into sections
+
+    Each payload is read only for the section its endpoint is allowlisted
+    for, so a bare list from ".../market_trends?discovery_filter_types=TOP_GAINERS"
+    becomes top_gainers. The first usable response per section wins.
+
+    Args:
+        responses: (url, payload) pairs from NetworkCapture.collect()
+        endpoints: section -> compiled pattern over "path?query"
+
+    Returns:
+        dict: section -> records, only for sections some response covered
+    """
+    sections = {}
+    ignored = 0
+    for url, payload in responses:
+        section = section_for_url(url, endpoints)
+        if section is None:
+            ignored += 1
+            continue
+        if section in sections:
+            continue
+        rows = GrowwEmbeddedExtractor(blob={section: payload}).extract().get(section)
+        if rows:
+            sections[section] = rows
+        else:
+            logger.warning(f"No {section} records in response from {url}")
+    if ignored:
+        logger.debug(f"Ignored {ignored} responses from endpoints not in SECTION_ENDPOINTS")
+    return sections
+
+
+def parse_groww_network(responses: List[Tuple[str, Any]], html: str = '', url: str = GROWW_URL) -> Dict:
+    """
+    Build scraper output from captured responses, falling back to the page
+
+    Args:
+        responses: (url, payload) pairs from NetworkCapture.collect()
+        html: Page source for sections no response covered
+        url: Page URL (reported in metadata)
+
+    Returns:
+        dict: Same structure as parse_groww_page(), with
+        metadata.extraction recording "network" for captured sections
+    """
+    network = extract_network_sections(responses)
+    missing = [s for s in SECTIONS if s not in network]
+
+    if missing:
+        logger.info(f"No allowlisted endpoint returned {missing}, falling back to the page source")
+        data = parse_groww_page(html, url)
+    else:
+        data = {"metadata": {"url": url, "scraped_at": datetime.now().isoformat(), "extraction": {}}}
+
+    data['metadata']['version'] = "network-1.0"
+    data['metadata']['network_responses'] = len(responses)
+    for section in SECTIONS:
+        if section in network:
+            data[section] = network[section]
+            data['metadata']['extraction'][section] = 'network'
+    return data
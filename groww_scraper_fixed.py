@@ -4,30 +4,92 @@ Tested and working version
 """
 
 import json
-import re
-import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 
+from groww_html_parser import (GROWW_PAGE_URL, STOCK_SECTIONS, group_stock_links, index_keywords, parse_news_card,
+                               pick_index_cards, section_for_heading)
+from groww_embedded import GrowwEmbeddedExtractor, SECTIONS, add_numeric_fields, parse_groww_page
+from groww_network import NetworkCapture, enable_network_logging, extract_network_sections, parse_groww_network
+from page_readiness import eager_options, summarize, wait_for_dom_quiet, wait_until_ready
+from resource_blocking import apply_blocking, page_weight
+from scrape_tracing import traced
+
+
+# Visible text of the divs whose first line names a wanted index, in
+# document order; textContent prefilters before the costlier innerText
+INDEX_CARDS_JS = r"""
+const names = arguments[0];
+const wanted = new Set(names);
+const texts = [];
+for (const div of document.getElementsByTagName('div')) {
+    const raw = div.textContent || '';
+    if (raw.length >= 200 || !names.some(n => raw.toUpperCase().includes(n))) continue;
+    const text = (div.innerText || '').trim();
+    const first = text.split('\n')[0].replace(/\s+/g, ' ').trim().toUpperCase();
+    if (text.length < 200 && text.includes('\n') && wanted.has(first)) texts.push(text);
+}
+return texts;
+"""
+
+# Section headings and stock-card links in document order, in one pass over
+# the rendered DOM (same attribution rules as GrowwPageParser)
+STOCK_SECTIONS_JS = r"""
+const titles = arguments[0].map(t => t.toLowerCase());
+const isHeading = text => {
+    const t = text.replace(/\s+/g, ' ').trim().toLowerCase();
+    return t && t.length <= 60 && titles.some(x => t === x || t.startsWith(x + ' '));
+};
+const events = [];
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
+for (let el = walker.currentNode; el; el = walker.nextNode()) {
+    const tag = el.tagName;
+    if (tag === 'A') {
+        const text = el.innerText || '';
+        if (text.includes('\n') && (text.includes('₹') || text.includes('%'))) events.push(['link', text]);
+        continue;
+    }
+    if (tag === 'NAV' || tag === 'BUTTON' || tag === 'SCRIPT' || tag === 'STYLE') continue;
+    let own = '';
+    for (const child of el.childNodes) if (child.nodeType === Node.TEXT_NODE) own += child.nodeValue;
+    if (isHeading(own)) events.push(['heading', own]);
+}
+return events;
+"""
+
 
 class GrowwScraperFixed:
     """Fixed version that actually works with Groww's structure"""
     
-    def __init__(self, headless: bool = False):
-        self.url = "https://groww.in/share-market-today"
-        self.driver = None
+    def __init__(self, headless: bool = False, driver=None, parse_mode: str = "snapshot", url: Optional[str] = None):
+        self.url = url or GROWW_PAGE_URL  # Override to load a stand-in page
+        self.driver = driver  # Optional WebDriver borrowed from a BrowserPool
         self.headless = headless
         self.data = {}
+        self._owns_driver = driver is None
+        # "snapshot": grab page_source once and parse offline (GrowwPageParser)
+        # "live": query the rendered DOM element by element through WebDriver
+        # "network": decode the page's own API responses (performance log)
+        self.parse_mode = parse_mode
+        self.page_source = None
+        self.readiness = []  # Reports from each readiness wait
+        self.blocking = None  # Resource blocking status and page weight
     
+    @traced('groww_fixed.setup_driver')
     def setup_driver(self):
         """Setup Chrome driver"""
-        chrome_options = Options()
+        if not self._owns_driver:
+            self.driver.implicitly_wait(3)
+            self.blocking = apply_blocking(self.driver, 'groww')
+            print("✓ Using pooled driver")
+            return
+        
+        chrome_options = eager_options(Options())
+        if self.parse_mode == "network":
+            enable_network_logging(chrome_options)
         
         if self.headless:
             chrome_options.add_argument('--headless=new')
@@ -40,6 +102,7 @@ class GrowwScraperFixed:
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.driver.implicitly_wait(3)
+        self.blocking = apply_blocking(self.driver, 'groww')
         
         print("✓ Driver initialized")
     
@@ -47,54 +110,53 @@ class GrowwScraperFixed:
         """Load page and wait"""
         print(f"Loading: {self.url}")
         self.driver.get(self.url)
-        
-        # Wait longer for the dynamic content
-        time.sleep(5)
+        self.load_lazy_content()
+    
+    @traced('groww_fixed.load_lazy_content')
+    def load_lazy_content(self):
+        """Wait and scroll so client-rendered sections appear in the DOM"""
+        # Wait for the dynamic content: news metadata rendered and DOM settled
+        self.readiness.append(wait_until_ready(
+            self.driver,
+            selectors=['a[href]'],
+            text_pattern=r'\d+\s*(?:minutes?|hours?|days?)\s*ago',
+            label='groww content'
+        ))
         
         # Scroll to load lazy content
         for i in range(3):
             self.driver.execute_script(f"window.scrollTo(0, {(i+1) * 500});")
-            time.sleep(1)
+            self.readiness.append(wait_for_dom_quiet(self.driver, label=f'scroll {(i+1) * 500}'))
         
         # Scroll back to top
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        self.readiness.append(wait_for_dom_quiet(self.driver, label='scroll top'))
         
         print("✓ Page loaded and scrolled")
     
-    def scrape_indices(self) -> List[Dict]:
-        """Scrape indices - this one works, keep it"""
+    @traced('groww_fixed.scrape_indices')
+    def scrape_indices(self, keywords: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Index ticker cards from one in-page pass over the divs
+        
+        Args:
+            keywords: Index names to extract (default INDEX_KEYWORDS,
+                configurable with GROWW_INDICES)
+        """
         print("\n🔍 Scraping indices...")
         indices = []
         
         try:
-            # Find divs that contain index names
-            all_divs = self.driver.find_elements(By.TAG_NAME, "div")
-            
-            index_keywords = ['NIFTY', 'BANKNIFTY', 'SENSEX', 'FINNIFTY', 'MIDCPNIFTY', 'BANKEX']
-            
-            for keyword in index_keywords:
-                for div in all_divs:
-                    try:
-                        text = div.text.strip()
-                        if keyword in text and len(text) > len(keyword) and len(text) < 200:
-                            lines = text.split('\n')
-                            if len(lines) >= 2 and keyword == lines[0]:
-                                indices.append({
-                                    "name": lines[0],
-                                    "value": lines[1] if len(lines) > 1 else "",
-                                    "change": lines[2] if len(lines) > 2 else ""
-                                })
-                                break  # Found this index, move to next
-                    except:
-                        continue
-            
+            keywords = index_keywords(keywords)
+            texts = self.driver.execute_script(INDEX_CARDS_JS, keywords) or []
+            indices = add_numeric_fields({'indices': pick_index_cards(texts, keywords)})['indices']
             print(f"✓ Found {len(indices)} indices")
         except Exception as e:
             print(f"✗ Error: {e}")
         
         return indices
     
+    @traced('groww_fixed.scrape_news_fixed')
     def scrape_news_fixed(self) -> List[Dict]:
         """Scrape news with correct approach"""
         print("\n🔍 Scraping news...")
@@ -103,10 +165,7 @@ class GrowwScraperFixed:
         try:
             # Scroll to news area (middle of page)
             self.driver.execute_script("window.scrollTo(0, 2000);")
-            time.sleep(2)
-            
-            # Get page source and find news patterns
-            page_source = self.driver.page_source
+            self.readiness.append(wait_for_dom_quiet(self.driver, label='news area'))
             
             # Look for all divs
             all_elements = self.driver.find_elements(By.TAG_NAME, "div")
@@ -115,72 +174,17 @@ class GrowwScraperFixed:
             
             for elem in all_elements:
                 try:
-                    text = elem.text.strip()
+                    news_item = parse_news_card(elem.text.strip())
                     
-                    # Skip if too short or too long
-                    if not text or len(text) < 30 or len(text) > 500:
+                    # Skip duplicates or invalid
+                    if not news_item or news_item['headline'] in seen_headlines:
                         continue
                     
-                    # Check if it looks like a news item (has source, time pattern)
-                    if '·' in text and ('hour' in text.lower() or 'ago' in text.lower()):
-                        lines = text.split('\n')
-                        
-                        # Find the line with source and time
-                        source_line_idx = -1
-                        for i, line in enumerate(lines):
-                            if '·' in line and ('ago' in line or 'hour' in line):
-                                source_line_idx = i
-                                break
-                        
-                        if source_line_idx == -1:
-                            continue
-                        
-                        # Extract source and time
-                        source_time = lines[source_line_idx]
-                        parts = source_time.split('·')
-                        source = parts[0].strip()
-                        time_ago = parts[1].strip() if len(parts) > 1 else ""
-                        
-                        # Headline is usually next line
-                        headline = ""
-                        if source_line_idx + 1 < len(lines):
-                            headline = lines[source_line_idx + 1].strip()
-                        
-                        # Stock info (has %)
-                        stock_info = ""
-                        for line in lines:
-                            if '%' in line and any(c.isdigit() for c in line):
-                                stock_info = line.strip()
-                                break
-                        
-                        # Skip duplicates or invalid
-                        if not headline or len(headline) < 15 or headline in seen_headlines:
-                            continue
-                        
-                        seen_headlines.add(headline)
-                        
-                        # Parse stock
-                        stock_name = ""
-                        stock_change = ""
-                        if stock_info:
-                            # Extract percentage
-                            pct_match = re.search(r'([-+]?\d+\.?\d*%)', stock_info)
-                            if pct_match:
-                                stock_change = pct_match.group(1)
-                                stock_name = stock_info.replace(stock_change, '').strip()
-                        
-                        news_item = {
-                            "source": source,
-                            "time_ago": time_ago,
-                            "headline": headline,
-                            "related_stock": stock_name,
-                            "stock_change": stock_change
-                        }
-                        
-                        news_items.append(news_item)
-                        
-                        if len(news_items) >= 15:
-                            break
+                    seen_headlines.add(news_item['headline'])
+                    news_items.append(news_item)
+                    
+                    if len(news_items) >= 15:
+                        break
                 
                 except:
                     continue
@@ -192,71 +196,36 @@ class GrowwScraperFixed:
         
         return news_items
     
-    def scrape_stock_section(self, section_title: str, scroll_position: int = 1500) -> List[Dict]:
-        """Generic scraper for stock sections"""
-        print(f"\n🔍 Scraping {section_title}...")
-        stocks = []
+    @traced('groww_fixed.scrape_stock_sections')
+    def scrape_stock_sections(self, limit: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Collect all four stock tables in one pass over the rendered DOM
+        
+        Rows are attributed to the nearest preceding section heading, so no
+        scrolling to fixed offsets or re-reading every link per section.
+        """
+        print("\n🔍 Scraping stock sections...")
         
         try:
-            # Scroll to section
-            self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-            time.sleep(1)
-            
-            # Find all clickable elements (links)
-            links = self.driver.find_elements(By.TAG_NAME, "a")
-            
-            for link in links:
-                try:
-                    text = link.text.strip()
-                    
-                    # Check if it's a stock (has ₹ or %)
-                    if ('₹' in text or '%' in text) and '\n' in text:
-                        lines = [l.strip() for l in text.split('\n') if l.strip()]
-                        
-                        if len(lines) >= 2:
-                            name = lines[0]
-                            
-                            # Skip if name is too long (probably not a stock card)
-                            if len(name) > 50:
-                                continue
-                            
-                            # Extract price and change
-                            price = ""
-                            change = ""
-                            
-                            for line in lines[1:]:
-                                if '₹' in line and not price:
-                                    price = line
-                                elif '%' in line or (any(c in line for c in ['-', '+']) and any(c.isdigit() for c in line)):
-                                    change = line
-                            
-                            if name and (price or change):
-                                stocks.append({
-                                    "name": name,
-                                    "price": price,
-                                    "change": change
-                                })
-                            
-                            if len(stocks) >= 10:
-                                break
-                
-                except:
-                    continue
-            
-            # Remove duplicates
-            unique_stocks = []
-            seen_names = set()
-            for stock in stocks:
-                if stock['name'] not in seen_names:
-                    seen_names.add(stock['name'])
-                    unique_stocks.append(stock)
-            
-            print(f"✓ Found {len(unique_stocks)} stocks")
-            return unique_stocks[:10]
+            events = self.driver.execute_script(STOCK_SECTIONS_JS, list(STOCK_SECTIONS.values())) or []
+            sections = group_stock_links(
+                ((kind, section_for_heading(value) if kind == 'heading' else value) for kind, value in events),
+                limit
+            )
+            for key, title in STOCK_SECTIONS.items():
+                print(f"✓ {title}: {len(sections[key])} stocks")
+            return sections
         
         except Exception as e:
             print(f"✗ Error: {e}")
-            return []
+            return {key: [] for key in STOCK_SECTIONS}
+    
+    def scrape_stock_section(self, section_title: str, scroll_position: int = None) -> List[Dict]:
+        """Rows for a single section by title (scroll_position is ignored)"""
+        for key, title in STOCK_SECTIONS.items():
+            if title.lower() == section_title.lower():
+                return self.scrape_stock_sections()[key]
+        return []
     
     def scrape_all(self) -> Dict:
         """Scrape everything"""
@@ -265,23 +234,28 @@ class GrowwScraperFixed:
         print("="*70)
         
         try:
-            self.setup_driver()
-            self.load_page()
-            
-            # Scrape data
-            self.data = {
-                "metadata": {
-                    "url": self.url,
-                    "scraped_at": datetime.now().isoformat(),
-                    "version": "fixed-1.0"
-                },
-                "indices": self.scrape_indices(),
-                "news": self.scrape_news_fixed(),
-                "top_gainers": self.scrape_stock_section("Top Gainers", 1200),
-                "top_losers": self.scrape_stock_section("Top Losers", 1400),
-                "most_bought": self.scrape_stock_section("Most Bought", 1000),
-                "most_traded": self.scrape_stock_section("Most Traded", 1100),
-            }
+            if self.parse_mode == "snapshot":
+                self.data = self.parse_snapshot(self.take_snapshot())
+            elif self.parse_mode == "network":
+                self.data = self.parse_network(self.capture_network())
+            else:
+                self.setup_driver()
+                self.load_page()
+                
+                # Scrape data
+                self.data = {
+                    "metadata": {
+                        "url": self.url,
+                        "scraped_at": datetime.now().isoformat(),
+                        "version": "fixed-1.0"
+                    },
+                    "indices": self.scrape_indices(),
+                    "news": self.scrape_news_fixed(),
+                    **self.scrape_stock_sections(),
+                }
+                self.data["metadata"]["readiness"] = summarize(self.readiness)
+                self.blocking['page'] = page_weight(self.driver)
+                self.data["metadata"]["network"] = self.blocking
             
             print("\n" + "="*70)
             print("✅ SCRAPING COMPLETE")
@@ -293,12 +267,121 @@ class GrowwScraperFixed:
             traceback.print_exc()
         
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("\n✓ Browser closed")
+            self.close_driver()
         
         return self.data
     
+    @traced('groww_fixed.take_snapshot')
+    def take_snapshot(self) -> str:
+        """
+        Load the page, capture page_source once and release the browser
+        
+        Returns:
+            str: Rendered HTML of the page
+        """
+        try:
+            self.setup_driver()
+            print(f"Loading: {self.url}")
+            self.driver.get(self.url)
+            
+            # Groww ships its initial data as embedded JSON; when every
+            # section is there, the scroll-and-sleep pass is unnecessary
+            self.page_source = self.driver.page_source
+            missing = [s for s in SECTIONS if s not in GrowwEmbeddedExtractor(self.page_source).extract()]
+            if missing:
+                print(f"Embedded data missing {missing}, waiting for rendered content...")
+                self.load_lazy_content()
+                
+                # Scroll to news area so lazy sections are rendered before the snapshot
+                self.driver.execute_script("window.scrollTo(0, 2000);")
+                self.readiness.append(wait_for_dom_quiet(self.driver, label='news area'))
+                self.page_source = self.driver.page_source
+            
+            self.blocking['page'] = page_weight(self.driver)
+            print(f"✓ Snapshot captured ({len(self.page_source)} chars)")
+            return self.page_source
+        finally:
+            self.close_driver()
+    
+    @traced('groww_fixed.parse_snapshot')
+    def parse_snapshot(self, html: str) -> Dict:
+        """Extract all sections from an HTML snapshot without a browser"""
+        print("\n🔍 Parsing snapshot...")
+        data = parse_groww_page(html, self.url)
+        if self.readiness:
+            data['metadata']['readiness'] = summarize(self.readiness)
+        if self.blocking:
+            data['metadata']['network'] = self.blocking
+        print(f"✓ Found {len(data['indices'])} indices, {len(data['news'])} news items")
+        return data
+    
+    @traced('groww_fixed.capture_network')
+    def capture_network(self) -> List:
+        """
+        Load the page, record its JSON API responses and release the browser
+        
+        Returns:
+            list: (url, payload) pairs; page_source is kept for fallback
+        """
+        try:
+            self.setup_driver()
+            capture = NetworkCapture(self.driver)
+            print(f"Loading: {self.url}")
+            self.driver.get(self.url)
+            
+            # Rendered news metadata means the page's API calls have landed
+            self.readiness.append(wait_until_ready(
+                self.driver,
+                selectors=['a[href]'],
+                text_pattern=r'\d+\s*(?:minutes?|hours?|days?)\s*ago',
+                label='groww content'
+            ))
+            responses = capture.collect()
+            
+            # Sections fetched only on scroll need the lazy-load pass
+            if [s for s in SECTIONS if s not in extract_network_sections(responses)]:
+                self.load_lazy_content()
+                responses += capture.collect()
+            
+            self.page_source = self.driver.page_source
+            self.blocking['page'] = page_weight(self.driver)
+            print(f"✓ Captured {len(responses)} API responses")
+            return responses
+        finally:
+            self.close_driver()
+    
+    @traced('groww_fixed.parse_network')
+    def parse_network(self, responses: List) -> Dict:
+        """Extract all sections from captured API responses"""
+        print("\n🔍 Parsing API responses...")
+        data = parse_groww_network(responses, self.page_source or '', self.url)
+        if self.readiness:
+            data['metadata']['readiness'] = summarize(self.readiness)
+        if self.blocking:
+            data['metadata']['network'] = self.blocking
+        print(f"✓ Found {len(data['indices'])} indices, {len(data['news'])} news items")
+        return data
+    
+    @traced('groww_fixed.close_driver')
+    def close_driver(self):
+        """Quit the browser if we launched it (pooled drivers are left running)"""
+        if self.driver and self._owns_driver:
+            self.driver.quit()
+            self.driver = None
+            print("\n✓ Browser closed")
+    
+    def save_snapshot(self, filename: str = None) -> str:
+        """Save the captured HTML so it can be re-parsed offline"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"groww_snapshot_{timestamp}.html"
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.page_source or '')
+        
+        print(f"\n💾 Saved snapshot: {filename}")
+        return filename
+    
     def save(self, filename: str = None) -> str:
         """Save data"""
         if not filename:
@@ -23,6 +23,8 @@ import re
 import tempfile
 import shutil
 
+from groww_html_parser import GROWW_PAGE_URL
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -33,9 +35,9 @@ logger = logging.getLogger(__name__)
 class GrowwStockNewsScraper:
     """Simplified scraper for Groww Stock News section"""
     
-    def __init__(self, headless=False):
-        """Initialize the scraper"""
-        self.url = "https://groww.in/share-market-today"
+    def __init__(self, headless=False, url=None):
+        """Initialize the scraper (url overrides GROWW_URL)"""
+        self.url = url or GROWW_PAGE_URL
         self.headless = headless
         self.driver = None
         self.wait = None
@@ -0,0 +1,167 @@
+"""
+Lightweight HTML DOM
+====================
+
+Minimal in-process DOM built on the standard library's html.parser, used to
+run the scrapers' text heuristics on a page snapshot (driver.page_source or a
+saved .html file) without any WebDriver round trips.
+
+Node.text approximates Selenium's WebElement.text: block-level elements start
+new lines, whitespace inside a line is collapsed, and script/style content is
+ignored.
+
+Usage:
+    root = parse_html(html)
+    for div in root.find_all('div'):
+        print(div.text)
+"""
+
+from html.parser import HTMLParser
+import re
+
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
+
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'body', 'dd', 'details',
+    'dialog', 'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer',
+    'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'html', 'li',
+    'main', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'tbody',
+    'td', 'tfoot', 'th', 'thead', 'tr', 'ul'
+}
+
+# Content of these elements is never rendered as text
+SKIP_TEXT_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'svg'}
+
+_WHITESPACE = re.compile(r'[ \t\r\f\v\u00a0]+')
+
+
+class Node:
+    """A single element in the parsed tree"""
+
+    __slots__ = ('tag', 'attrs', 'children', 'parent', '_raw_text', '_text')
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = parent
+        self._raw_text = None
+        self._text = None
+
+    def __repr__(self):
+        return f"<Node {self.tag} children={len(self.children)}>"
+
+    def get(self, name, default=None):
+        """Return an attribute value"""
+        value = self.attrs.get(name, default)
+        return default if value is None else value
+
+    def iter(self, tag=None):
+        """Yield this node and all descendant elements in document order"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if tag is None or node.tag == tag:
+                yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, Node))
+
+    def find_all(self, tag=None):
+        """List of descendant elements (excluding self) matching tag"""
+        return [node for node in self.iter(tag) if node is not self]
+
+    def find(self, tag=None):
+        """First descendant element matching tag, or None"""
+        for node in self.iter(tag):
+            if node is not self:
+                return node
+        return None
+
+    def ancestors(self):
+        """Yield parent, grandparent, ... up to the document root"""
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def _raw(self):
+        """Un-normalized text with '\\n' markers at block boundaries (cached)"""
+        if self._raw_text is None:
+            if self.tag in SKIP_TEXT_TAGS:
+                self._raw_text = ''
+            else:
+                parts = []
+                for child in self.children:
+                    if isinstance(child, Node):
+                        if child.tag == 'br':
+                            parts.append('\n')
+                        else:
+                            parts.append(child._raw())
+                    else:
+                        parts.append(child)
+                raw = ''.join(parts)
+                if self.tag in BLOCK_TAGS:
+                    raw = f"\n{raw}\n"
+                self._raw_text = raw
+        return self._raw_text
+
+    @property
+    def text(self) -> str:
+        """Visible text, one line per block, like WebElement.text"""
+        if self._text is None:
+            lines = (_WHITESPACE.sub(' ', line).strip() for line in self._raw().split('\n'))
+            self._text = '\n'.join(line for line in lines if line)
+        return self._text
+
+    @property
+    def own_text(self) -> str:
+        """Text of this element's direct text children only"""
+        return _WHITESPACE.sub(' ', ''.join(c for c in self.children if isinstance(c, str))).strip()
+
+
+class _TreeBuilder(HTMLParser):
+    """html.parser handler that assembles Node objects"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node('#document')
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, attrs, self._stack[-1])
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, attrs, self._stack[-1])
+        self._stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        # Pop back to the matching open element; ignore stray end tags
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data):
+        # Source newlines are just whitespace; line breaks come from block tags
+        self._stack[-1].children.append(data.replace('\n', ' '))
+
+
+def parse_html(html: str) -> Node:
+    """
+    Parse an HTML document into a Node tree
+
+    Args:
+        html: Full page source
+
+    Returns:
+        Node: Document root (tag '#document')
+    """
+    builder = _TreeBuilder()
+    builder.feed(html or '')
+    builder.close()
+    return builder.root
@@ -2,31 +2,49 @@
 News Aggregator API
 ===================
 
-FastAPI server that runs Groww and Pulse scrapers in parallel
-and returns combined news data.
+FastAPI server that runs every registered news source (Groww and Pulse
+by default, see news_sources.py) concurrently and returns combined news data.
 
 Usage:
     uvicorn news_api:app --reload --host 0.0.0.0 --port 8000
 
 Endpoints:
-    GET /scrape - Triggers both scrapers and returns combined results
+    GET /scrape - Scrapes the selected sources (?sources=, default all) concurrently
+    GET /scrape/{source} - One source only
+    GET /scrape/stream - Same, streamed as NDJSON/SSE as each source finishes
+    GET /news/latest - Latest background-refreshed snapshot of both sources
+    GET /timeline - New items from all sources since a cursor
+    GET /archive/* - Query archived runs, articles, indices and stock tables
+    GET /search - Ranked full-text search over archived headlines
+    POST /jobs - Submit a background scrape job, poll GET /jobs/{id}
+    GET /metrics - Prometheus metrics (stage timings, items, failures)
+    GET /debug/traces/{id} - Span breakdown of one request
     GET /health - Health check endpoint
 """
 
-from fastapi import FastAPI, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, BackgroundTasks, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 import logging
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
-import json
 from typing import Dict, Any
 import os
 
-# Import scraper classes
-from groww_scraper_fixed import GrowwScraperFixed
-from pulse_zerodha_scraper import PulseZerodhaScraper
+# Import scrape sources
+from news_sources import GrowwSource, PulseSource, SourceRegistry
+from browser_pool import BrowserPool, TabPool
+from response_cache import ResponseCache
+from news_refresher import NewsRefresher
+from single_flight import SingleFlight
+from scrape_jobs import JobStore, JobStoreFull
+from news_stream import stream_scrape, MEDIA_TYPES
+from news_timeline import NewsTimeline
+from news_archive import NewsArchive
+from news_search import NewsSearch
+from scrape_metrics import ScrapeMetrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from scrape_tracing import tracer
 
 # Configure logging
 logging.basicConfig(
@@ -51,11 +69,120 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Thread pool for running scrapers
-SCRAPE_PARALLEL = os.getenv("SCRAPE_PARALLEL", "0").strip().lower() in {"1", "true", "yes", "y"}
-# Railway free tier often can't support 2 concurrent headless Chromes reliably.
-# Default to sequential (1 worker). Set SCRAPE_PARALLEL=1 to opt into parallel.
-executor = ThreadPoolExecutor(max_workers=2 if SCRAPE_PARALLEL else 1)
+# Paths that are polled constantly and never scrape
+_UNTRACED_PREFIXES = ('/health', '/metrics', '/debug/', '/docs', '/openapi.json')
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Root span per request; the trace ID is returned in X-Trace-Id"""
+    if request.url.path.startswith(_UNTRACED_PREFIXES):
+        return await call_next(request)
+    
+    with tracer.span(f"{request.method} {request.url.path}", query=str(request.url.query)) as span:
+        response = await call_next(request)
+        span.set(status_code=response.status_code)
+    response.headers['X-Trace-Id'] = span.trace_id
+    return response
+
+
+# Pool of warm, reusable Chrome sessions shared by all scrapers.
+# Railway free tier often can't support 2 concurrent headless Chromes reliably,
+# so default to a single session (sequential scrapes). BROWSER_POOL_SIZE replaces
+# the old SCRAPE_PARALLEL switch, which is still honoured as "2 sessions".
+_legacy_parallel = os.getenv("SCRAPE_PARALLEL", "0").strip().lower() in {"1", "true", "yes", "y"}
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2" if _legacy_parallel else "1"))
+BROWSER_POOL_WARM = os.getenv("BROWSER_POOL_WARM", "1").strip().lower() in {"1", "true", "yes", "y"}
+
+# "pool": up to BROWSER_POOL_SIZE separate Chrome processes.
+# "tabs": one Chrome process lending a tab to each source (up to BROWSER_TABS),
+# so sources load side by side for roughly the memory of a single browser.
+BROWSER_MODE = os.getenv("BROWSER_MODE", "pool").strip().lower()
+
+# Groww: "snapshot" parses the page source (embedded JSON, then DOM);
+# "network" decodes the page's own API responses from the performance log
+GROWW_PARSE_MODE = os.getenv("GROWW_PARSE_MODE", "snapshot").strip().lower()
+
+_pool_options = dict(
+    headless=True,
+    max_navigations=int(os.getenv("BROWSER_MAX_NAVIGATIONS", "50")),
+    max_rss_mb=int(os.getenv("BROWSER_MAX_RSS_MB", "450")),
+    debug_port_base=int(os.getenv("BROWSER_DEBUG_PORT_BASE", "9222")),
+    network_logging=GROWW_PARSE_MODE == "network",
+)
+if BROWSER_MODE == "tabs":
+    browser_pool = TabPool(size=int(os.getenv("BROWSER_TABS", "2")), **_pool_options)
+else:
+    browser_pool = BrowserPool(size=BROWSER_POOL_SIZE, **_pool_options)
+
+# Pulse: "http" tries a browserless fetch first and falls back to Chrome only
+# if the parsed result is empty or malformed; "browser" always uses Chrome.
+PULSE_FETCH_MODE = os.getenv("PULSE_FETCH_MODE", "http").strip().lower()
+
+# Per-stage scrape timings, item and failure counters for /metrics
+scrape_metrics = ScrapeMetrics()
+
+
+def _publish(source: str, data: Dict[str, Any]):
+    """Feed a good scrape to the timeline and the archive"""
+    news_timeline.ingest(source, data.get(source_registry.get(source).items_key) or [])
+    _archive_run(source, data)
+
+
+# Every news source. Endpoints, the cache, the refresher and jobs take their
+# source lists from here; SCRAPE_FANOUT_LIMIT caps sources scraped at once.
+source_registry = SourceRegistry(
+    metrics=scrape_metrics,
+    on_success=_publish,
+    max_parallel=int(os.getenv("SCRAPE_FANOUT_LIMIT", "0"))
+)
+source_registry.register(GrowwSource(browser_pool, parse_mode=GROWW_PARSE_MODE))
+source_registry.register(PulseSource(browser_pool, fetch_mode=PULSE_FETCH_MODE))
+
+# Thread pool for running scrapers. Chrome concurrency is capped by the pool,
+# so one worker per browser session plus one per source lets browserless
+# fetches (Pulse over HTTP) finish while Groww holds the browser.
+executor = ThreadPoolExecutor(max_workers=browser_pool.size + len(source_registry))
+
+# Concurrent scrapes of the same source (requests, cache refreshes and the
+# background refresher) share one in-flight run
+scrape_flight = SingleFlight()
+
+# Last good result per source, served within the TTL and while a stale
+# entry is refreshed in the background
+response_cache = ResponseCache(source_registry.cache_ttls(), single_flight=scrape_flight)
+
+# Background refresher: scrapes on a timer and publishes snapshots for
+# /news/latest, so polling clients never trigger a browser launch
+BACKGROUND_REFRESH = os.getenv("BACKGROUND_REFRESH", "1").strip().lower() in {"1", "true", "yes", "y"}
+REFRESH_INTERVALS = source_registry.refresh_intervals()
+
+# Finished scrape jobs stay pollable for this long, up to JOB_MAX_COUNT jobs
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+JOB_MAX_COUNT = int(os.getenv("JOB_MAX_COUNT", "100"))
+
+# Every successful scrape feeds the cursor-paginated /timeline
+news_timeline = NewsTimeline(max_items=int(os.getenv("TIMELINE_MAX_ITEMS", "2000")))
+
+# ...and is archived to SQLite, pruned after ARCHIVE_RETENTION_DAYS
+news_archive = NewsArchive(
+    os.getenv("ARCHIVE_PATH", "news_archive.db"),
+    retention_days=float(os.getenv("ARCHIVE_RETENTION_DAYS", "7"))
+)
+news_search = NewsSearch(
+    news_archive,
+    cache_size=int(os.getenv("SEARCH_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("SEARCH_CACHE_TTL", "30"))
+)
+
+# ThreadPoolExecutor has no public queue accessor; _work_queue holds
+# submitted work no thread has picked up yet
+scrape_metrics.add_gauge('executor_queue_depth', 'Scrape tasks waiting for a worker thread',
+                         lambda: executor._work_queue.qsize())
+scrape_metrics.add_gauge('browsers_in_use', 'Browser sessions currently borrowed', browser_pool.in_use_count)
+scrape_metrics.add_gauge('browser_pool_size', 'Maximum concurrent browser sessions', lambda: browser_pool.size)
+scrape_metrics.add_gauge('scrapes_in_flight', 'Sources with a scrape running',
+                         lambda: sum(scrape_flight.in_flight(s) for s in source_registry))
 
 
 @app.on_event("startup")
@@ -68,125 +195,55 @@ async def startup_event():
     logger.info(f"Port: {os.getenv('PORT', '8000')}")
     logger.info(f"Chrome Binary: {os.getenv('CHROME_BIN', 'Not set')}")
     logger.info(f"Python version: {__import__('sys').version}")
+    logger.info(f"Browser mode: {BROWSER_MODE}, pool size: {browser_pool.size}")
+    logger.info(f"Sources: {', '.join(source_registry)}")
+    logger.info(f"Background refresh: {'on' if BACKGROUND_REFRESH else 'off'} {REFRESH_INTERVALS}")
     logger.info("Application started successfully!")
     logger.info("=" * 80)
+    
+    # Launch Chrome in the background so the health check isn't delayed
+    if BROWSER_POOL_WARM:
+        asyncio.get_event_loop().run_in_executor(executor, browser_pool.warm)
+    
+    if BACKGROUND_REFRESH:
+        news_refresher.start()
 
 
-def run_groww_scraper() -> Dict[str, Any]:
-    """
-    Run Groww scraper in headless mode
-    
-    Returns:
-        dict: Scraped news data or error dict
-    """
-    try:
-        logger.info("Starting Groww scraper...")
-        scraper = GrowwScraperFixed(headless=True)
-        
-        # Scrape all data (includes setup, load, and cleanup)
-        data = scraper.scrape_all()
-        
-        # Check if we got data
-        if data and data.get('news'):
-            logger.info(f"Groww scraper completed: {len(data['news'])} news items")
-            
-            # Format to match expected API response structure
-            formatted_data = {
-                'scraped_at': data.get('metadata', {}).get('scraped_at'),
-                'url': data.get('metadata', {}).get('url'),
-                'news_items': data.get('news', []),  # Map 'news' to 'news_items' for compatibility
-                'indices': data.get('indices', []),
-                'top_gainers': data.get('top_gainers', []),
-                'top_losers': data.get('top_losers', []),
-                'most_bought': data.get('most_bought', []),
-                'most_traded': data.get('most_traded', [])
-            }
-            
-            return {
-                'success': True,
-                'source': 'groww',
-                'data': formatted_data
-            }
-        else:
-            logger.warning("Groww scraper returned no items")
-            return {
-                'success': False,
-                'source': 'groww',
-                'error': 'No news items found',
-                'timestamp': datetime.now().isoformat()
-            }
-            
-    except Exception as e:
-        logger.error(f"Error in Groww scraper: {e}", exc_info=True)
-        return {
-            'success': False,
-            'source': 'groww',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background refresh and close pooled browsers"""
+    news_refresher.stop()
+    browser_pool.shutdown()
+    news_archive.close()
+    executor.shutdown(wait=False)
 
 
-def run_pulse_scraper() -> Dict[str, Any]:
-    """
-    Run Pulse by Zerodha scraper in headless mode
-    
-    Returns:
-        dict: Scraped news data or error dict
-    """
+def _archive_run(source: str, data: Dict[str, Any]):
+    """Archive a successful scrape; archive errors never fail the scrape"""
     try:
-        logger.info("Starting Pulse scraper...")
-        scraper = PulseZerodhaScraper(headless=True)
-        
-        # Initialize driver
-        if not scraper._init_driver():
-            logger.error("Failed to initialize Pulse driver")
-            return {
-                'error': 'Failed to initialize browser',
-                'source': 'pulse',
-                'timestamp': datetime.now().isoformat()
-            }
-        
-        # Navigate to page
-        if not scraper.navigate_to_page():
-            logger.error("Failed to load Pulse page")
-            scraper.cleanup()
-            return {
-                'error': 'Failed to load page',
-                'source': 'pulse',
-                'timestamp': datetime.now().isoformat()
-            }
-        
-        # Scrape news
-        news_data = scraper.scrape_all_news()
-        
-        # Cleanup
-        scraper.cleanup()
-        
-        if news_data and news_data.get('articles'):
-            logger.info(f"Pulse scraper completed: {len(news_data['articles'])} items")
-            return {
-                'success': True,
-                'source': 'pulse',
-                'data': news_data
-            }
-        else:
-            logger.warning("Pulse scraper returned no articles")
-            return {
-                'success': False,
-                'source': 'pulse',
-                'error': 'No articles found',
-                'timestamp': datetime.now().isoformat()
-            }
-            
+        news_archive.record_run(source_registry.get(source), data)
     except Exception as e:
-        logger.error(f"Error in Pulse scraper: {e}", exc_info=True)
-        return {
-            'success': False,
-            'source': 'pulse',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }
+        logger.error(f"Error archiving {source} run: {e}", exc_info=True)
+
+
+# Published snapshots also seed the /scrape cache
+news_refresher = NewsRefresher(
+    source_registry.loaders(),
+    REFRESH_INTERVALS,
+    executor,
+    on_publish=response_cache.put,
+    single_flight=scrape_flight
+)
+
 
+# Background scrape jobs for clients that can't hold a connection for minutes
+scrape_jobs = JobStore(
+    source_registry.loaders(),
+    executor,
+    cache=response_cache,
+    retention_seconds=JOB_RETENTION_SECONDS,
+    max_jobs=JOB_MAX_COUNT
+)
 
 @app.get("/")
 async def root():
@@ -195,91 +252,379 @@ async def root():
         "message": "News Aggregator API",
         "version": "1.0.0",
         "endpoints": {
-            "/scrape": "Trigger both scrapers and get combined results",
+            "/scrape": "Scrape sources concurrently and get combined results (?sources=groww,pulse)",
+            "/scrape/{source}": "Scrape one source",
+            "/scrape/stream": "Stream records as NDJSON or SSE (?format=ndjson|sse)",
+            "/news/latest": "Latest background-refreshed news from both sources",
+            "/news/latest/{source}": "Latest snapshot for one source",
+            "/timeline": "Items from all sources newer than a cursor (?since=&limit=)",
+            "/archive/runs": "Archived scrape runs (?source=&limit=)",
+            "/archive/articles": "Archived articles (?source=&since=&until=&stock=&limit=&offset=)",
+            "/archive/indices": "Archived index readings (?name=&since=&until=&limit=)",
+            "/archive/stocks": "Archived stock-table rows (?name=&section=&since=&until=&limit=)",
+            "/search": "Full-text headline search (?q=&source=&from=&to=&limit=)",
+            "POST /jobs": "Submit a background scrape job (?sources=groww,pulse)",
+            "/jobs/{job_id}": "Job status, per-source progress and results",
+            "/metrics": "Prometheus metrics (per-stage timings, items, failures)",
+            "/debug/traces": "Recent request traces",
+            "/debug/traces/{trace_id}": "Span breakdown of one request (ID from X-Trace-Id)",
             "/health": "Health check endpoint"
         }
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics: per-stage scrape timings, items, failures, queue depth"""
+    return PlainTextResponse(scrape_metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/debug/traces")
+async def list_traces(limit: int = Query(20, ge=1, le=200)):
+    """Most recent traces, newest first"""
+    return {'traces': tracer.recent(limit), 'tracing': tracer.stats()}
+
+
+@app.get("/debug/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """
+    Span tree of one trace (from a response's X-Trace-Id header)
+    
+    Returns:
+        JSONResponse: Nested spans with offsets and durations plus the
+        slowest spans, or 404 if unknown or evicted
+    """
+    trace = tracer.get_trace(trace_id)
+    if trace is None:
+        return JSONResponse(
+            status_code=404,
+            content={'success': False, 'error': f"Trace not found or evicted: {trace_id}"}
+        )
+    
+    return JSONResponse(content={'success': True, **trace})
+
+
 @app.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "browser_pool": browser_pool.stats(),
+        "sources": source_registry.stats(),
+        "cache": response_cache.stats(),
+        "refresher": news_refresher.stats(),
+        "single_flight": scrape_flight.stats(),
+        "jobs": scrape_jobs.stats(),
+        "timeline": news_timeline.stats(),
+        "archive": news_archive.stats(),
+        "search": news_search.stats(),
+        "tracing": tracer.stats()
     }
 
 
+def _cache_headers(infos: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Build freshness headers from per-source cache info
+    
+    X-Cache-Status is "hit", "stale" or "fresh" for a single source, or
+    "groww=hit, pulse=stale" for combined responses. Age is the oldest
+    result's age in seconds.
+    """
+    if len(infos) == 1:
+        status = next(iter(infos.values()))['status']
+    else:
+        status = ', '.join(f"{name}={info['status']}" for name, info in infos.items())
+    age = max(info['age_seconds'] for info in infos.values())
+    return {'X-Cache-Status': status, 'Age': str(int(age))}
+
+
+@app.get("/news/latest")
+async def latest_news():
+    """
+    Latest published snapshot of every source
+    
+    Served from memory without scraping; a source that has not finished its
+    first background run is reported with success False.
+    
+    Returns:
+        JSONResponse: Per-source snapshots
+    """
+    snapshots = news_refresher.snapshots()
+    sources = {}
+    for source in news_refresher.loaders:
+        snapshot = snapshots.get(source)
+        if snapshot:
+            sources[source] = snapshot.to_dict()
+        else:
+            sources[source] = {'success': False, 'source': source, 'error': 'No snapshot published yet'}
+    
+    ages = [s.age for s in snapshots.values()]
+    headers = {'Age': str(int(max(ages)))} if ages else {}
+    return JSONResponse(
+        content={
+            'success': any(s['success'] for s in sources.values()),
+            'timestamp': datetime.now().isoformat(),
+            'sources': sources
+        },
+        headers=headers
+    )
+
+
+@app.get("/news/latest/{source}")
+async def latest_source_news(source: str):
+    """
+    Latest published snapshot of one source
+    
+    Args:
+        source: "groww" or "pulse"
+    
+    Returns:
+        JSONResponse: The snapshot, 404 for unknown sources, or 503 until
+        the first background run has finished
+    """
+    if source not in news_refresher.loaders:
+        return JSONResponse(
+            status_code=404,
+            content={'success': False, 'error': f"Unknown source: {source}"}
+        )
+    
+    snapshot = news_refresher.latest(source)
+    if snapshot is None:
+        return JSONResponse(
+            status_code=503,
+            content={
+                'success': False,
+                'source': source,
+                'error': 'No snapshot published yet',
+                'timestamp': datetime.now().isoformat()
+            },
+            headers={'Retry-After': '30'}
+        )
+    
+    return JSONResponse(
+        content=snapshot.to_dict(),
+        headers={'Age': str(int(snapshot.age)), 'X-Snapshot-Version': str(snapshot.version)}
+    )
+
+
+@app.get("/timeline")
+async def timeline(
+    since: str = Query(None, description="Cursor from a previous response"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum items to return"),
+    source: str = Query(None, description="Only items from this source")
+):
+    """
+    Merged, time-ordered items from all sources newer than a cursor
+    
+    Each item carries a stable "id" (normalized headline + canonical URL)
+    and a "cursor". Without since the latest items are returned; pass
+    next_cursor back as since to receive only items seen afterwards.
+    
+    Returns:
+        JSONResponse: {"items", "count", "next_cursor", "has_more"}
+    """
+    try:
+        since_cursor = int(since) if since not in (None, '') else None
+    except ValueError:
+        return JSONResponse(
+            status_code=400,
+            content={'success': False, 'error': f"Invalid cursor: {since}"}
+        )
+    
+    page = news_timeline.page(since=since_cursor, limit=limit, source=source)
+    return JSONResponse(content={
+        'success': True,
+        'count': len(page['items']),
+        **page
+    })
+
+
+def _archive_response(rows) -> JSONResponse:
+    return JSONResponse(content={'success': True, 'count': len(rows), 'items': rows})
+
+
+@app.get("/archive/runs")
+def archive_runs(
+    source: str = Query(None, description="groww or pulse"),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """Archived scrape runs, newest first"""
+    return _archive_response(news_archive.query_runs(source=source, limit=limit))
+
+
+@app.get("/archive/articles")
+def archive_articles(
+    source: str = Query(None, description="groww or pulse"),
+    since: str = Query(None, description="ISO timestamp, inclusive"),
+    until: str = Query(None, description="ISO timestamp, exclusive"),
+    stock: str = Query(None, description="Related stock name"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    """Archived articles filtered by source, publish time range and stock"""
+    rows = news_archive.query_articles(
+        source=source, since=since, until=until, stock=stock, limit=limit, offset=offset
+    )
+    return _archive_response(rows)
+
+
+@app.get("/archive/indices")
+def archive_indices(
+    name: str = Query(None, description="Index name, e.g. NIFTY 50"),
+    since: str = Query(None, description="ISO timestamp, inclusive"),
+    until: str = Query(None, description="ISO timestamp, exclusive"),
+    limit: int = Query(200, ge=1, le=5000)
+):
+    """Archived index readings, newest run first"""
+    return _archive_response(news_archive.query_indices(name=name, since=since, until=until, limit=limit))
+
+
+@app.get("/archive/stocks")
+def archive_stocks(
+    name: str = Query(None, description="Stock name"),
+    section: str = Query(None, description="top_gainers, top_losers, most_bought or most_traded"),
+    since: str = Query(None, description="ISO timestamp, inclusive"),
+    until: str = Query(None, description="ISO timestamp, exclusive"),
+    limit: int = Query(200, ge=1, le=5000)
+):
+    """Archived stock-table rows, newest run first"""
+    rows = news_archive.query_stocks(name=name, section=section, since=since, until=until, limit=limit)
+    return _archive_response(rows)
+
+
+@app.get("/search")
+def search_news(
+    q: str = Query(..., min_length=1, description="Search text"),
+    source: str = Query(None, description="groww or pulse"),
+    from_: str = Query(None, alias="from", description="ISO timestamp, inclusive"),
+    to: str = Query(None, description="ISO timestamp, exclusive"),
+    limit: int = Query(20, ge=1, le=200),
+    offset: int = Query(0, ge=0)
+):
+    """
+    Ranked full-text search over archived headlines and Pulse content
+    
+    Returns:
+        JSONResponse: {"items", "count", "cached", "took_ms"}; items carry a
+        bm25 "score" (lower is better) and a highlighted "snippet"
+    """
+    page = news_search.search(q, source=source, since=from_, until=to, limit=limit, offset=offset)
+    return JSONResponse(content={'success': True, 'query': q, **page})
+
+
+@app.post("/jobs")
+async def submit_job(
+    sources: str = Query(None, description="Comma-separated sources to scrape (default: all)"),
+    refresh: bool = Query(False, description="Bypass the cache and scrape now")
+):
+    """
+    Submit a scrape job and return immediately
+    
+    Poll GET /jobs/{job_id} for progress and results.
+    
+    Returns:
+        JSONResponse: 202 with the job id and status URL, 400 for
+        unknown sources, or 429 while the store is full of running jobs
+    """
+    try:
+        job = scrape_jobs.submit(source_registry.select(sources), refresh=refresh)
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={'success': False, 'error': str(e), 'available_sources': list(scrape_jobs.loaders)}
+        )
+    except JobStoreFull as e:
+        return JSONResponse(
+            status_code=429,
+            content={'success': False, 'error': str(e)},
+            headers={'Retry-After': '30'}
+        )
+    
+    status_url = f"/jobs/{job.job_id}"
+    return JSONResponse(
+        status_code=202,
+        content={
+            'success': True,
+            'job_id': job.job_id,
+            'status': job.status,
+            'sources': job.sources,
+            'status_url': status_url
+        },
+        headers={'Location': status_url}
+    )
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Status, per-source progress and (once available) results of a job
+    
+    Returns:
+        JSONResponse: Job details, or 404 if unknown or evicted
+    """
+    job = scrape_jobs.get(job_id)
+    if job is None:
+        return JSONResponse(
+            status_code=404,
+            content={'success': False, 'error': f"Job not found or expired: {job_id}"}
+        )
+    
+    return JSONResponse(content={'success': True, **job.to_dict()})
+
+
 @app.get("/scrape")
-async def scrape_news():
+async def scrape_news(
+    sources: str = Query(None, description="Comma-separated sources to scrape (default: all)"),
+    refresh: bool = Query(False, description="Bypass the cache and scrape now")
+):
     """
-    Scrape news from both Groww and Pulse in parallel
+    Scrape the selected sources concurrently
+    
+    Results are served from the per-source cache when available; each
+    source reports its cache status ("hit", "stale" or "fresh"). Sources
+    run in parallel, so the request takes as long as the slowest one.
     
     Returns:
-        JSONResponse: Combined results from both scrapers
-        
-    Note: This endpoint takes approximately 4 minutes to complete
-    (limited by Groww scraper which takes ~4 min)
+        JSONResponse: Combined results, or 400 for unknown sources
     """
+    try:
+        requested = source_registry.select(sources)
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={'success': False, 'error': str(e), 'available_sources': source_registry.names()}
+        )
+    
     start_time = datetime.now()
-    logger.info("Received scrape request, starting both scrapers in parallel...")
+    logger.info(f"Received scrape request, starting {requested} in parallel...")
     
     try:
-        # Create event loop to run both scrapers in parallel
-        loop = asyncio.get_event_loop()
-        
-        # Run both scrapers concurrently using thread pool
-        groww_future = loop.run_in_executor(executor, run_groww_scraper)
-        pulse_future = loop.run_in_executor(executor, run_pulse_scraper)
-        
-        # Wait for both to complete
-        logger.info("Waiting for both scrapers to complete...")
-        groww_result, pulse_result = await asyncio.gather(groww_future, pulse_future)
+        # Run every source concurrently on the thread pool (or serve cached results)
+        results = await source_registry.fan_out(
+            requested,
+            lambda source: response_cache.get(
+                source, source_registry.get(source).run, executor, force_refresh=refresh
+            )
+        )
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
-        logger.info(f"Both scrapers completed in {duration:.2f} seconds")
+        logger.info(f"All scrapers completed in {duration:.2f} seconds")
         
-        # Prepare combined response
         response = {
             'success': True,
             'timestamp': end_time.isoformat(),
             'duration_seconds': round(duration, 2),
-            'sources': {
-                'groww': {
-                    'success': groww_result.get('success', False),
-                    'data': groww_result.get('data'),
-                    'error': groww_result.get('error')
-                },
-                'pulse': {
-                    'success': pulse_result.get('success', False),
-                    'data': pulse_result.get('data'),
-                    'error': pulse_result.get('error')
-                }
-            },
-            'summary': {
-                'total_groww_items': len(groww_result.get('data', {}).get('news_items', [])) if groww_result.get('success') else 0,
-                'total_pulse_articles': len(pulse_result.get('data', {}).get('articles', [])) if pulse_result.get('success') else 0,
-                'total_items': (
-                    len(groww_result.get('data', {}).get('news_items', [])) +
-                    len(pulse_result.get('data', {}).get('articles', []))
-                ) if (groww_result.get('success') or pulse_result.get('success')) else 0
-            }
+            **source_registry.merge(results)
         }
         
-        # Save combined results to file
-        try:
-            timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"combined_news_{timestamp_str}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(response, f, indent=2, ensure_ascii=False)
-            logger.info(f"Combined results saved to: {filename}")
-            response['saved_to'] = filename
-        except Exception as e:
-            logger.error(f"Error saving combined results: {e}")
-        
-        return JSONResponse(content=response)
+        cache_infos = {source: info for source, (_, info) in results.items() if info}
+        return JSONResponse(
+            content=response,
+            headers=_cache_headers(cache_infos) if cache_infos else {}
+        )
         
     except Exception as e:
         logger.error(f"Error during scraping: {e}", exc_info=True)
@@ -293,58 +638,89 @@ async def scrape_news():
         )
 
 
-@app.get("/scrape/groww")
-async def scrape_groww_only():
+@app.get("/scrape/stream")
+async def scrape_news_stream(
+    sources: str = Query(None, description="Comma-separated sources to scrape (default: all)"),
+    format: str = Query("ndjson", description="ndjson or sse"),
+    refresh: bool = Query(False, description="Bypass the cache and scrape now")
+):
     """
-    Scrape news from Groww only
+    Stream scraped records as each source finishes
+    
+    Emits one "item" event per article / news item / index / stock record,
+    a "source_done" event per source and a final "summary" event.
     
     Returns:
-        JSONResponse: Groww scraper results
+        StreamingResponse: NDJSON or text/event-stream body
     """
-    logger.info("Received Groww-only scrape request...")
-    
+    fmt = format.strip().lower()
     try:
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(executor, run_groww_scraper)
-        
-        return JSONResponse(content=result)
-        
-    except Exception as e:
-        logger.error(f"Error during Groww scraping: {e}", exc_info=True)
+        requested = source_registry.select(sources)
+        error = None if fmt in MEDIA_TYPES else f"Invalid request (format={format})"
+    except ValueError as e:
+        error = str(e)
+    if error:
         return JSONResponse(
-            status_code=500,
+            status_code=400,
             content={
                 'success': False,
-                'source': 'groww',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'error': error,
+                'available_sources': source_registry.names(),
+                'available_formats': list(MEDIA_TYPES)
             }
         )
+    
+    logger.info(f"Received streaming scrape request for {requested} ({fmt})")
+    
+    async def fetch(source: str):
+        return await response_cache.get(source, source_registry.get(source).run, executor, force_refresh=refresh)
+    
+    return StreamingResponse(
+        stream_scrape([source_registry.get(name) for name in requested], fetch, fmt=fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 
-@app.get("/scrape/pulse")
-async def scrape_pulse_only():
+@app.get("/scrape/{source}")
+async def scrape_one_source(
+    source: str,
+    refresh: bool = Query(False, description="Bypass the cache and scrape now")
+):
     """
-    Scrape news from Pulse only
+    Scrape one source only
+    
+    Args:
+        source: A registered source name ("groww", "pulse", ...)
     
     Returns:
-        JSONResponse: Pulse scraper results
+        JSONResponse: The source's result (cached per CACHE_TTL_<SOURCE>),
+        or 404 for unknown sources
     """
-    logger.info("Received Pulse-only scrape request...")
+    news_source = source_registry.get(source)
+    if news_source is None:
+        return JSONResponse(
+            status_code=404,
+            content={'success': False, 'error': f"Unknown source: {source}", 'available_sources': source_registry.names()}
+        )
+    
+    logger.info(f"Received {source}-only scrape request...")
     
     try:
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(executor, run_pulse_scraper)
+        result, cache_info = await response_cache.get(source, news_source.run, executor, force_refresh=refresh)
         
-        return JSONResponse(content=result)
+        return JSONResponse(
+            content={**result, 'cache': cache_info},
+            headers=_cache_headers({source: cache_info})
+        )
         
     except Exception as e:
-        logger.error(f"Error during Pulse scraping: {e}", exc_info=True)
+        logger.error(f"Error during {source} scraping: {e}", exc_info=True)
         return JSONResponse(
             status_code=500,
             content={
                 'success': False,
-                'source': 'pulse',
+                'source': source,
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
@@ -364,9 +740,17 @@ if __name__ == "__main__":
     print("\nStarting server...")
     print(f"API will be available at: http://localhost:{port}")
     print("\nEndpoints:")
-    print("  - GET /scrape       - Run both scrapers in parallel")
-    print("  - GET /scrape/groww - Run Groww scraper only")
-    print("  - GET /scrape/pulse - Run Pulse scraper only")
+    print("  - GET /scrape       - Run every source in parallel (?sources=)")
+    print("  - GET /scrape/{source} - Run one source only")
+    print("  - GET /scrape/stream - Stream results as NDJSON/SSE")
+    print("  - GET /news/latest  - Latest background-refreshed snapshots")
+    print("  - GET /timeline     - New items since a cursor")
+    print("  - GET /archive/...  - Query archived scrape history")
+    print("  - GET /search       - Full-text headline search")
+    print("  - POST /jobs        - Submit a background scrape job")
+    print("  - GET /jobs/{id}    - Poll a scrape job")
+    print("  - GET /metrics      - Prometheus metrics")
+    print("  - GET /debug/traces/{id} - Span breakdown of one request")
     print("  - GET /health       - Health check")
     print(f"\nDocumentation: http://localhost:{port}/docs")
     print("=" * 80 + "\n")
@@ -0,0 +1,469 @@
+"""
+News Archive
+============
+
+SQLite store for scrape history, replacing the timestamped
+combined_news_*.json files. Each successful scrape is one row in `runs`;
+its records go into indexed tables:
+
+- articles        Each source's headlines (its items_key), upserted by stable ID
+- index_readings  One row per index per run (sources with an index_key)
+- stock_rows      One row per stock per table (its stock_sections) per run
+
+Runs older than the retention window are pruned together with their
+readings, stock rows and any article not seen since.
+
+Article headlines and content are full-text indexed (SQLite FTS5, kept in
+sync by triggers as each run lands) for search_articles().
+
+Usage:
+    archive = NewsArchive('news_archive.db', retention_days=7)
+    archive.record_run(registry.get('groww'), result['data'])
+    archive.query_articles(source='pulse', since='2025-01-01T00:00:00')
+"""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+from groww_embedded import parse_change, parse_number
+from news_timeline import article_id, parse_relative_time
+
+if TYPE_CHECKING:
+    from news_sources import NewsSource
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    item_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_source_time ON runs (source, scraped_at);
+
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    publisher TEXT,
+    headline TEXT NOT NULL,
+    url TEXT,
+    content TEXT,
+    time_text TEXT,
+    published_at TEXT,
+    stock_name TEXT COLLATE NOCASE,
+    stock_change_pct REAL,
+    first_seen_run INTEGER NOT NULL,
+    last_seen_run INTEGER NOT NULL,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source_time ON articles (source, published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_time ON articles (published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_stock ON articles (stock_name);
+CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen_at);
+
+CREATE TABLE IF NOT EXISTS index_readings (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL COLLATE NOCASE,
+    value REAL,
+    change REAL,
+    change_pct REAL,
+    value_text TEXT,
+    change_text TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_index_readings_name_run ON index_readings (name, run_id);
+CREATE INDEX IF NOT EXISTS idx_index_readings_run ON index_readings (run_id);
+
+CREATE TABLE IF NOT EXISTS stock_rows (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    name TEXT NOT NULL COLLATE NOCASE,
+    price REAL,
+    change REAL,
+    change_pct REAL,
+    price_text TEXT,
+    change_text TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_stock_rows_name_run ON stock_rows (name, run_id);
+CREATE INDEX IF NOT EXISTS idx_stock_rows_section_run ON stock_rows (section, run_id);
+"""
+
+# External-content FTS index over articles; triggers index each upsert
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    headline, content, content='articles', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, headline, content) VALUES (new.rowid, new.headline, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, headline, content)
+    VALUES ('delete', old.rowid, old.headline, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF headline, content ON articles
+WHEN old.content IS NOT new.content OR old.headline IS NOT new.headline BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, headline, content)
+    VALUES ('delete', old.rowid, old.headline, old.content);
+    INSERT INTO articles_fts (rowid, headline, content) VALUES (new.rowid, new.headline, new.content);
+END;
+"""
+
+_FTS_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class NewsArchive:
+    """Thread-safe SQLite archive of scrape runs"""
+
+    def __init__(self, path: str = 'news_archive.db', retention_days: float = 7,
+                 prune_interval: float = 600):
+        """
+        Open (and create if needed) the archive
+
+        Args:
+            path: SQLite file path (":memory:" for a throwaway archive)
+            retention_days: Runs older than this are pruned
+            prune_interval: Minimum seconds between automatic prunes
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        self.fts_enabled = True
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA foreign_keys=ON')
+            self._conn.executescript(SCHEMA)
+            self._init_fts()
+            self._conn.commit()
+
+    def _init_fts(self):
+        """Create the FTS index, backfilling it for archives created before it existed"""
+        existed = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone() is not None
+        try:
+            self._conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable ({e}), search falls back to LIKE")
+            self.fts_enabled = False
+            return
+        if not existed:
+            self._conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def record_run(self, source: 'NewsSource', data: Dict[str, Any]) -> int:
+        """
+        Store one successful scrape
+
+        Args:
+            source: Source that produced it; its items_key, index_key and
+                stock_sections say where the records are
+            data: The result's "data" dict
+
+        Returns:
+            int: The new run id
+        """
+        scraped_at = data.get('scraped_at') or data.get('scrape_timestamp') or _now_iso()
+        scraped_at = scraped_at[:19]
+        items = data.get(source.items_key) or []
+
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                'INSERT INTO runs (source, scraped_at, item_count) VALUES (?, ?, ?)',
+                (source.name, scraped_at, len(items))
+            )
+            run_id = cur.lastrowid
+            self._upsert_articles(source.name, run_id, scraped_at, items)
+            if source.index_key:
+                self._insert_indices(run_id, data.get(source.index_key) or [])
+            if source.stock_sections:
+                self._insert_stock_rows(run_id, data, source.stock_sections)
+
+        logger.info(f"Archived {source.name} run {run_id} ({len(items)} items)")
+        self.prune()
+        return run_id
+
+    def _upsert_articles(self, source: str, run_id: int, scraped_at: str, items: List[Dict]):
+        observed = datetime.fromisoformat(scraped_at)
+        rows = []
+        for item in items:
+            headline = (item.get('headline') or '').strip()
+            if not headline:
+                continue
+            url = item.get('article_url') or ''
+            time_text = item.get('time') or item.get('time_ago') or ''
+            published = parse_relative_time(time_text, observed)
+            pct = item.get('stock_change_pct')
+            if pct is None:
+                pct = parse_number(item.get('stock_change'))
+            rows.append((
+                item.get('id') or article_id(headline, url),
+                source,
+                item.get('source') or '',
+                headline,
+                url,
+                item.get('content') or '',
+                time_text,
+                (published or observed).isoformat(timespec='seconds'),
+                item.get('stock_name') or item.get('related_stock') or None,
+                pct,
+                run_id, run_id, scraped_at, scraped_at
+            ))
+
+        # First sighting keeps its published_at; later runs only bump last_seen
+        self._conn.executemany(
+            """
+            INSERT INTO articles (id, source, publisher, headline, url, content, time_text,
+                                  published_at, stock_name, stock_change_pct,
+                                  first_seen_run, last_seen_run, first_seen_at, last_seen_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                last_seen_run = excluded.last_seen_run,
+                last_seen_at = excluded.last_seen_at,
+                time_text = excluded.time_text,
+                content = CASE WHEN excluded.content != '' THEN excluded.content ELSE articles.content END,
+                stock_change_pct = COALESCE(excluded.stock_change_pct, articles.stock_change_pct)
+            """,
+            rows
+        )
+
+    def _insert_indices(self, run_id: int, indices: List[Dict]):
+        rows = []
+        for index in indices:
+            change, pct = parse_change(index.get('change'))
+            rows.append((
+                run_id,
+                index.get('name'),
+                index.get('value_num', parse_number(index.get('value'))),
+                index.get('change_num', change),
+                index.get('change_pct', pct),
+                index.get('value'),
+                index.get('change')
+            ))
+        self._conn.executemany(
+            'INSERT INTO index_readings (run_id, name, value, change, change_pct, value_text, change_text) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            rows
+        )
+
+    def _insert_stock_rows(self, run_id: int, data: Dict[str, Any], sections):
+        rows = []
+        for section in sections:
+            for rank, stock in enumerate(data.get(section) or [], 1):
+                change, pct = parse_change(stock.get('change'))
+                rows.append((
+                    run_id,
+                    section,
+                    rank,
+                    stock.get('name'),
+                    stock.get('price_num', parse_number(stock.get('price'))),
+                    stock.get('change_num', change),
+                    stock.get('change_pct', pct),
+                    stock.get('price'),
+                    stock.get('change')
+                ))
+        self._conn.executemany(
+            'INSERT INTO stock_rows (run_id, section, rank, name, price, change, change_pct, price_text, change_text) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            rows
+        )
+
+    def prune(self, force: bool = False) -> int:
+        """
+        Delete runs (and their rows) older than the retention window
+
+        Articles not seen since the cutoff are deleted as well.
+
+        Returns:
+            int: Number of runs deleted
+        """
+        if not force and time.time() - self._last_prune < self.prune_interval:
+            return 0
+        self._last_prune = time.time()
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat(timespec='seconds')
+
+        with self._lock, self._conn:
+            deleted = self._conn.execute('DELETE FROM runs WHERE scraped_at < ?', (cutoff,)).rowcount
+            self._conn.execute('DELETE FROM articles WHERE last_seen_at < ?', (cutoff,))
+        if deleted:
+            logger.info(f"Pruned {deleted} archive runs older than {cutoff}")
+        return deleted
+
+    def _query(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def query_runs(self, source: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent runs first"""
+        sql = 'SELECT id, source, scraped_at, item_count FROM runs'
+        params = []
+        if source:
+            sql += ' WHERE source = ?'
+            params.append(source)
+        sql += ' ORDER BY id DESC LIMIT ?'
+        params.append(limit)
+        return self._query(sql, params)
+
+    def query_articles(self, source: Optional[str] = None, since: Optional[str] = None,
+                       until: Optional[str] = None, stock: Optional[str] = None,
+                       limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Articles newest first
+
+        Args:
+            source: "groww" or "pulse"
+            since: ISO timestamp, inclusive lower bound on published_at
+            until: ISO timestamp, exclusive upper bound on published_at
+            stock: Related stock name (case-insensitive, Groww items only)
+            limit: Page size
+            offset: Rows to skip
+        """
+        clauses, params = [], []
+        if source:
+            clauses.append('source = ?')
+            params.append(source)
+        if since:
+            clauses.append('published_at >= ?')
+            params.append(since)
+        if until:
+            clauses.append('published_at < ?')
+            params.append(until)
+        if stock:
+            clauses.append('stock_name = ?')
+            params.append(stock)
+
+        sql = 'SELECT * FROM articles'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY published_at DESC LIMIT ? OFFSET ?'
+        params += [limit, offset]
+        return self._query(sql, params)
+
+    @staticmethod
+    def fts_query(text: str) -> Optional[str]:
+        """
+        Turn free text into a safe FTS5 query
+
+        Every word must match; the last word also matches as a prefix so
+        "reliance ind" finds "Reliance Industries".
+        """
+        tokens = _FTS_TOKEN_PATTERN.findall(text or '')
+        if not tokens:
+            return None
+        terms = [f'"{token}"' for token in tokens]
+        terms[-1] += '*'
+        return ' '.join(terms)
+
+    def search_articles(self, text: str, source: Optional[str] = None, since: Optional[str] = None,
+                        until: Optional[str] = None, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search over article headlines and content
+
+        Args:
+            text: Free-text query
+            source: "groww" or "pulse"
+            since: ISO timestamp, inclusive lower bound on published_at
+            until: ISO timestamp, exclusive upper bound on published_at
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            list: Articles best match first, each with a "score" (lower is
+            better) and a highlighted "snippet"
+        """
+        query = self.fts_query(text)
+        if not query:
+            return []
+
+        clauses, params = [], []
+        if source:
+            clauses.append('a.source = ?')
+            params.append(source)
+        if since:
+            clauses.append('a.published_at >= ?')
+            params.append(since)
+        if until:
+            clauses.append('a.published_at < ?')
+            params.append(until)
+        filters = ''.join(f' AND {clause}' for clause in clauses)
+
+        if not self.fts_enabled:
+            like = [f'%{token}%' for token in _FTS_TOKEN_PATTERN.findall(text)]
+            matches = ' AND '.join("(a.headline LIKE ? OR a.content LIKE ?)" for _ in like)
+            sql = (f"SELECT a.*, 0.0 AS score, a.headline AS snippet FROM articles a "
+                   f"WHERE {matches}{filters} ORDER BY a.published_at DESC LIMIT ? OFFSET ?")
+            like_params = [p for term in like for p in (term, term)]
+            return self._query(sql, like_params + params + [limit, offset])
+
+        # Headline matches weigh 4x content matches; ties go to newer items
+        sql = (
+            "SELECT a.*, bm25(articles_fts, 4.0, 1.0) AS score, "
+            "snippet(articles_fts, -1, '<b>', '</b>', '…', 16) AS snippet "
+            "FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid "
+            f"WHERE articles_fts MATCH ?{filters} "
+            "ORDER BY score, a.published_at DESC LIMIT ? OFFSET ?"
+        )
+        return self._query(sql, [query] + params + [limit, offset])
+
+    def _run_rows(self, table: str, columns: str, filters: Dict[str, Any],
+                  since: Optional[str], until: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        for column, value in filters.items():
+            if value:
+                clauses.append(f't.{column} = ?')
+                params.append(value)
+        if since:
+            clauses.append('r.scraped_at >= ?')
+            params.append(since)
+        if until:
+            clauses.append('r.scraped_at < ?')
+            params.append(until)
+
+        sql = f'SELECT r.scraped_at, t.run_id, {columns} FROM {table} t JOIN runs r ON r.id = t.run_id'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY t.run_id DESC LIMIT ?'
+        params.append(limit)
+        return self._query(sql, params)
+
+    def query_indices(self, name: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """Index readings newest run first"""
+        return self._run_rows(
+            'index_readings', 't.name, t.value, t.change, t.change_pct, t.value_text, t.change_text',
+            {'name': name}, since, until, limit
+        )
+
+    def query_stocks(self, name: Optional[str] = None, section: Optional[str] = None,
+                     since: Optional[str] = None, until: Optional[str] = None,
+                     limit: int = 200) -> List[Dict[str, Any]]:
+        """Stock-table rows newest run first"""
+        return self._run_rows(
+            'stock_rows', 't.section, t.rank, t.name, t.price, t.change, t.change_pct, t.price_text, t.change_text',
+            {'name': name, 'section': section}, since, until, limit
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        counts = {}
+        with self._lock:
+            for table in ('runs', 'articles', 'index_readings', 'stock_rows'):
+                counts[table] = self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        return {'path': self.path, 'retention_days': self.retention_days, 'rows': counts}
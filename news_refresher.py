@@ -0,0 +1,167 @@
+"""
+Background News Refresher
+=========================
+
+Runs each scraper on a fixed interval off the request path and publishes
+every good result as an immutable Snapshot. Publishing swaps in a new
+source -> Snapshot mapping with a single reference assignment, so readers
+always see a complete snapshot and never wait on a running scrape.
+
+Usage:
+    refresher = NewsRefresher(registry.loaders(), registry.refresh_intervals(), executor)
+    refresher.start()
+    snapshot = refresher.latest('groww')
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, NamedTuple, Optional
+import asyncio
+import logging
+import time
+
+from single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot(NamedTuple):
+    """One published scraper result; never modified after publishing"""
+    source: str
+    version: int
+    result: Dict[str, Any]
+    published_at: float
+    duration_seconds: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.published_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Response body for this snapshot"""
+        return {
+            'success': True,
+            'source': self.source,
+            'version': self.version,
+            'published_at': datetime.fromtimestamp(self.published_at).isoformat(),
+            'age_seconds': round(self.age, 1),
+            'scrape_duration_seconds': round(self.duration_seconds, 2),
+            'data': self.result.get('data')
+        }
+
+
+class NewsRefresher:
+    """Periodic scraper runs feeding an atomically swapped snapshot map"""
+
+    def __init__(self, loaders: Dict[str, Callable[[], Dict[str, Any]]], intervals: Dict[str, float],
+                 executor, retry_interval: float = 60,
+                 on_publish: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 single_flight: Optional[SingleFlight] = None):
+        """
+        Initialize the refresher
+
+        Args:
+            loaders: Blocking scraper function per source
+            intervals: Seconds between successful runs, per source
+            executor: Executor the loaders run on
+            retry_interval: Seconds before retrying after a failed run
+            on_publish: Called with (source, result) after each publish
+            single_flight: Coalescer shared with the request-path scrapes
+        """
+        self.loaders = dict(loaders)
+        self.intervals = dict(intervals)
+        self.executor = executor
+        self.retry_interval = retry_interval
+        self.on_publish = on_publish
+        self.single_flight = single_flight or SingleFlight()
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._runs = {source: 0 for source in self.loaders}
+        self._failures = {source: 0 for source in self.loaders}
+        self._last_error: Dict[str, str] = {}
+
+    def latest(self, source: str) -> Optional[Snapshot]:
+        """Current snapshot for source, or None before its first good run"""
+        return self._snapshots.get(source)
+
+    def snapshots(self) -> Dict[str, Snapshot]:
+        """Current snapshots for all sources (a consistent view)"""
+        return self._snapshots
+
+    def _publish(self, source: str, result: Dict[str, Any], duration: float):
+        previous = self._snapshots.get(source)
+        snapshot = Snapshot(
+            source=source,
+            version=previous.version + 1 if previous else 1,
+            result=result,
+            published_at=time.time(),
+            duration_seconds=duration
+        )
+        # Copy-on-write: readers holding the old mapping are unaffected
+        self._snapshots = {**self._snapshots, source: snapshot}
+        logger.info(f"Published {source} snapshot v{snapshot.version} ({duration:.1f}s scrape)")
+
+        if self.on_publish:
+            try:
+                self.on_publish(source, result)
+            except Exception as e:
+                logger.error(f"on_publish for {source} failed: {e}", exc_info=True)
+
+    async def refresh(self, source: str) -> bool:
+        """
+        Run one scrape for source and publish it if it succeeded
+
+        Returns:
+            bool: True if a new snapshot was published
+        """
+        self._runs[source] += 1
+        start = time.time()
+        try:
+            result = await self.single_flight.do(source, self.loaders[source], self.executor)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+
+        if result and result.get('success'):
+            self._last_error.pop(source, None)
+            self._publish(source, result, time.time() - start)
+            return True
+
+        self._failures[source] += 1
+        self._last_error[source] = (result or {}).get('error') or 'No result'
+        logger.warning(f"Background refresh of {source} failed: {self._last_error[source]}")
+        return False
+
+    async def _run_forever(self, source: str):
+        interval = self.intervals.get(source, 300)
+        while True:
+            published = await self.refresh(source)
+            await asyncio.sleep(interval if published else min(interval, self.retry_interval))
+
+    def start(self):
+        """Start one refresh loop per source on the running event loop"""
+        for source in self.loaders:
+            if source not in self._tasks:
+                self._tasks[source] = asyncio.ensure_future(self._run_forever(source))
+        logger.info(f"Background refresh started for {list(self._tasks)}")
+
+    def stop(self):
+        """Cancel all refresh loops"""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-source refresher state for the health endpoint"""
+        snapshots = self._snapshots
+        stats = {}
+        for source in self.loaders:
+            snapshot = snapshots.get(source)
+            stats[source] = {
+                'running': source in self._tasks,
+                'interval_seconds': self.intervals.get(source, 300),
+                'runs': self._runs[source],
+                'failures': self._failures[source],
+                'version': snapshot.version if snapshot else None,
+                'age_seconds': round(snapshot.age, 1) if snapshot else None,
+                'last_error': self._last_error.get(source)
+            }
+        return stats
@@ -0,0 +1,107 @@
+"""
+Headline Search
+===============
+
+Ranked full-text search over archived Groww and Pulse items for /search,
+with an LRU cache in front of the archive's FTS index. Cached pages are
+keyed on the normalized query and filters and expire after a short TTL, so
+a hot query is answered from memory across refreshes and picks up newly
+archived items within ttl seconds.
+
+Usage:
+    search = NewsSearch(archive, cache_size=256, ttl=30)
+    page = search.search('reliance', source='groww')
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+
+from news_archive import NewsArchive
+
+
+class LRUCache:
+    """Small thread-safe least-recently-used cache with optional expiry"""
+
+    def __init__(self, max_size: int = 256, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: 'OrderedDict[Any, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (self.ttl is None or time.monotonic() - entry[0] < self.ttl):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class NewsSearch:
+    """Cached full-text search over a NewsArchive"""
+
+    def __init__(self, archive: NewsArchive, cache_size: int = 256, ttl: float = 30):
+        """
+        Initialize search
+
+        Args:
+            archive: Archive holding the FTS index
+            cache_size: Number of result pages kept in the LRU cache
+            ttl: Seconds a cached page is served before the archive is queried again
+        """
+        self.archive = archive
+        self.cache = LRUCache(cache_size, ttl)
+
+    def search(self, q: str, source: Optional[str] = None, since: Optional[str] = None,
+               until: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """
+        Search archived items
+
+        Returns:
+            dict: {"items", "count", "cached", "took_ms"}
+        """
+        start = time.perf_counter()
+        normalized = ' '.join(q.lower().split())
+        key = (normalized, source, since, until, limit, offset)
+
+        items = self.cache.get(key)
+        cached = items is not None
+        if not cached:
+            items = self.archive.search_articles(
+                normalized, source=source, since=since, until=until, limit=limit, offset=offset
+            )
+            self.cache.put(key, items)
+
+        return {
+            'items': items,
+            'count': len(items),
+            'cached': cached,
+            'took_ms': round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'fts_enabled': self.archive.fts_enabled,
+            'cache_entries': len(self.cache),
+            'cache_ttl': self.cache.ttl,
+            'cache_hits': self.cache.hits,
+            'cache_misses': self.cache.misses
+        }
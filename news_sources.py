@@ -0,0 +1,454 @@
+"""
+News Sources
+============
+
+Pluggable scrape sources behind one interface, so the API endpoints never
+name individual sites. Each source implements three steps:
+- fetch(): load the raw page (HTML, captured responses, a live driver, ...)
+- extract(raw): parse it into a data dict
+- normalize(data): shape it for the API, headlines under items_key
+
+NewsSource.run() wraps the steps with per-stage metrics and trace spans,
+a per-source concurrency limit and uniform success/error results.
+SourceRegistry keeps sources by name, fans a scrape out across the
+selected sources concurrently and merges their results generically.
+
+Adding a source is one class and one register() call:
+
+    class MoneycontrolSource(NewsSource):
+        name = 'moneycontrol'
+
+        def fetch(self):
+            return get_http_session().get(URL, timeout=15).text
+
+        def extract(self, html):
+            return {'articles': parse_articles(html)}
+
+    registry.register(MoneycontrolSource())
+    results = await registry.fan_out(['groww', 'moneycontrol'], fetch)
+    response = registry.merge(results)
+
+Per-source environment overrides (name upper-cased):
+    CACHE_TTL_<NAME>, REFRESH_INTERVAL_<NAME>   Seconds
+    SOURCE_CONCURRENCY_<NAME>                   Concurrent runs of one source
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import threading
+
+from groww_html_parser import GROWW_PAGE_URL
+from groww_scraper_fixed import GrowwScraperFixed
+from pulse_html_parser import PULSE_PAGE_URL
+from pulse_http import PulseHTTPFetcher
+from pulse_zerodha_scraper import PulseZerodhaScraper
+from scrape_tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+class SourceError(Exception):
+    """An expected scrape failure, reported without a traceback"""
+
+
+class NewsSource(ABC):
+    """Base class for a scrape source: fetch -> extract -> normalize"""
+
+    name = ''
+    items_key = 'articles'      # Key in the normalized data holding headlines
+    item_kind = 'article'       # Record kind of those headlines in /scrape/stream
+    sections = ('articles',)    # Keys counted in scrape_items_total, streamed in this order
+    index_key = None            # Key holding index readings, archived per run
+    stock_sections = ()         # Keys holding ranked stock tables, archived per run
+    summary_key = None          # Summary count key (default total_<name>_items)
+    max_concurrency = 1         # Concurrent run() calls allowed
+    cache_ttl = 300             # Seconds a result stays fresh
+    refresh_interval = 300      # Background refresh interval
+
+    def __init__(self):
+        self.max_concurrency = int(os.getenv(f"SOURCE_CONCURRENCY_{self.name.upper()}", self.max_concurrency))
+        self._limit = threading.BoundedSemaphore(self.max_concurrency)
+        self._running = 0
+        self._running_lock = threading.Lock()
+        self.metrics = None     # ScrapeMetrics, set by SourceRegistry
+        self.on_success = None  # callable(name, data), set by SourceRegistry
+
+    @abstractmethod
+    def fetch(self) -> Any:
+        """Load the raw page; raise SourceError for expected failures"""
+
+    @abstractmethod
+    def extract(self, raw: Any) -> Optional[Dict[str, Any]]:
+        """Parse what fetch() returned"""
+
+    def normalize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape extracted data for the API response"""
+        return data
+
+    def release(self, raw: Any):
+        """Free anything fetch() handed over (e.g. a borrowed browser)"""
+
+    @contextmanager
+    def stage(self, stage: str):
+        """Time a step for /metrics and trace it as a span"""
+        timer = self.metrics.stage(self.name, stage) if self.metrics else nullcontext()
+        with tracer.span(f'{self.name}.{stage}'), timer:
+            yield
+
+    def count_failure(self, stage: str):
+        """Count a failure that didn't raise (e.g. a fallback was taken)"""
+        if self.metrics:
+            self.metrics.add_failure(self.name, stage)
+
+    def _record(self, data: Optional[Dict[str, Any]], outcome: str):
+        if not self.metrics:
+            return
+        if data:
+            for section in self.sections:
+                self.metrics.add_items(self.name, section, len(data.get(section) or []))
+            readiness = data.get('readiness')
+            if readiness:
+                self.metrics.observe(self.name, 'readiness_wait', readiness['total_wait_seconds'])
+        self.metrics.add_run(self.name, outcome)
+
+    def _error(self, error: str) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'source': self.name,
+            'error': error,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Fetch, extract, normalize and publish one scrape (blocking)
+
+        Returns:
+            dict: {"success": True, "source", "data"} or an error dict
+        """
+        with tracer.span(f'run_{self.name}_scraper'), self._limit:
+            with self._running_lock:
+                self._running += 1
+            try:
+                return self._run()
+            finally:
+                with self._running_lock:
+                    self._running -= 1
+
+    def _run(self) -> Dict[str, Any]:
+        try:
+            logger.info(f"Starting {self.name} scraper...")
+            raw = self.fetch()
+            try:
+                with self.stage('extract'):
+                    data = self.extract(raw)
+                    data = self.normalize(data) if data else None
+            finally:
+                self.release(raw)
+
+            items = (data or {}).get(self.items_key)
+            if not items:
+                logger.warning(f"{self.name} scraper returned no items")
+                self.count_failure('extract')
+                self._record(None, 'empty')
+                return self._error(f"No {self.items_key.replace('_', ' ')} found")
+
+            logger.info(f"{self.name} scraper completed: {len(items)} items")
+            if self.on_success:
+                with self.stage('publish'):
+                    self.on_success(self.name, data)
+            self._record(data, 'success')
+            return {'success': True, 'source': self.name, 'data': data}
+
+        except SourceError as e:
+            logger.error(f"{self.name} scraper failed: {e}")
+            self._record(None, 'error')
+            return self._error(str(e))
+        except Exception as e:
+            logger.error(f"Error in {self.name} scraper: {e}", exc_info=True)
+            self._record(None, 'error')
+            return self._error(str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        return {'max_concurrency': self.max_concurrency, 'running': self._running}
+
+
+class SourceRegistry:
+    """Sources by name, concurrent fan-out and generic result merging"""
+
+    def __init__(self, metrics=None, on_success: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 max_parallel: int = 0):
+        """
+        Initialize the registry
+
+        Args:
+            metrics: ScrapeMetrics every source reports its stages to
+            on_success: Called with (name, data) after each good scrape
+                (timeline ingest, archiving, ...)
+            max_parallel: Most sources one fan-out runs at once (0: all)
+        """
+        self.metrics = metrics
+        self.on_success = on_success
+        self.max_parallel = max_parallel
+        self._sources: Dict[str, NewsSource] = {}
+        self._fan_out_limit = asyncio.Semaphore(max_parallel) if max_parallel > 0 else None
+
+    def register(self, source: NewsSource) -> NewsSource:
+        """
+        Add a source
+
+        Raises:
+            ValueError: The source has no name or the name is taken
+        """
+        if not source.name:
+            raise ValueError(f"{type(source).__name__} has no name")
+        if source.name in self._sources:
+            raise ValueError(f"Source already registered: {source.name}")
+        source.metrics = self.metrics
+        source.on_success = self.on_success
+        self._sources[source.name] = source
+        return source
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def get(self, name: str) -> Optional[NewsSource]:
+        return self._sources.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._sources)
+
+    def loaders(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """Blocking scrape function per source (for the cache, refresher and jobs)"""
+        return {name: source.run for name, source in self._sources.items()}
+
+    def cache_ttls(self) -> Dict[str, float]:
+        return {name: float(os.getenv(f"CACHE_TTL_{name.upper()}", s.cache_ttl)) for name, s in self._sources.items()}
+
+    def refresh_intervals(self) -> Dict[str, float]:
+        return {
+            name: float(os.getenv(f"REFRESH_INTERVAL_{name.upper()}", s.refresh_interval))
+            for name, s in self._sources.items()
+        }
+
+    def select(self, sources: Optional[str]) -> List[str]:
+        """
+        Parse a comma-separated ?sources= value
+
+        Args:
+            sources: e.g. "groww,pulse"; None or empty selects every source
+
+        Returns:
+            list: Source names, in request order without duplicates
+
+        Raises:
+            ValueError: Some names are not registered
+        """
+        requested = [s.strip().lower() for s in (sources or '').split(',') if s.strip()]
+        if not requested:
+            return self.names()
+        unknown = [s for s in requested if s not in self._sources]
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+        return list(dict.fromkeys(requested))
+
+    async def fan_out(self, names: List[str],
+                      fetch: Callable[[str], Awaitable[Tuple[Dict[str, Any], Dict[str, Any]]]]
+                      ) -> Dict[str, Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Fetch every selected source concurrently
+
+        Args:
+            names: Sources to scrape
+            fetch: Coroutine function name -> (result, cache_info), e.g. a
+                response cache lookup running source.run on the executor
+
+        Returns:
+            dict: name -> (result, cache_info) in the order of names; a
+            fetch that raised becomes an error result with no cache info
+        """
+        async def one(name: str):
+            limit = self._fan_out_limit or nullcontext()
+            async with limit:
+                try:
+                    return await fetch(name)
+                except Exception as e:
+                    logger.error(f"Fan-out to {name} raised: {e}", exc_info=True)
+                    return {'success': False, 'source': name, 'error': str(e)}, None
+
+        results = await asyncio.gather(*(one(name) for name in names))
+        return dict(zip(names, results))
+
+    def merge(self, results: Dict[str, Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+        """
+        Combine per-source results into the /scrape response body
+
+        Returns:
+            dict: {"sources": {name: {success, data, error, cache}},
+            "summary": {total_<name>_items..., total_items}}
+        """
+        sources, summary, total = {}, {}, 0
+        for name, (result, cache_info) in results.items():
+            source = self._sources[name]
+            sources[name] = {
+                'success': result.get('success', False),
+                'data': result.get('data'),
+                'error': result.get('error'),
+                'cache': cache_info
+            }
+            count = len((result.get('data') or {}).get(source.items_key) or []) if result.get('success') else 0
+            summary[source.summary_key or f'total_{name}_items'] = count
+            total += count
+        summary['total_items'] = total
+        return {'sources': sources, 'summary': summary}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'sources': {name: source.stats() for name, source in self._sources.items()},
+            'max_parallel': self.max_parallel
+        }
+
+
+class GrowwSource(NewsSource):
+    """Groww market page through a pooled browser, parsed off the browser"""
+
+    name = 'groww'
+    items_key = 'news_items'
+    item_kind = 'news'
+    sections = ('news_items', 'indices', 'top_gainers', 'top_losers', 'most_bought', 'most_traded')
+    index_key = 'indices'
+    stock_sections = ('top_gainers', 'top_losers', 'most_bought', 'most_traded')
+    summary_key = 'total_groww_items'
+    cache_ttl = 300
+    refresh_interval = 300
+
+    def __init__(self, browser_pool, parse_mode: str = "snapshot", url: Optional[str] = None):
+        """
+        Args:
+            browser_pool: BrowserPool the page is loaded in
+            parse_mode: "snapshot" (page source) or "network" (captured API responses)
+            url: Page URL override (default GROWW_URL)
+        """
+        super().__init__()
+        self.browser_pool = browser_pool
+        self.parse_mode = parse_mode
+        self.url = url or GROWW_PAGE_URL
+
+    def fetch(self):
+        with self.stage('browser_acquire'):
+            session = self.browser_pool.acquire()
+        try:
+            scraper = GrowwScraperFixed(headless=True, driver=session.driver, parse_mode=self.parse_mode, url=self.url)
+
+            # Only the page load needs the browser; it goes back to the pool
+            # before the snapshot (or captured responses) is parsed
+            with self.stage('page_load'):
+                if self.parse_mode == "network":
+                    page = scraper.capture_network()
+                else:
+                    page = scraper.take_snapshot()
+        finally:
+            self.browser_pool.release(session)
+        return scraper, page
+
+    def extract(self, raw):
+        scraper, page = raw
+        if self.parse_mode == "network":
+            return scraper.parse_network(page)
+        return scraper.parse_snapshot(page)
+
+    def normalize(self, data):
+        metadata = data.get('metadata', {})
+        return {
+            'scraped_at': metadata.get('scraped_at'),
+            'url': metadata.get('url'),
+            'news_items': data.get('news', []),  # Map 'news' to 'news_items' for compatibility
+            'indices': data.get('indices', []),
+            'top_gainers': data.get('top_gainers', []),
+            'top_losers': data.get('top_losers', []),
+            'most_bought': data.get('most_bought', []),
+            'most_traded': data.get('most_traded', []),
+            'readiness': metadata.get('readiness'),
+            'network': metadata.get('network')
+        }
+
+
+class PulseSource(NewsSource):
+    """Pulse by Zerodha: HTTP fetch first, pooled browser as the fallback"""
+
+    name = 'pulse'
+    items_key = 'articles'
+    sections = ('articles',)
+    summary_key = 'total_pulse_articles'
+    cache_ttl = 120
+    refresh_interval = 120
+
+    def __init__(self, browser_pool, fetch_mode: str = "http", url: Optional[str] = None):
+        """
+        Args:
+            browser_pool: BrowserPool for the browser path
+            fetch_mode: "http" tries a browserless fetch first and falls back
+                to Chrome only if the result is empty or malformed;
+                "browser" always uses Chrome
+            url: Page URL override (default PULSE_URL)
+        """
+        super().__init__()
+        self.browser_pool = browser_pool
+        self.fetch_mode = fetch_mode
+        self.url = url or PULSE_PAGE_URL
+
+    def fetch(self):
+        if self.fetch_mode == "http":
+            with self.stage('http_fetch'):
+                news_data = PulseHTTPFetcher(url=self.url).scrape_all_news()
+            if PulseHTTPFetcher.is_usable(news_data):
+                return 'http', news_data
+            logger.warning("HTTP fetch empty or malformed, falling back to browser")
+            self.count_failure('http_fetch')
+
+        return 'browser', self._open_in_browser()
+
+    def _open_in_browser(self):
+        """Load the page in a pooled browser; the caller releases it"""
+        with self.stage('browser_acquire'):
+            session = self.browser_pool.acquire()
+        scraper = None
+        try:
+            scraper = PulseZerodhaScraper(headless=True, driver=session.driver, url=self.url)
+            with self.stage('driver_init'):
+                if not scraper._init_driver():
+                    raise SourceError('Failed to initialize browser')
+            with self.stage('page_load'):
+                if not scraper.navigate_to_page():
+                    raise SourceError('Failed to load page')
+        except BaseException:
+            if scraper is not None:
+                scraper.cleanup()
+            self.browser_pool.release(session)
+            raise
+        return scraper, session
+
+    def extract(self, raw):
+        fetch_path, page = raw
+        news_data = page if fetch_path == 'http' else page[0].scrape_all_news()
+        if news_data:
+            news_data['fetch_path'] = fetch_path
+        return news_data
+
+    def release(self, raw):
+        fetch_path, page = raw
+        if fetch_path == 'browser':
+            scraper, session = page
+            scraper.cleanup()
+            self.browser_pool.release(session)
@@ -0,0 +1,156 @@
+"""
+Streaming Scrape Output
+=======================
+
+Turns scraper results into a stream of NDJSON lines or Server-Sent Events
+for /scrape/stream. Sources are awaited independently and each one's
+records are written out as soon as that source finishes, so Pulse items
+reach the client without waiting for Groww. No combined document is built;
+the stream ends with a summary event.
+
+Event types:
+    item        - one article / news item / index / stock record
+    source_done - a source finished (item count, cache info, error)
+    summary     - totals for the whole request (always last)
+
+Usage:
+    async for chunk in stream_scrape([registry.get('groww'), registry.get('pulse')], fetch, fmt='sse'):
+        ...
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Tuple
+import asyncio
+import json
+import logging
+import time
+
+if TYPE_CHECKING:
+    from news_sources import NewsSource
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NDJSON = 'ndjson'
+FORMAT_SSE = 'sse'
+
+MEDIA_TYPES = {
+    FORMAT_NDJSON: 'application/x-ndjson',
+    FORMAT_SSE: 'text/event-stream',
+}
+
+def iter_records(source: 'NewsSource', result: Dict[str, Any]) -> Iterator[Tuple[str, Any, Dict]]:
+    """
+    Yield (kind, section, record) for every record in a scraper result
+
+    Headlines under items_key come first as item_kind, then the source's
+    other sections: its index_key as "index", stock_sections as "stock"
+    and anything else as "record", labelled with the section key.
+
+    Args:
+        source: Source that produced the result
+        result: Dict returned by its run()
+    """
+    data = result.get('data') or {}
+    for record in data.get(source.items_key) or []:
+        yield source.item_kind, None, record
+
+    for key in source.sections:
+        if key == source.items_key:
+            continue
+        if key == source.index_key:
+            kind, section = 'index', None
+        else:
+            kind, section = ('stock' if key in source.stock_sections else 'record'), key
+        for record in data.get(key) or []:
+            yield kind, section, record
+
+
+def format_event(event: str, payload: Dict[str, Any], fmt: str) -> str:
+    """Encode one event as an NDJSON line or an SSE frame"""
+    if fmt == FORMAT_SSE:
+        return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    return json.dumps({'event': event, **payload}, ensure_ascii=False) + "\n"
+
+
+def _keepalive(fmt: str) -> str:
+    # SSE comment lines are ignored by clients; NDJSON readers skip blank lines
+    return ": keep-alive\n\n" if fmt == FORMAT_SSE else "\n"
+
+
+async def stream_scrape(sources: List['NewsSource'],
+                        fetch: Callable[[str], Awaitable[Tuple[Dict[str, Any], Dict[str, Any]]]],
+                        fmt: str = FORMAT_NDJSON,
+                        heartbeat_seconds: float = 15) -> AsyncIterator[str]:
+    """
+    Run sources concurrently and stream their records as each finishes
+
+    Args:
+        sources: Sources to scrape
+        fetch: Coroutine function source name -> (result, cache_info)
+        fmt: "ndjson" or "sse"
+        heartbeat_seconds: Idle interval after which a keep-alive is sent
+
+    Yields:
+        str: Encoded events
+    """
+    start = time.time()
+    pending = {asyncio.ensure_future(fetch(source.name)): source for source in sources}
+    counts = {}
+    failed = {}
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, timeout=heartbeat_seconds, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                yield _keepalive(fmt)
+                continue
+
+            for task in done:
+                news_source = pending.pop(task)
+                source = news_source.name
+                cache_info = None
+                try:
+                    result, cache_info = task.result()
+                except Exception as e:
+                    logger.error(f"Streaming scrape of {source} raised: {e}", exc_info=True)
+                    result = {'success': False, 'error': str(e)}
+
+                count = 0
+                if result.get('success'):
+                    for kind, section, record in iter_records(news_source, result):
+                        payload = {'source': source, 'kind': kind, 'data': record}
+                        if section:
+                            payload['section'] = section
+                        yield format_event('item', payload, fmt)
+                        count += 1
+                else:
+                    failed[source] = result.get('error') or 'Unknown error'
+                counts[source] = count
+
+                done_payload = {
+                    'source': source,
+                    'success': bool(result.get('success')),
+                    'items': count,
+                    'elapsed_seconds': round(time.time() - start, 2)
+                }
+                if cache_info:
+                    done_payload['cache'] = cache_info
+                if source in failed:
+                    done_payload['error'] = failed[source]
+                yield format_event('source_done', done_payload, fmt)
+    finally:
+        # Client went away: let in-flight scrapes finish for other waiters
+        # (they are single-flight/cached), just stop waiting on them here
+        for task in pending:
+            task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
+
+    yield format_event('summary', {
+        'success': len(failed) < len(sources),
+        'timestamp': datetime.now().isoformat(),
+        'duration_seconds': round(time.time() - start, 2),
+        'items_per_source': counts,
+        'total_items': sum(counts.values()),
+        'errors': failed
+    }, fmt)
@@ -0,0 +1,184 @@
+"""
+Stable Article IDs and Unified Timeline
+=======================================
+
+Gives every Groww news item and Pulse article a content-derived ID (from
+its normalized headline and canonical URL) and merges all sources into one
+append-only, time-ordered timeline. Each newly seen item gets a
+monotonically increasing cursor, so polling clients can ask for "items
+after cursor N" and transfer only what changed.
+
+Usage:
+    timeline = NewsTimeline()
+    timeline.ingest('pulse', articles)
+    page = timeline.page(since=None, limit=50)
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import hashlib
+import logging
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+_RELATIVE_TIME_PATTERN = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(min(?:ute)?s?|hours?|hrs?|days?)\s*ago', re.IGNORECASE
+)
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'mc_cid', 'mc_eid'}
+
+
+def normalize_headline(headline: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    text = re.sub(r'[^\w\s]', ' ', (headline or '').lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def canonical_url(url: str) -> str:
+    """Lowercase scheme/host, drop fragment, tracking params and trailing slash"""
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query)
+        if not k.lower().startswith('utm_') and k.lower() not in _TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+def article_id(headline: str, url: str = '') -> str:
+    """
+    Stable ID for an item
+
+    Args:
+        headline: Item headline
+        url: Article URL, if the source provides one
+
+    Returns:
+        str: 16 hex characters, identical across scrapes of the same item
+    """
+    key = f"{normalize_headline(headline)}|{canonical_url(url)}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def parse_relative_time(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Convert "55 minutes ago" / "3.5 hours ago" into an estimated datetime"""
+    match = _RELATIVE_TIME_PATTERN.search(text or '')
+    if not match:
+        return None
+    amount = float(match.group(1))
+    unit = match.group(2).lower()
+    if unit.startswith('min'):
+        delta = timedelta(minutes=amount)
+    elif unit.startswith('h'):
+        delta = timedelta(hours=amount)
+    else:
+        delta = timedelta(days=amount)
+    return (now or datetime.now()) - delta
+
+
+class NewsTimeline:
+    """Bounded, cursor-addressable merge of all sources' items"""
+
+    def __init__(self, max_items: int = 2000):
+        """
+        Initialize the timeline
+
+        Args:
+            max_items: Oldest entries beyond this count are dropped
+        """
+        self.max_items = max_items
+        self._entries: List[Dict[str, Any]] = []
+        self._ids = set()
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def ingest(self, source: str, items: List[Dict[str, Any]]) -> int:
+        """
+        Add unseen items from one scrape (thread-safe)
+
+        Items already in the timeline keep their original cursor. New items
+        are appended oldest-first by estimated publish time.
+
+        Args:
+            source: "groww" or "pulse"
+            items: Scraped items (ids are assigned if missing)
+
+        Returns:
+            int: Number of new items
+        """
+        now = datetime.now()
+        fresh = []
+        for position, item in enumerate(items):
+            if 'id' not in item:
+                item['id'] = article_id(item.get('headline', ''), item.get('article_url', ''))
+            published = parse_relative_time(item.get('time') or item.get('time_ago') or '', now)
+            fresh.append((published or now, position, item))
+
+        # Pages list newest first, so a later position breaks ties as older
+        fresh.sort(key=lambda entry: (entry[0], -entry[1]))
+
+        added = 0
+        with self._lock:
+            for published, _, item in fresh:
+                if item['id'] in self._ids:
+                    continue
+                self._cursor += 1
+                self._ids.add(item['id'])
+                self._entries.append({
+                    **item,
+                    'source': item.get('source') or source,
+                    'origin': source,
+                    'cursor': str(self._cursor),
+                    'published_at': published.isoformat(timespec='seconds'),
+                    'first_seen_at': now.isoformat(timespec='seconds')
+                })
+                added += 1
+
+            overflow = len(self._entries) - self.max_items
+            if overflow > 0:
+                for entry in self._entries[:overflow]:
+                    self._ids.discard(entry['id'])
+                del self._entries[:overflow]
+
+        if added:
+            logger.info(f"Timeline: {added} new {source} items (cursor {self._cursor})")
+        return added
+
+    def page(self, since: Optional[int] = None, limit: int = 50, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Items after a cursor, oldest first
+
+        Args:
+            since: Cursor from a previous page; None returns the latest items
+            limit: Maximum items to return
+            source: Only items scraped from this source
+
+        Returns:
+            dict: {"items", "next_cursor", "has_more"}
+        """
+        with self._lock:
+            entries = self._entries
+            if source:
+                entries = [e for e in entries if e['origin'] == source]
+            if since is None:
+                selected = entries[-limit:] if limit else []
+                has_more = False
+            else:
+                newer = [e for e in entries if int(e['cursor']) > since]
+                selected = newer[:limit]
+                has_more = len(newer) > limit
+            latest = self._cursor
+
+        if selected:
+            next_cursor = selected[-1]['cursor']
+        else:
+            next_cursor = str(since if since is not None else latest)
+
+        return {'items': selected, 'next_cursor': next_cursor, 'has_more': has_more}
+
+    def stats(self) -> Dict[str, Any]:
+        return {'items': len(self._entries), 'latest_cursor': str(self._cursor), 'max_items': self.max_items}
@@ -0,0 +1,394 @@
+"""
+Page Readiness
+==============
+
+Event-driven replacement for the fixed time.sleep() calls around page
+loads and scrolls. A single execute_async_script call installs a
+MutationObserver in the page and resolves once:
+
+- the target selectors exist (and an optional text pattern is present), and
+- the DOM has had no mutations for a quiet period,
+
+or when a hard deadline passes. Every wait returns a report of how long
+it actually took, so slow pages show up in the scrape results instead of
+being hidden behind worst-case sleeps.
+
+Drivers should use the "eager" page-load strategy (see eager_options())
+so driver.get() returns at DOMContentLoaded and these waits take over.
+
+scroll_until_stable() drives lazy loading the same way: it jumps straight
+to a section heading, then scrolls a viewport at a time only while the
+section is still filling or the page is still growing.
+
+Drivers that share one WebDriver session with others (browser_pool.TabDriver)
+set script_poll_seconds. For them the script is started with a plain
+execute_script call and its result is polled from a window property, so
+the session is never held for the whole wait.
+
+Usage:
+    report = wait_until_ready(driver, ['h2 a[href]'], label='pulse')
+    report = wait_for_dom_quiet(driver, label='after scroll')
+    report = scroll_until_stable(driver, 'Stocks in news', r'\d+ hours? ago')
+"""
+
+from typing import Any, Dict, List, Optional
+import logging
+import os
+import time
+import uuid
+
+from scrape_tracing import current_span, traced
+
+logger = logging.getLogger(__name__)
+
+# Defaults, overridable per call or via environment
+DEFAULT_QUIET_MS = int(os.getenv("PAGE_QUIET_MS", "500"))
+DEFAULT_TIMEOUT = float(os.getenv("PAGE_READY_TIMEOUT", "15"))
+SCROLL_QUIET_MS = int(os.getenv("PAGE_SCROLL_QUIET_MS", "300"))
+SCROLL_TIMEOUT = float(os.getenv("PAGE_SCROLL_TIMEOUT", "3"))
+
+READY_JS = r"""
+const selectors = arguments[0] || [];
+const matchAll = arguments[1] === 'all';
+const textPattern = arguments[2] ? new RegExp(arguments[2], 'i') : null;
+const quietMs = arguments[3];
+const timeoutMs = arguments[4];
+const done = arguments[arguments.length - 1];
+
+const start = performance.now();
+let lastMutation = start;
+let mutations = 0;
+let foundAt = null;
+
+const present = () => {
+    if (selectors.length) {
+        const hits = selectors.map(s => { try { return !!document.querySelector(s); } catch (e) { return false; } });
+        if (matchAll ? !hits.every(Boolean) : !hits.some(Boolean)) return false;
+    }
+    return !textPattern || textPattern.test(document.body ? document.body.textContent : '');
+};
+
+const observer = new MutationObserver(records => {
+    mutations += records.length;
+    lastMutation = performance.now();
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+let timer = null;
+const finish = reason => {
+    clearInterval(timer);
+    observer.disconnect();
+    const now = performance.now();
+    done({
+        reason: reason,
+        elapsed_ms: Math.round(now - start),
+        found_ms: foundAt === null ? null : Math.round(foundAt - start),
+        quiet_ms: Math.round(now - lastMutation),
+        mutations: mutations
+    });
+};
+const check = () => {
+    const now = performance.now();
+    if (foundAt === null && present()) foundAt = now;
+    if (foundAt !== null && now - lastMutation >= quietMs) return finish('stable');
+    if (now - start >= timeoutMs) finish('deadline');
+};
+timer = setInterval(check, 50);
+check();
+"""
+
+SCROLL_UNTIL_STABLE_JS = r"""
+const targetText = (arguments[0] || '').toLowerCase();
+const itemPattern = new RegExp(arguments[1], 'i');
+const minItems = arguments[2];
+const quietMs = arguments[3];
+const timeoutMs = arguments[4];
+const done = arguments[arguments.length - 1];
+
+const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+const start = performance.now();
+let lastMutation = start;
+const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+// Element whose own text contains the section title
+const findHeading = () => {
+    if (!targetText) return null;
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        if (SKIP.has(node.parentElement.tagName)) continue;
+        if (node.nodeValue.toLowerCase().includes(targetText)) return node.parentElement;
+    }
+    return null;
+};
+
+// Items = leaf elements matching itemPattern in the nearest ancestor that has any
+const countItems = heading => {
+    let node = heading;
+    for (let level = 0; node && level < 7; level++, node = node.parentElement) {
+        let count = 0;
+        for (const el of node.querySelectorAll('*')) {
+            if (el.childElementCount === 0 && !SKIP.has(el.tagName) && itemPattern.test(el.textContent || '')) count++;
+        }
+        if (count) return count;
+    }
+    return 0;
+};
+
+let steps = 0;
+let jumped = false;
+let lastHeight = -1;
+let lastItems = -1;
+let stableRounds = 0;
+
+const finish = (reason, items) => {
+    observer.disconnect();
+    done({
+        reason: reason,
+        steps: steps,
+        elapsed_ms: Math.round(performance.now() - start),
+        items: items,
+        page_height: document.body.scrollHeight,
+        heading_found: jumped
+    });
+};
+
+const tick = () => {
+    const now = performance.now();
+    if (now - start >= timeoutMs) return finish('deadline', Math.max(lastItems, 0));
+    // Let whatever the last scroll triggered finish rendering
+    if (now - lastMutation < quietMs) return setTimeout(tick, 50);
+
+    const heading = findHeading();
+    const items = heading ? countItems(heading) : 0;
+    const height = document.body.scrollHeight;
+    stableRounds = (height === lastHeight && items === lastItems) ? stableRounds + 1 : 0;
+    lastHeight = height;
+    lastItems = items;
+
+    if (items >= minItems && stableRounds >= 1) return finish('stable', items);
+    if (items > 0 && stableRounds >= 2) return finish('stable', items);
+
+    // Section is full: hold position for one more quiet period to confirm
+    // the page height has stopped growing
+    if (items >= minItems) {
+        lastMutation = performance.now();
+        return setTimeout(tick, 50);
+    }
+
+    const atBottom = window.scrollY + window.innerHeight >= height - 2;
+    if (heading && !jumped) {
+        heading.scrollIntoView({block: 'start'});
+        jumped = true;
+    } else if (atBottom) {
+        if (stableRounds >= 2) return finish('bottom', items);
+    } else {
+        window.scrollBy(0, window.innerHeight);
+    }
+    steps++;
+    lastMutation = performance.now();
+    setTimeout(tick, 50);
+};
+tick();
+"""
+
+
+# Runs an async script body with its callback storing the result in
+# window[arguments[0]], so the caller can poll for it
+_START_POLLED_JS = """
+const key = arguments[0];
+const args = Array.prototype.slice.call(arguments, 1);
+window[key] = null;
+args.push(result => { window[key] = result; });
+(function () {
+/* body */
+}).apply(null, args);
+"""
+
+_POLL_RESULT_JS = "const key = arguments[0]; return key in window ? [window[key]] : null;"
+
+
+def _poll_async(driver, script: str, timeout: float, interval: float, *args):
+    """Start an async script, then poll for its result with short commands"""
+    key = f'__pageReadiness_{uuid.uuid4().hex}'
+    driver.execute_script(_START_POLLED_JS.replace('/* body */', script), key, *args)
+    deadline = time.time() + timeout + 5
+    while True:
+        time.sleep(interval)
+        state = driver.execute_script(_POLL_RESULT_JS, key)
+        if state is None:
+            raise RuntimeError("page navigated away before the script finished")
+        if state[0] is not None:
+            driver.execute_script("delete window[arguments[0]];", key)
+            return state[0]
+        if time.time() > deadline:
+            raise TimeoutError(f"script still running after {timeout + 5:.0f}s")
+
+
+def _execute_async(driver, script: str, timeout: float, *args):
+    """
+    Run an async script with a script timeout covering its deadline
+
+    The script timeout is session-wide, so the previous value is restored
+    afterwards instead of leaking to the next user of a pooled session.
+    Drivers with script_poll_seconds poll instead (see _poll_async).
+    """
+    interval = getattr(driver, 'script_poll_seconds', None)
+    if interval:
+        return _poll_async(driver, script, timeout, interval, *args)
+
+    try:
+        previous = driver.timeouts.script
+    except Exception:
+        previous = None
+    driver.set_script_timeout(timeout + 5)
+    try:
+        return driver.execute_async_script(script, *args)
+    finally:
+        if previous is not None:
+            try:
+                driver.set_script_timeout(previous)
+            except Exception as e:
+                logger.debug(f"Could not restore script timeout: {e}")
+
+
+def eager_options(options):
+    """Set the eager page-load strategy on ChromeOptions (returns them)"""
+    options.page_load_strategy = 'eager'
+    return options
+
+
+@traced('page.wait_until_ready')
+def wait_until_ready(driver, selectors: Optional[List[str]] = None, text_pattern: Optional[str] = None,
+                     match: str = 'any', quiet_ms: int = None, timeout: float = None,
+                     label: str = 'page') -> Dict[str, Any]:
+    """
+    Block until targets exist and the DOM is quiet, or the deadline passes
+
+    Args:
+        driver: Selenium WebDriver
+        selectors: CSS selectors that must exist ("any" or "all" per match)
+        text_pattern: Optional regex that must occur in the page text
+        match: "any" or "all" selectors
+        quiet_ms: Required mutation-free period in milliseconds
+        timeout: Hard deadline in seconds
+        label: Name used in logs and the report
+
+    Returns:
+        dict: {"label", "ready", "reason", "elapsed_seconds",
+        "found_seconds", "mutations"}; reason is "stable", "deadline"
+        or "error"
+    """
+    quiet_ms = DEFAULT_QUIET_MS if quiet_ms is None else quiet_ms
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+    start = time.time()
+
+    try:
+        result = _execute_async(
+            driver, READY_JS, timeout, selectors or [], match, text_pattern, quiet_ms, int(timeout * 1000)
+        ) or {}
+        reason = result.get('reason', 'error')
+        found_ms = result.get('found_ms')
+        mutations = result.get('mutations', 0)
+    except Exception as e:
+        # Page navigated away mid-wait or JS unavailable: fall back to the
+        # quiet period as a plain sleep so callers still get a settle delay
+        logger.warning(f"Readiness check for {label} failed ({e}), sleeping {quiet_ms} ms")
+        time.sleep(quiet_ms / 1000.0)
+        reason, found_ms, mutations = 'error', None, None
+
+    report = {
+        'label': label,
+        'ready': reason == 'stable',
+        'reason': reason,
+        'elapsed_seconds': round(time.time() - start, 3),
+        'found_seconds': round(found_ms / 1000.0, 3) if found_ms is not None else None,
+        'mutations': mutations
+    }
+    span = current_span()
+    if span:
+        span.set(label=label, reason=reason, mutations=mutations)
+    log = logger.info if report['ready'] else logger.warning
+    found = f"{report['found_seconds']}s" if report['found_seconds'] is not None else "never"
+    log(f"Ready[{label}]: {reason} after {report['elapsed_seconds']:.2f}s "
+        f"(targets found: {found}, mutations: {mutations})")
+    return report
+
+
+def wait_for_dom_quiet(driver, quiet_ms: int = None, timeout: float = None,
+                       label: str = 'settle') -> Dict[str, Any]:
+    """Wait only for a mutation-free period (e.g. after a scroll)"""
+    return wait_until_ready(
+        driver,
+        quiet_ms=SCROLL_QUIET_MS if quiet_ms is None else quiet_ms,
+        timeout=SCROLL_TIMEOUT if timeout is None else timeout,
+        label=label
+    )
+
+
+@traced('page.scroll_until_stable')
+def scroll_until_stable(driver, target_text: str, item_pattern: str, min_items: int = 10,
+                        quiet_ms: int = None, timeout: float = 30,
+                        label: str = 'lazy load') -> Dict[str, Any]:
+    """
+    Scroll only as far as needed to lazy-load one section
+
+    Jumps straight to the element containing target_text, then scrolls a
+    viewport at a time until the section holds min_items items (or its
+    item count and the page height stop changing), the bottom is reached,
+    or the deadline passes.
+
+    Args:
+        driver: Selenium WebDriver
+        target_text: Section title, e.g. "Stocks in news" (case-insensitive)
+        item_pattern: Regex matching one item's leaf text (e.g. "N hours ago")
+        min_items: Items that mark the section as loaded
+        quiet_ms: Mutation-free period to wait after each scroll
+        timeout: Hard deadline in seconds
+        label: Name used in logs and the report
+
+    Returns:
+        dict: Readiness report plus "steps", "items" and "page_height";
+        reason is "stable", "bottom", "deadline" or "error"
+    """
+    quiet_ms = SCROLL_QUIET_MS if quiet_ms is None else quiet_ms
+    start = time.time()
+
+    try:
+        result = _execute_async(
+            driver, SCROLL_UNTIL_STABLE_JS, timeout, target_text, item_pattern, min_items, quiet_ms,
+            int(timeout * 1000)
+        ) or {}
+    except Exception as e:
+        logger.warning(f"Adaptive scroll for {label} failed: {e}")
+        result = {'reason': 'error'}
+
+    report = {
+        'label': label,
+        'ready': result.get('reason') in ('stable', 'bottom'),
+        'reason': result.get('reason', 'error'),
+        'elapsed_seconds': round(time.time() - start, 3),
+        'found_seconds': None,
+        'mutations': None,
+        'steps': result.get('steps', 0),
+        'items': result.get('items', 0),
+        'page_height': result.get('page_height'),
+        'heading_found': result.get('heading_found', False)
+    }
+    span = current_span()
+    if span:
+        span.set(label=label, reason=report['reason'], steps=report['steps'], items=report['items'])
+    log = logger.info if report['ready'] else logger.warning
+    log(f"Scroll[{label}]: {report['reason']} after {report['steps']} steps / "
+        f"{report['elapsed_seconds']:.2f}s ({report['items']} items, height {report['page_height']})")
+    return report
+
+
+def summarize(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Total wait time plus the individual reports, for scrape metadata"""
+    return {
+        'total_wait_seconds': round(sum(r['elapsed_seconds'] for r in reports), 3),
+        'scroll_steps': sum(r.get('steps', 0) for r in reports),
+        'all_ready': all(r['ready'] for r in reports),
+        'waits': reports
+    }
@@ -0,0 +1,314 @@
+"""
+Pulse Snapshot Parser
+=====================
+
+Browser-free parsing for https://pulse.zerodha.com/. Pulse serves its article
+list in the initial HTML, so the same container heuristics used by
+PulseZerodhaScraper can run on the raw page source via html_dom.
+
+Also holds the text helpers shared by every Pulse extraction path
+(WebDriver walk, in-page script and HTTP fetch).
+
+Usage:
+    python pulse_html_parser.py saved_page.html
+"""
+
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+import json
+import os
+import re
+import sys
+
+from html_dom import parse_html
+
+PULSE_URL = "https://pulse.zerodha.com/"
+# Page the scrapers load (PULSE_URL env points them at standin_server.py)
+PULSE_PAGE_URL = os.getenv("PULSE_URL") or PULSE_URL
+
+_AGO_PATTERN = re.compile(r'\d+\s*(?:minutes?|hours?|days?)\s*ago', re.IGNORECASE)
+_METADATA_PATTERN = re.compile(r'(\d+(?:\.\d+)?\s*(?:minutes?|hours?|days?)\s*ago\s*[—–-].+)', re.IGNORECASE)
+
+
+def parse_time_and_source(metadata_text) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse metadata text to extract time and source
+    Format: "X hours/minutes ago — Source Name"
+
+    Args:
+        metadata_text: String containing time and source info
+
+    Returns:
+        tuple: (time_string, source_name) or (None, None)
+    """
+    if not metadata_text:
+        return None, None
+
+    # Pattern to match: "55 minutes ago — The Hindu Business"
+    # or "3.5 hours ago — Economic Times"
+    pattern = r'(\d+(?:\.\d+)?\s*(?:minutes?|hours?|days?)\s*ago)\s*[—–-]\s*(.+)'
+    match = re.search(pattern, metadata_text, re.IGNORECASE)
+
+    if match:
+        time_str = match.group(1).strip()
+        source = match.group(2).strip()
+        return time_str, source
+
+    # Try alternative patterns
+    # Pattern without separator (if format is different)
+    alt_pattern = r'(\d+(?:\.\d+)?\s*(?:minutes?|hours?|days?)\s*ago)(.+)'
+    alt_match = re.search(alt_pattern, metadata_text, re.IGNORECASE)
+
+    if alt_match:
+        time_str = alt_match.group(1).strip()
+        # Source is everything after time
+        source_part = alt_match.group(2).strip()
+        # Remove common separators
+        source = re.sub(r'^[—–-\s]+', '', source_part).strip()
+        if source:
+            return time_str, source
+
+    return None, None
+
+
+def content_from_text(article_text, headline) -> str:
+    """
+    Derive a summary from an article's visible text by dropping the
+    headline and metadata line
+
+    Args:
+        article_text: Full visible text of the article container
+        headline: Headline already extracted for this article
+
+    Returns:
+        str: Summary text, or '' if nothing usable remains
+    """
+    content = article_text
+
+    # Remove headline
+    if headline:
+        content = content.replace(headline, '', 1).strip()
+
+    # Remove metadata (find first line with "ago" and remove it)
+    lines = content.split('\n')
+    cleaned_lines = []
+    metadata_found = False
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Skip metadata line
+        if not metadata_found and 'ago' in line.lower() and _AGO_PATTERN.search(line):
+            metadata_found = True
+            continue
+
+        # Stop if we hit another article's headline pattern
+        # (headlines are typically title case and longer)
+        if metadata_found and len(line) > 40 and line[0].isupper() and 'ago' not in line.lower():
+            # Check if this might be another article
+            break
+
+        cleaned_lines.append(line)
+
+    content = ' '.join(cleaned_lines).strip()
+
+    # Truncate if too long
+    if len(content) > 500:
+        # Take first sentence or two
+        sentences = re.split(r'[.!?]\s+', content)
+        content = '. '.join(sentences[:2]) + '.'
+
+    if len(content) > 20 and len(content) < 1000:
+        return content
+    return ''
+
+
+def build_article(raw: Dict) -> Optional[Dict]:
+    """
+    Turn raw container fields into the public article schema
+
+    Args:
+        raw: {"headline", "article_url", "text", "meta": [...], "content_parts": [...]}
+
+    Returns:
+        dict or None: {"headline", "content", "source", "time", "article_url"}
+    """
+    headline = (raw.get('headline') or '').strip()
+    if len(headline) <= 10:
+        return None
+
+    article_data = {
+        'headline': headline,
+        'content': '',
+        'source': '',
+        'time': '',
+        'article_url': raw.get('article_url') or ''
+    }
+
+    for metadata_text in raw.get('meta') or []:
+        time_str, source = parse_time_and_source(metadata_text)
+        if time_str:
+            article_data['time'] = time_str
+            article_data['source'] = source or ''
+            break
+
+    content_parts = raw.get('content_parts') or []
+    if not content_parts:
+        content = content_from_text(raw.get('text') or '', headline)
+        if content:
+            content_parts = [content]
+    if content_parts:
+        article_data['content'] = re.sub(r'\s+', ' ', max(content_parts, key=len)).strip()
+
+    return article_data
+
+
+class PulsePageParser:
+    """Extracts Pulse articles from raw page HTML"""
+
+    def __init__(self, html: str, url: str = PULSE_URL):
+        """
+        Parse the page
+
+        Args:
+            html: Page source
+            url: Page URL, used to resolve relative article links
+        """
+        self.url = url
+        self.root = parse_html(html)
+
+    @classmethod
+    def from_file(cls, path: str, url: str = PULSE_URL) -> 'PulsePageParser':
+        """Build a parser from a saved .html file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), url)
+
+    def _headline_links(self):
+        """Links inside h2/h3 headings, else long external-looking links"""
+        links = [
+            a for heading in self.root.iter()
+            if heading.tag in ('h2', 'h3')
+            for a in heading.iter('a') if a.get('href')
+        ]
+        if links:
+            return links
+
+        for a in self.root.iter('a'):
+            text = a.text
+            href = urljoin(self.url, a.get('href', ''))
+            if 40 <= len(text) <= 200 and 'ago' not in text.lower() and 'http' in href:
+                links.append(a)
+        return links
+
+    def _find_container(self, link, used):
+        """Nearest ancestor (levels 2-7) holding one article"""
+        for level, node in enumerate(link.ancestors(), 1):
+            if level < 2:
+                continue
+            if level > 7 or node.tag == '#document':
+                return None
+            if id(node) in used:
+                continue
+            headline_links = [a for a in node.iter('a') if len(a.text) > 40]
+            text = node.text
+            if 1 <= len(headline_links) <= 3 and 'ago' in text.lower() and len(text) < 1500:
+                return node
+        return None
+
+    def _raw_article(self, container) -> Optional[Dict]:
+        """Collect headline, URL, metadata and summary candidates"""
+        text = container.text
+        if len(text) < 20:
+            return None
+
+        headline = ''
+        url = ''
+        for node in container.iter():
+            if node.get('role') == 'heading':
+                heading_link = node.find('a')
+                if heading_link is not None and heading_link.text:
+                    headline = heading_link.text
+                    url = heading_link.get('href', '')
+                    break
+        if not headline:
+            for a in container.iter('a'):
+                if len(a.text) > 30 and 'ago' not in a.text.lower():
+                    headline = a.text
+                    url = a.get('href', '')
+                    break
+        if not headline:
+            return None
+
+        meta = []
+        meta_match = _METADATA_PATTERN.search(text)
+        if meta_match:
+            meta.append(meta_match.group(1))
+
+        content_parts = []
+        for elem in container.find_all():
+            elem_text = elem.text
+            if not meta_match and 'ago' in elem.own_text.lower():
+                meta.append(elem_text)
+            if not elem_text or len(elem_text) < 20:
+                continue
+            if elem_text == headline or headline in elem_text:
+                continue
+            if _AGO_PATTERN.search(elem_text):
+                continue
+            if len(elem_text) > 500:
+                continue
+            if any(len(a.text) > 40 for a in elem.iter('a')):
+                continue
+            if any(elem_text in p or p in elem_text for p in content_parts):
+                continue
+            if 30 <= len(elem_text) <= 400:
+                content_parts.append(elem_text)
+
+        return {
+            'headline': headline,
+            'article_url': urljoin(self.url, url) if url else '',
+            'text': text,
+            'meta': meta,
+            'content_parts': content_parts
+        }
+
+    def parse_articles(self) -> List[Dict]:
+        """All unique articles on the page, in document order"""
+        articles = []
+        seen_headlines = set()
+        used = set()
+
+        for link in self._headline_links():
+            container = self._find_container(link, used)
+            if container is None:
+                continue
+            used.add(id(container))
+
+            raw = self._raw_article(container)
+            article = build_article(raw) if raw else None
+            if not article:
+                continue
+
+            key = article['headline'].lower()
+            if key in seen_headlines:
+                continue
+            seen_headlines.add(key)
+            articles.append(article)
+
+        return articles
+
+
+def main():
+    """Parse a saved Pulse page and print the extracted JSON"""
+    if len(sys.argv) < 2:
+        print("Usage: python pulse_html_parser.py saved_page.html")
+        sys.exit(1)
+
+    articles = PulsePageParser.from_file(sys.argv[1]).parse_articles()
+    print(json.dumps(articles, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
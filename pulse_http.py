@@ -0,0 +1,112 @@
+"""
+Pulse HTTP Fetcher
+==================
+
+Browserless fetch path for Pulse by Zerodha. The article list is part of the
+initial HTML, so a plain keep-alive HTTP GET plus PulsePageParser replaces a
+full headless Chrome run for the common case.
+
+Usage:
+    fetcher = PulseHTTPFetcher()
+    data = fetcher.scrape_all_news()
+    if not PulseHTTPFetcher.is_usable(data):
+        ...  # fall back to PulseZerodhaScraper
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pulse_html_parser import PulsePageParser, PULSE_PAGE_URL
+from scrape_tracing import traced
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Process-wide requests.Session with a keep-alive connection pool"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept': 'text/html,application/xhtml+xml',
+                'Accept-Language': 'en-IN,en;q=0.9',
+            })
+            _session = session
+        return _session
+
+
+class PulseHTTPFetcher:
+    """Fetches and parses Pulse without a browser"""
+
+    def __init__(self, url: str = PULSE_PAGE_URL, timeout: float = 15):
+        """
+        Initialize the fetcher
+
+        Args:
+            url: Pulse page URL
+            timeout: HTTP timeout in seconds
+        """
+        self.url = url
+        self.timeout = timeout
+
+    @traced('pulse_http.fetch')
+    def fetch(self) -> str:
+        """GET the page over the shared keep-alive session"""
+        logger.info(f"Fetching over HTTP: {self.url}")
+        response = get_http_session().get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    @traced('pulse_http.scrape_all_news')
+    def scrape_all_news(self) -> Optional[Dict]:
+        """
+        Fetch and parse all articles
+
+        Returns:
+            dict: Same structure as PulseZerodhaScraper.scrape_all_news(),
+            or None if the request failed
+        """
+        try:
+            html = self.fetch()
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed: {e}")
+            return None
+
+        articles = PulsePageParser(html, self.url).parse_articles()
+        logger.info(f"HTTP fetch parsed {len(articles)} articles")
+
+        return {
+            'scrape_timestamp': datetime.now().isoformat(),
+            'url': self.url,
+            'total_articles': len(articles),
+            'articles': articles
+        }
+
+    @staticmethod
+    def is_usable(data: Optional[Dict]) -> bool:
+        """
+        Decide whether the HTTP result is good enough to skip the browser
+
+        Empty results, or results where most articles lack the time/source
+        metadata (a sign the markup changed), are treated as malformed.
+        """
+        if not data or not data.get('articles'):
+            return False
+        articles = data['articles']
+        with_metadata = sum(1 for a in articles if a.get('time') and a.get('source'))
+        return with_metadata * 2 >= len(articles)
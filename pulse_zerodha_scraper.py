@@ -15,39 +15,144 @@ Usage:
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.service import Service
 import json
-import time
 from datetime import datetime
 import logging
 import re
 import tempfile
 import shutil
 
+from browser_pool import find_free_port
+from pulse_html_parser import PULSE_PAGE_URL, parse_time_and_source, content_from_text, build_article
+from page_readiness import eager_options, summarize, wait_for_dom_quiet, wait_until_ready
+from resource_blocking import apply_blocking, page_weight
+from scrape_tracing import traced
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# In-page extractor used by scrape_news_articles_script(). Mirrors the
+# WebDriver-driven heuristics below (headline links -> nearest ancestor at
+# levels 2-7 holding 1-3 headline links plus "ago" metadata) but runs in a
+# single execute_script round trip and returns plain JSON.
+EXTRACT_ARTICLES_JS = r"""
+const AGO = /\d+\s*(?:minutes?|hours?|days?)\s*ago/i;
+const META = /(\d+(?:\.\d+)?\s*(?:minutes?|hours?|days?)\s*ago\s*[—–-].+)/i;
+const txt = el => (el.innerText || '').trim();
+
+let links = Array.from(document.querySelectorAll('h2 a[href], h3 a[href]'));
+if (!links.length) {
+    links = Array.from(document.querySelectorAll('a[href]')).filter(a => {
+        const t = txt(a);
+        return t.length >= 40 && t.length <= 200 && !/ago/i.test(t) && a.href.includes('http');
+    });
+}
+
+const used = new Set();
+const articles = [];
+for (const link of links) {
+    let node = link.parentElement;
+    let container = null;
+    for (let level = 2; level < 8 && node; level++) {
+        node = node.parentElement;
+        if (!node || used.has(node)) continue;
+        const headlineLinks = Array.from(node.querySelectorAll('a')).filter(a => txt(a).length > 40);
+        const text = txt(node);
+        if (headlineLinks.length >= 1 && headlineLinks.length <= 3 &&
+                text.toLowerCase().includes('ago') && text.length < 1500) {
+            container = node;
+            break;
+        }
+    }
+    if (!container) continue;
+    used.add(container);
+
+    const text = txt(container);
+    if (text.length < 20) continue;
+
+    let headline = '';
+    let url = '';
+    const heading = container.querySelector('[role="heading"] a');
+    if (heading && txt(heading)) {
+        headline = txt(heading);
+        url = heading.href || '';
+    } else {
+        for (const a of container.querySelectorAll('a')) {
+            const t = txt(a);
+            if (t.length > 30 && !/ago/i.test(t)) { headline = t; url = a.href || ''; break; }
+        }
+    }
+    if (!headline) continue;
+
+    const metaMatch = (container.textContent || text).match(META);
+    const metaCandidates = metaMatch ? [metaMatch[1]] : [];
+
+    const contentParts = [];
+    for (const el of container.querySelectorAll('*')) {
+        const t = txt(el);
+        if (!metaMatch && el.childElementCount === 0 && t.toLowerCase().includes('ago')) metaCandidates.push(t);
+        if (!t || t.length < 20) continue;
+        if (t === headline || t.includes(headline)) continue;
+        if (AGO.test(t)) continue;
+        if (t.length > 500) continue;
+        if (Array.from(el.querySelectorAll('a')).some(a => txt(a).length > 40)) continue;
+        if (contentParts.some(p => p.includes(t) || t.includes(p))) continue;
+        if (t.length >= 30 && t.length <= 400) contentParts.push(t);
+    }
+
+    articles.push({
+        headline: headline,
+        article_url: url,
+        text: text,
+        meta: metaCandidates,
+        content_parts: contentParts
+    });
+}
+return articles;
+"""
+
 
 class PulseZerodhaScraper:
     """Scraper for Pulse by Zerodha news aggregation website"""
     
-    def __init__(self, headless=False):
-        """Initialize the scraper"""
-        self.url = "https://pulse.zerodha.com/"
+    def __init__(self, headless=False, driver=None, extraction_mode="script", url=None):
+        """
+        Initialize the scraper
+        
+        Args:
+            headless: Run Chrome headless when launching our own driver
+            driver: Optional WebDriver borrowed from a BrowserPool; it is
+                reused as-is and left running on cleanup()
+            extraction_mode: "script" extracts every article in one
+                execute_script call (falls back to "dom" if it finds nothing);
+                "dom" uses the per-element WebDriver walk
+            url: Page to load instead of PULSE_URL (e.g. standin_server.py)
+        """
+        self.url = url or PULSE_PAGE_URL
         self.headless = headless
-        self.driver = None
+        self.extraction_mode = extraction_mode
+        self.driver = driver
         self.wait = None
         self._profile_dir = None
+        self._owns_driver = driver is None
+        self.readiness = []  # Reports from each readiness wait
+        self.blocking = None  # Resource blocking status for this driver
     
+    @traced('pulse._init_driver')
     def _init_driver(self):
         """Initialize web driver"""
+        if not self._owns_driver:
+            self.wait = WebDriverWait(self.driver, 20)
+            self.blocking = apply_blocking(self.driver, 'pulse')
+            logger.info("Using pooled WebDriver")
+            return True
+        
         try:
-            options = webdriver.ChromeOptions()
+            options = eager_options(webdriver.ChromeOptions())
             if self.headless:
                 options.add_argument('--headless=new')
                 options.add_argument('--disable-gpu')
@@ -56,7 +161,7 @@ class PulseZerodhaScraper:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-setuid-sandbox')
-            options.add_argument('--remote-debugging-port=9222')
+            options.add_argument(f'--remote-debugging-port={find_free_port()}')
             options.add_argument('--no-zygote')
             options.add_argument('--disable-extensions')
             options.add_argument('--disable-background-networking')
@@ -79,6 +184,7 @@ class PulseZerodhaScraper:
             service = Service()
             self.driver = webdriver.Chrome(service=service, options=options)
             self.wait = WebDriverWait(self.driver, 20)
+            self.blocking = apply_blocking(self.driver, 'pulse')
             
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
@@ -89,36 +195,32 @@ class PulseZerodhaScraper:
             logger.error(f"Error initializing WebDriver: {e}")
             return False
     
+    @traced('pulse.navigate_to_page')
     def navigate_to_page(self):
         """Navigate to Pulse by Zerodha page"""
         try:
             logger.info(f"Navigating to: {self.url}")
             self.driver.get(self.url)
             
-            # Wait for page to load
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            logger.info("Initial page load complete")
-            
-            # Wait for JavaScript to execute and content to load
-            time.sleep(3)
+            # Ready once article items are rendered and the DOM has settled
+            report = wait_until_ready(
+                self.driver,
+                selectors=["[role='listitem']", 'h2 a[href]', 'h3 a[href]'],
+                label='pulse articles'
+            )
+            self.readiness.append(report)
+            if report['ready']:
+                logger.info("News content detected on page")
+            else:
+                logger.warning("News items not confirmed before deadline, but continuing...")
             
             # Scroll down to trigger any lazy loading
             logger.info("Scrolling to load content...")
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            self.readiness.append(wait_for_dom_quiet(self.driver, label='scroll bottom'))
             
             # Scroll back up
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            
-            # Try to wait for news items
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//*[@role='listitem']"))
-                )
-                logger.info("News content detected on page")
-            except TimeoutException:
-                logger.warning("Timeout waiting for news items, but continuing...")
             
             logger.info("Page loaded successfully")
             return True
@@ -127,46 +229,7 @@ class PulseZerodhaScraper:
             logger.error(f"Error loading page: {e}")
             return False
     
-    def parse_time_and_source(self, metadata_text):
-        """
-        Parse metadata text to extract time and source
-        Format: "X hours/minutes ago — Source Name"
-        
-        Args:
-            metadata_text: String containing time and source info
-            
-        Returns:
-            tuple: (time_string, source_name) or (None, None)
-        """
-        if not metadata_text:
-            return None, None
-        
-        # Pattern to match: "55 minutes ago — The Hindu Business"
-        # or "3.5 hours ago — Economic Times"
-        pattern = r'(\d+(?:\.\d+)?\s*(?:minutes?|hours?|days?)\s*ago)\s*[—–-]\s*(.+)'
-        match = re.search(pattern, metadata_text, re.IGNORECASE)
-        
-        if match:
-            time_str = match.group(1).strip()
-            source = match.group(2).strip()
-            return time_str, source
-        
-        # Try alternative patterns
-        # Pattern without separator (if format is different)
-        alt_pattern = r'(\d+(?:\.\d+)?\s*(?:minutes?|hours?|days?)\s*ago)(.+)'
-        alt_match = re.search(alt_pattern, metadata_text, re.IGNORECASE)
-        
-        if alt_match:
-            time_str = alt_match.group(1).strip()
-            # Source is everything after time
-            source_part = alt_match.group(2).strip()
-            # Remove common separators
-            source = re.sub(r'^[—–-\s]+', '', source_part).strip()
-            if source:
-                return time_str, source
-        
-        return None, None
-    
+    @traced('pulse.extract_article_data')
     def extract_article_data(self, article_element):
         """
         Extract data from a single article element
@@ -237,7 +300,7 @@ class PulseZerodhaScraper:
                 
                 if metadata_match:
                     metadata_text = metadata_match.group(1)
-                    time_str, source = self.parse_time_and_source(metadata_text)
+                    time_str, source = parse_time_and_source(metadata_text)
                     
                     if time_str:
                         article_data['time'] = time_str
@@ -249,7 +312,7 @@ class PulseZerodhaScraper:
                     ago_elements = article_element.find_elements(By.XPATH, ".//*[contains(text(), 'ago')]")
                     for elem in ago_elements:
                         elem_text = elem.text
-                        time_str, source = self.parse_time_and_source(elem_text)
+                        time_str, source = parse_time_and_source(elem_text)
                         if time_str:
                             article_data['time'] = time_str
                             article_data['source'] = source
@@ -317,44 +380,8 @@ class PulseZerodhaScraper:
                 
                 # Method 2: If no content found, parse from article_text
                 if not content_parts:
-                    content = article_text
-                    
-                    # Remove headline
-                    if headline:
-                        content = content.replace(headline, '', 1).strip()
-                    
-                    # Remove metadata (find first line with "ago" and remove it)
-                    lines = content.split('\n')
-                    cleaned_lines = []
-                    metadata_found = False
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        # Skip metadata line
-                        if not metadata_found and 'ago' in line.lower() and re.search(r'\d+\s*(?:minutes?|hours?|days?)\s*ago', line, re.IGNORECASE):
-                            metadata_found = True
-                            continue
-                        
-                        # Stop if we hit another article's headline pattern
-                        # (headlines are typically title case and longer)
-                        if metadata_found and len(line) > 40 and line[0].isupper() and 'ago' not in line.lower():
-                            # Check if this might be another article
-                            break
-                        
-                        cleaned_lines.append(line)
-                    
-                    content = ' '.join(cleaned_lines).strip()
-                    
-                    # Truncate if too long
-                    if len(content) > 500:
-                        # Take first sentence or two
-                        sentences = re.split(r'[.!?]\s+', content)
-                        content = '. '.join(sentences[:2]) + '.'
-                    
-                    if len(content) > 20 and len(content) < 1000:
+                    content = content_from_text(article_text, headline)
+                    if content:
                         content_parts.append(content)
                 
                 # Join content parts
@@ -380,6 +407,38 @@ class PulseZerodhaScraper:
             logger.debug(f"Error extracting article data: {e}")
             return None
     
+    @traced('pulse.scrape_news_articles_script')
+    def scrape_news_articles_script(self):
+        """
+        Scrape all news articles with a single in-page script call
+        
+        Returns:
+            list: List of article dictionaries (same schema as extract_article_data)
+        """
+        try:
+            logger.info("Scraping news articles (in-page extraction)...")
+            raw_articles = self.driver.execute_script(EXTRACT_ARTICLES_JS) or []
+        except Exception as e:
+            logger.error(f"In-page extraction failed: {e}")
+            return []
+        
+        articles = []
+        seen_headlines = set()
+        
+        for raw in raw_articles:
+            article_data = build_article(raw)
+            if not article_data:
+                continue
+            key = article_data['headline'].lower()
+            if key in seen_headlines:
+                continue
+            seen_headlines.add(key)
+            articles.append(article_data)
+        
+        logger.info(f"In-page extraction found {len(articles)} unique articles")
+        return articles
+    
+    @traced('pulse.scrape_news_articles')
     def scrape_news_articles(self):
         """
         Scrape all news articles from the page
@@ -387,10 +446,17 @@ class PulseZerodhaScraper:
         Returns:
             list: List of article dictionaries
         """
+        if self.extraction_mode == "script":
+            articles = self.scrape_news_articles_script()
+            if articles:
+                return articles
+            logger.warning("In-page extraction found no articles, falling back to DOM walk")
+        
         try:
             logger.info("Scraping news articles...")
             
             articles = []
+            seen_headlines = set()
             
             # IMPROVED APPROACH: Find all headline links, then find their closest parent containers
             # Headlines are in <h2> or <h3> or elements with role='heading'
@@ -487,7 +553,8 @@ class PulseZerodhaScraper:
                         if article_data and article_data.get('headline'):
                             # Check for duplicates by headline
                             headline = article_data['headline'].lower().strip()
-                            if not any(a.get('headline', '').lower().strip() == headline for a in articles):
+                            if headline not in seen_headlines:
+                                seen_headlines.add(headline)
                                 articles.append(article_data)
                                 logger.info(f"✓ Extracted {len(articles)}: {article_data['headline'][:60]}...")
                     else:
@@ -519,6 +586,7 @@ class PulseZerodhaScraper:
             logger.error(traceback.format_exc())
             return []
     
+    @traced('pulse.scrape_all_news')
     def scrape_all_news(self):
         """
         Main method to scrape all news
@@ -536,7 +604,9 @@ class PulseZerodhaScraper:
                 'scrape_timestamp': datetime.now().isoformat(),
                 'url': self.url,
                 'total_articles': len(articles),
-                'articles': articles
+                'articles': articles,
+                'readiness': summarize(self.readiness),
+                'network': {**(self.blocking or {}), 'page': page_weight(self.driver)}
             }
             
             return result
@@ -574,9 +644,10 @@ class PulseZerodhaScraper:
             logger.error(f"Error taking screenshot: {e}")
             return None
     
+    @traced('pulse.cleanup')
     def cleanup(self):
-        """Close browser"""
-        if self.driver:
+        """Close browser (pooled drivers are left for the pool to reset)"""
+        if self.driver and self._owns_driver:
             try:
                 self.driver.quit()
                 logger.info("Browser closed")
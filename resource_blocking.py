@@ -0,0 +1,210 @@
+"""
+Resource Blocking
+=================
+
+Stops Chrome from downloading images, web fonts, media and third-party
+trackers while scraping, using the DevTools Network.setBlockedURLs
+command. None of these affect text extraction, and on a 512 MB container
+they cost bandwidth, CPU and renderer memory.
+
+Blocking is configured per source. CDP's block list is deny-only, so a
+source's "allow" patterns take matching entries out of its deny list
+(e.g. allow "*.svg" if a source ever needs its inline icons).
+
+Environment:
+    BLOCK_RESOURCES=0                Disable blocking entirely
+    BLOCK_EXTRA_PATTERNS=a,b         Extra deny patterns for every source
+    BLOCK_ALLOW_<SOURCE>=a,b         Patterns to stop blocking for one source
+
+page_weight() reports what a page actually transferred. Run this module
+directly to load a source with and without blocking and compare bytes,
+load times and extraction results:
+
+    python resource_blocking.py groww
+"""
+
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, List, Optional
+import json
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+BLOCK_CATEGORIES = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.bmp'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'media': ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg', '*.wav'],
+    'trackers': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googlesyndication.com*', '*adservice.google.*', '*facebook.net*', '*connect.facebook.*',
+        '*hotjar.com*', '*clarity.ms*', '*segment.io*', '*mixpanel.com*', '*amplitude.com*',
+        '*newrelic.com*', '*nr-data.net*', '*branch.io*', '*moengage.com*', '*clevertap*',
+        '*webengage*', '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*',
+    ],
+}
+
+# Per-source categories to block and patterns to keep loading
+SOURCE_PROFILES = {
+    'groww': {'block': ['images', 'fonts', 'media', 'trackers'], 'allow': []},
+    'pulse': {'block': ['images', 'fonts', 'media', 'trackers'], 'allow': []},
+}
+DEFAULT_PROFILE = {'block': ['images', 'fonts', 'media', 'trackers'], 'allow': []}
+
+PAGE_WEIGHT_JS = r"""
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let transfer = 0, decoded = 0;
+for (const r of resources) { transfer += r.transferSize || 0; decoded += r.decodedBodySize || 0; }
+if (nav) { transfer += nav.transferSize || 0; decoded += nav.decodedBodySize || 0; }
+return {
+    resources: resources.length,
+    transfer_bytes: transfer,
+    decoded_bytes: decoded,
+    dom_content_loaded_ms: nav ? Math.round(nav.domContentLoadedEventEnd) : null,
+    load_ms: nav && nav.loadEventEnd ? Math.round(nav.loadEventEnd) : null
+};
+"""
+
+
+def _env_list(name: str) -> List[str]:
+    return [p.strip() for p in os.getenv(name, '').split(',') if p.strip()]
+
+
+def blocking_enabled() -> bool:
+    return os.getenv("BLOCK_RESOURCES", "1").strip().lower() in {"1", "true", "yes", "y"}
+
+
+def blocked_patterns(source: str) -> List[str]:
+    """
+    Deny patterns for a source
+
+    Args:
+        source: "groww", "pulse" or any other name (gets the default profile)
+
+    Returns:
+        list: Wildcard URL patterns for Network.setBlockedURLs
+    """
+    profile = SOURCE_PROFILES.get(source, DEFAULT_PROFILE)
+    patterns = [p for category in profile['block'] for p in BLOCK_CATEGORIES.get(category, [])]
+    patterns += _env_list("BLOCK_EXTRA_PATTERNS")
+
+    allow = profile['allow'] + _env_list(f"BLOCK_ALLOW_{source.upper()}")
+    # A deny entry is dropped when an allow pattern names it or matches it
+    return [p for p in dict.fromkeys(patterns) if not any(p == a or fnmatch(p, a) for a in allow)]
+
+
+def apply_blocking(driver, source: str) -> Dict[str, Any]:
+    """
+    Install the source's block list on a Chrome driver (before navigating)
+
+    Returns:
+        dict: {"enabled", "patterns"} - enabled is False when disabled by
+        config or when the driver has no DevTools access
+    """
+    if not blocking_enabled():
+        return {'enabled': False, 'patterns': 0}
+
+    patterns = blocked_patterns(source)
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception as e:
+        logger.warning(f"Resource blocking unavailable for {source}: {e}")
+        return {'enabled': False, 'patterns': 0}
+
+    logger.info(f"Blocking {len(patterns)} resource patterns for {source}")
+    return {'enabled': True, 'patterns': len(patterns)}
+
+
+def clear_blocking(driver):
+    """Remove any block list from the driver"""
+    try:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+    except Exception:
+        pass
+
+
+def page_weight(driver) -> Optional[Dict[str, Any]]:
+    """Resources, bytes transferred and load timings for the current page"""
+    try:
+        return driver.execute_script(PAGE_WEIGHT_JS)
+    except Exception as e:
+        logger.warning(f"Could not read page weight: {e}")
+        return None
+
+
+def compare(source: str, url: str, extract: Callable[[str], int] = None,
+            settle_seconds: float = 5, headless: bool = True) -> Dict[str, Any]:
+    """
+    Load a page with and without blocking and report the difference
+
+    Args:
+        source: Profile to test
+        url: Page URL
+        extract: Function html -> number of extracted items, to check that
+            blocking doesn't change extraction results
+        settle_seconds: Time allowed for lazy requests after load
+        headless: Run Chrome headless
+
+    Returns:
+        dict: {"baseline", "blocked", "bytes_saved", "load_ms_delta", ...}
+    """
+    from browser_pool import BrowserSession, find_free_port
+
+    runs = {}
+    for mode in ('baseline', 'blocked'):
+        session = BrowserSession(0, find_free_port(), headless=headless)
+        try:
+            if mode == 'blocked':
+                apply_blocking(session.driver, source)
+            start = time.time()
+            session.driver.get(url)
+            time.sleep(settle_seconds)
+            weight = page_weight(session.driver) or {}
+            weight['wall_seconds'] = round(time.time() - start, 2)
+            weight['rss_mb'] = session.rss_mb()
+            if extract:
+                weight['extracted_items'] = extract(session.driver.page_source)
+            runs[mode] = weight
+        finally:
+            session.close()
+
+    baseline, blocked = runs['baseline'], runs['blocked']
+    report = {
+        'source': source,
+        'url': url,
+        'patterns': len(blocked_patterns(source)),
+        'baseline': baseline,
+        'blocked': blocked,
+        'bytes_saved': (baseline.get('transfer_bytes') or 0) - (blocked.get('transfer_bytes') or 0),
+        'load_ms_delta': (blocked.get('load_ms') or 0) - (baseline.get('load_ms') or 0),
+        'rss_mb_delta': round((blocked.get('rss_mb') or 0) - (baseline.get('rss_mb') or 0), 1),
+    }
+    if extract:
+        report['extraction_unchanged'] = baseline.get('extracted_items') == blocked.get('extracted_items')
+    return report
+
+
+def main():
+    """Compare page weight and extraction with and without blocking"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    source = sys.argv[1] if len(sys.argv) > 1 else 'groww'
+
+    if source == 'pulse':
+        from pulse_html_parser import PulsePageParser, PULSE_URL
+        url = PULSE_URL
+        extract = lambda html: len(PulsePageParser(html, url).parse_articles())
+    else:
+        from groww_embedded import parse_groww_page
+        from groww_html_parser import GROWW_URL
+        url = GROWW_URL
+        extract = lambda html: sum(len(v) for k, v in parse_groww_page(html, url).items() if k != 'metadata')
+
+    print(json.dumps(compare(source, url, extract), indent=2))
+
+
+if __name__ == "__main__":
+    main()
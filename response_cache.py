@@ -0,0 +1,154 @@
+"""
+Scrape Response Cache
+=====================
+
+In-process TTL cache with stale-while-revalidate for the /scrape endpoints.
+
+Per source key:
+- Within the TTL the last good result is served instantly ("hit")
+- Past the TTL the stale result is served while one background refresh runs ("stale")
+- A failed refresh keeps serving the last known good result
+- With nothing cached the scrape runs on the request path ("fresh")
+
+Usage:
+    cache = ResponseCache({'groww': 300, 'pulse': 120})
+    result, info = await cache.get('groww', registry.get('groww').run, executor)
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+STATUS_HIT = 'hit'
+STATUS_STALE = 'stale'
+STATUS_FRESH = 'fresh'
+
+
+class CacheEntry:
+    """Last good result for one source"""
+
+    def __init__(self, result: Dict[str, Any]):
+        self.result = result
+        self.stored_at = time.time()
+        self.refreshing = False
+        self.last_error = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class ResponseCache:
+    """Per-source result cache for scraper runs"""
+
+    def __init__(self, ttls: Dict[str, float], default_ttl: float = 300,
+                 single_flight: Optional[SingleFlight] = None):
+        """
+        Initialize the cache
+
+        Args:
+            ttls: Seconds a result stays fresh, per source key
+            default_ttl: TTL for keys not listed in ttls
+            single_flight: Coalescer shared with other scrape paths
+        """
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.single_flight = single_flight or SingleFlight()
+        self._entries: Dict[str, CacheEntry] = {}
+
+    def ttl_for(self, key: str) -> float:
+        return self.ttls.get(key, self.default_ttl)
+
+    @staticmethod
+    def _is_good(result: Optional[Dict[str, Any]]) -> bool:
+        return bool(result and result.get('success'))
+
+    def _store(self, key: str, result: Dict[str, Any]):
+        if self._is_good(result):
+            self._entries[key] = CacheEntry(result)
+        elif key in self._entries:
+            self._entries[key].last_error = result.get('error') if result else 'No result'
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a result produced elsewhere (e.g. the background refresher)"""
+        self._store(key, result)
+
+    async def _run(self, key: str, loader: Callable[[], Dict[str, Any]], executor) -> Dict[str, Any]:
+        return await self.single_flight.do(key, loader, executor)
+
+    async def _refresh(self, key: str, loader, executor):
+        """Background refresh; failures leave the stale entry in place"""
+        entry = self._entries.get(key)
+        try:
+            result = await self._run(key, loader, executor)
+            self._store(key, result)
+            if not self._is_good(result):
+                logger.warning(f"Background refresh of {key} failed, serving last known good")
+        except Exception as e:
+            logger.error(f"Background refresh of {key} raised: {e}", exc_info=True)
+            if entry:
+                entry.last_error = str(e)
+        finally:
+            if entry:
+                entry.refreshing = False
+
+    async def get(self, key: str, loader: Callable[[], Dict[str, Any]], executor,
+                  force_refresh: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Return a result for key, scraping only when needed
+
+        Args:
+            key: Source name ("groww", "pulse")
+            loader: Blocking function that runs the scraper
+            executor: Executor the loader runs on
+            force_refresh: Skip the cache and scrape on the request path
+
+        Returns:
+            tuple: (result dict, cache info dict with status/age_seconds/ttl_seconds)
+        """
+        ttl = self.ttl_for(key)
+        entry = self._entries.get(key)
+
+        if entry and not force_refresh:
+            if entry.age < ttl:
+                return entry.result, self._info(STATUS_HIT, entry, ttl)
+
+            if not entry.refreshing:
+                entry.refreshing = True
+                logger.info(f"Cached {key} result is {entry.age:.0f}s old, refreshing in background")
+                asyncio.ensure_future(self._refresh(key, loader, executor))
+            return entry.result, self._info(STATUS_STALE, entry, ttl)
+
+        result = await self._run(key, loader, executor)
+        self._store(key, result)
+
+        # A failed scrape still falls back to whatever we had before
+        if not self._is_good(result) and entry:
+            return entry.result, self._info(STATUS_STALE, entry, ttl)
+        return result, {'status': STATUS_FRESH, 'age_seconds': 0, 'ttl_seconds': ttl}
+
+    @staticmethod
+    def _info(status: str, entry: CacheEntry, ttl: float) -> Dict[str, Any]:
+        info = {
+            'status': status,
+            'age_seconds': round(entry.age, 1),
+            'ttl_seconds': ttl
+        }
+        if entry.refreshing:
+            info['refreshing'] = True
+        if entry.last_error:
+            info['last_refresh_error'] = entry.last_error
+        return info
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-source cache state for the health endpoint"""
+        return {
+            key: self._info(STATUS_HIT if entry.age < self.ttl_for(key) else STATUS_STALE,
+                            entry, self.ttl_for(key))
+            for key, entry in self._entries.items()
+        }
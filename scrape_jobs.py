@@ -0,0 +1,236 @@
+"""
+Asynchronous Scrape Jobs
+========================
+
+Job store behind POST /jobs and GET /jobs/{id}. Submitting returns a job id
+immediately; the scrape runs in the background and the caller polls for
+per-source progress and results instead of holding a connection open for
+the full scrape.
+
+Finished jobs are kept for a bounded retention window and the store never
+holds more than max_jobs; the oldest finished jobs are evicted first. When
+every stored job is still unfinished, new submissions are rejected with
+JobStoreFull rather than growing the store.
+
+Usage:
+    jobs = JobStore(loaders, executor, cache=response_cache)
+    job = jobs.submit(['groww', 'pulse'])
+    jobs.get(job.job_id).to_dict()
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_PARTIAL = 'partial'
+JOB_FAILED = 'failed'
+
+SOURCE_PENDING = 'pending'
+SOURCE_RUNNING = 'running'
+SOURCE_DONE = 'done'
+SOURCE_FAILED = 'failed'
+
+
+class JobStoreFull(Exception):
+    """Raised by JobStore.submit when max_jobs jobs are all still running"""
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+
+class ScrapeJob:
+    """One submitted scrape across one or more sources"""
+
+    def __init__(self, sources: List[str], refresh: bool = False):
+        self.job_id = uuid.uuid4().hex
+        self.sources = list(sources)
+        self.refresh = refresh
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = {
+            source: {'status': SOURCE_PENDING, 'started_at': None, 'finished_at': None}
+            for source in self.sources
+        }
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def to_dict(self, include_results: bool = True) -> Dict[str, Any]:
+        """Response body for GET /jobs/{id}"""
+        progress = {}
+        for source, state in self.progress.items():
+            entry = {
+                'status': state['status'],
+                'started_at': _iso(state['started_at']),
+                'finished_at': _iso(state['finished_at'])
+            }
+            if state['started_at'] and state['finished_at']:
+                entry['duration_seconds'] = round(state['finished_at'] - state['started_at'], 2)
+            if state.get('error'):
+                entry['error'] = state['error']
+            if state.get('cache'):
+                entry['cache'] = state['cache']
+            progress[source] = entry
+
+        job = {
+            'job_id': self.job_id,
+            'status': self.status,
+            'sources': self.sources,
+            'created_at': _iso(self.created_at),
+            'started_at': _iso(self.started_at),
+            'finished_at': _iso(self.finished_at),
+            'progress': progress
+        }
+        if self.finished_at:
+            job['duration_seconds'] = round(self.finished_at - self.created_at, 2)
+        if include_results:
+            job['results'] = {
+                source: {
+                    'success': result.get('success', False),
+                    'data': result.get('data'),
+                    'error': result.get('error')
+                }
+                for source, result in self.results.items()
+            }
+        return job
+
+
+class JobStore:
+    """Runs scrape jobs in the background and retains their results"""
+
+    def __init__(self, loaders: Dict[str, Callable[[], Dict[str, Any]]], executor,
+                 cache: Optional[ResponseCache] = None,
+                 retention_seconds: float = 3600, max_jobs: int = 100):
+        """
+        Initialize the store
+
+        Args:
+            loaders: Blocking scraper function per source
+            executor: Executor the loaders run on
+            cache: Response cache (and its single-flight) the jobs go through
+            retention_seconds: How long finished jobs stay retrievable
+            max_jobs: Upper bound on stored jobs
+        """
+        self.loaders = dict(loaders)
+        self.executor = executor
+        self.cache = cache or ResponseCache({})
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self._jobs: 'OrderedDict[str, ScrapeJob]' = OrderedDict()
+        self._evicted = 0
+        self._rejected = 0
+
+    def submit(self, sources: List[str], refresh: bool = False) -> ScrapeJob:
+        """
+        Create a job and start it on the running event loop
+
+        Args:
+            sources: Source names; each must be a key of loaders
+            refresh: Bypass the response cache
+
+        Returns:
+            ScrapeJob: The queued job
+
+        Raises:
+            ValueError: An unknown source was requested
+            JobStoreFull: The store holds max_jobs unfinished jobs
+        """
+        unknown = [s for s in sources if s not in self.loaders]
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+
+        self._evict()
+        if len(self._jobs) >= self.max_jobs:
+            self._rejected += 1
+            raise JobStoreFull(f"{len(self._jobs)} jobs still running, try again later")
+        job = ScrapeJob(sources, refresh=refresh)
+        self._jobs[job.job_id] = job
+        asyncio.ensure_future(self._run(job))
+        logger.info(f"Submitted job {job.job_id} for {sources}")
+        return job
+
+    def get(self, job_id: str) -> Optional[ScrapeJob]:
+        self._evict()
+        return self._jobs.get(job_id)
+
+    async def _run_source(self, job: ScrapeJob, source: str):
+        state = job.progress[source]
+        state['status'] = SOURCE_RUNNING
+        state['started_at'] = time.time()
+        try:
+            result, cache_info = await self.cache.get(
+                source, self.loaders[source], self.executor, force_refresh=job.refresh
+            )
+            state['cache'] = cache_info
+        except Exception as e:
+            logger.error(f"Job {job.job_id} {source} raised: {e}", exc_info=True)
+            result = {'success': False, 'source': source, 'error': str(e)}
+
+        job.results[source] = result
+        state['finished_at'] = time.time()
+        if result.get('success'):
+            state['status'] = SOURCE_DONE
+        else:
+            state['status'] = SOURCE_FAILED
+            state['error'] = result.get('error')
+
+    async def _run(self, job: ScrapeJob):
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        await asyncio.gather(*(self._run_source(job, source) for source in job.sources))
+
+        succeeded = sum(1 for s in job.progress.values() if s['status'] == SOURCE_DONE)
+        if succeeded == len(job.sources):
+            job.status = JOB_COMPLETED
+        elif succeeded:
+            job.status = JOB_PARTIAL
+        else:
+            job.status = JOB_FAILED
+        job.finished_at = time.time()
+        logger.info(f"Job {job.job_id} {job.status} in {job.finished_at - job.created_at:.1f}s")
+
+    def _evict(self):
+        """Drop expired finished jobs, then the oldest finished ones over max_jobs"""
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and now - job.finished_at > self.retention_seconds:
+                del self._jobs[job_id]
+                self._evicted += 1
+
+        if len(self._jobs) >= self.max_jobs:
+            for job_id, job in list(self._jobs.items()):
+                if len(self._jobs) < self.max_jobs:
+                    break
+                if job.finished:
+                    del self._jobs[job_id]
+                    self._evicted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counts for the health endpoint"""
+        counts = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'stored': len(self._jobs),
+            'by_status': counts,
+            'evicted': self._evicted,
+            'rejected': self._rejected,
+            'retention_seconds': self.retention_seconds,
+            'max_jobs': self.max_jobs
+        }
@@ -0,0 +1,166 @@
+"""
+Scrape Metrics
+==============
+
+Minimal Prometheus text-format metrics for the scrape pipeline, with no
+client library dependency:
+- scrape_stage_duration_seconds: histogram per source and stage
+  (browser acquire, page load, readiness waits, extraction, ...)
+- scrape_items_total: items extracted per source and section
+- scrape_failures_total: failures per source and stage
+- scrape_runs_total: finished runs per source and outcome
+- gauges sampled at scrape time (executor queue depth, busy browsers, ...)
+
+Usage:
+    metrics = ScrapeMetrics()
+    with metrics.stage('groww', 'page_load'):
+        html = scraper.take_snapshot()
+    metrics.add_gauge('browsers_in_use', 'Busy browser sessions', pool.in_use_count)
+    text = metrics.render()
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Dict, Tuple
+import bisect
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs: Tuple[Tuple[str, str], ...]) -> str:
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class ScrapeMetrics:
+    """Thread-safe counters, histograms and sampled gauges"""
+
+    def __init__(self, namespace: str = 'news', buckets=DEFAULT_BUCKETS):
+        """
+        Initialize the registry
+
+        Args:
+            namespace: Prefix for every metric name
+            buckets: Upper bounds (seconds) of the stage duration histogram
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # (source, stage) -> [bucket counts..., sum, count]
+        self._durations: Dict[Tuple[str, str], list] = {}
+        self._counters: Dict[str, Dict[Tuple, float]] = {
+            'scrape_items_total': {},
+            'scrape_failures_total': {},
+            'scrape_runs_total': {},
+        }
+        self._help = {
+            'scrape_items_total': 'Items extracted per source and section',
+            'scrape_failures_total': 'Scrape failures per source and stage',
+            'scrape_runs_total': 'Finished scrape runs per source and outcome',
+        }
+        self._counter_labels = {
+            'scrape_items_total': ('source', 'section'),
+            'scrape_failures_total': ('source', 'stage'),
+            'scrape_runs_total': ('source', 'outcome'),
+        }
+        self._gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+
+    def observe(self, source: str, stage: str, seconds: float):
+        """Record one stage duration"""
+        with self._lock:
+            entry = self._durations.setdefault((source, stage), [0] * (len(self.buckets) + 2))
+            index = bisect.bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                entry[index] += 1
+            entry[-2] += seconds
+            entry[-1] += 1
+
+    def _inc(self, name: str, labels: Tuple, amount: float = 1):
+        with self._lock:
+            values = self._counters[name]
+            values[labels] = values.get(labels, 0) + amount
+
+    def add_items(self, source: str, section: str, count: int):
+        self._inc('scrape_items_total', (source, section), count)
+
+    def add_failure(self, source: str, stage: str):
+        self._inc('scrape_failures_total', (source, stage))
+
+    def add_run(self, source: str, outcome: str):
+        self._inc('scrape_runs_total', (source, outcome))
+
+    def add_gauge(self, name: str, help_text: str, read: Callable[[], float]):
+        """Register a gauge whose value is read at render time"""
+        self._gauges[name] = (help_text, read)
+
+    @contextmanager
+    def stage(self, source: str, stage: str):
+        """
+        Time a block as one stage; exceptions count as a failure of that stage
+
+        Stages that report failure without raising should call
+        add_failure() themselves.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.add_failure(source, stage)
+            raise
+        finally:
+            self.observe(source, stage, time.perf_counter() - start)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric"""
+        ns = self.namespace
+        lines = []
+
+        name = f'{ns}_scrape_stage_duration_seconds'
+        lines += [f'# HELP {name} Time spent per scrape stage', f'# TYPE {name} histogram']
+        with self._lock:
+            durations = {key: list(entry) for key, entry in self._durations.items()}
+            counters = {n: dict(values) for n, values in self._counters.items()}
+
+        for (source, stage), entry in sorted(durations.items()):
+            base = (('source', source), ('stage', stage))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), entry[:len(self.buckets)] + [None]):
+                cumulative = entry[-1] if count is None else cumulative + count
+                lines.append(f'{name}_bucket{_labels(base + (("le", _number(bound)),))} {cumulative}')
+            lines.append(f'{name}_sum{_labels(base)} {round(entry[-2], 6)}')
+            lines.append(f'{name}_count{_labels(base)} {entry[-1]}')
+
+        for counter, values in counters.items():
+            name = f'{ns}_{counter}'
+            lines += [f'# HELP {name} {self._help[counter]}', f'# TYPE {name} counter']
+            keys = self._counter_labels[counter]
+            for labels, value in sorted(values.items()):
+                lines.append(f'{name}{_labels(tuple(zip(keys, labels)))} {_number(value)}')
+
+        for gauge, (help_text, read) in sorted(self._gauges.items()):
+            name = f'{ns}_{gauge}'
+            try:
+                value = read()
+            except Exception as e:
+                logger.warning(f"Could not read gauge {gauge}: {e}")
+                continue
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} gauge', f'{name} {_number(value)}']
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,221 @@
+"""
+Scrape Tracing
+==============
+
+Lightweight trace spans through the scrape pipeline, with no external
+collector: the FastAPI request, the hop onto the executor thread, and each
+scraper method (driver init, navigation, extraction, cleanup) become
+nested spans sharing one trace ID.
+
+Finished spans are kept in memory for the most recent traces (served by
+/debug/traces/{id}) and, if TRACE_FILE is set, appended to a JSON-lines
+file. The current span lives in a contextvar; bind_context() carries it
+across run_in_executor, which doesn't copy context on its own.
+
+Usage:
+    with tracer.span('GET /scrape') as root:
+        ...
+    class Scraper:
+        @traced('pulse.navigate_to_page')
+        def navigate_to_page(self): ...
+    tracer.get_trace(root.trace_id)
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import partial, wraps
+from typing import Any, Callable, Dict, List, Optional
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('current_span', default=None)
+
+
+class Span:
+    """One timed operation within a trace"""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = time.time()
+        self._start_perf = time.perf_counter()
+        self.duration_ms = None
+        self.status = 'ok'
+        self.error = None
+        self.thread = threading.current_thread().name
+
+    def set(self, **attributes):
+        """Add attributes (e.g. item counts) while the span is open"""
+        self.attributes.update(attributes)
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.duration_ms = round((time.perf_counter() - self._start_perf) * 1000, 3)
+        if error is not None:
+            self.status = 'error'
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': self.start,
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'error': self.error,
+            'thread': self.thread,
+            'attributes': self.attributes
+        }
+
+
+class Tracer:
+    """Creates spans and collects the finished ones"""
+
+    def __init__(self, path: Optional[str] = None, max_traces: int = 200):
+        """
+        Initialize the tracer
+
+        Args:
+            path: JSON-lines file finished spans are appended to (None: memory only)
+            max_traces: Most recent traces kept in memory
+        """
+        self.path = path
+        self.max_traces = max_traces
+        self._traces: 'OrderedDict[str, List[Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.spans_recorded = 0
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """
+        Open a span as a child of the current one (or a new trace)
+
+        Yields:
+            Span: The open span; exceptions mark it as an error and propagate
+        """
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.finish(e)
+            raise
+        else:
+            span.finish()
+        finally:
+            _current_span.reset(token)
+            self._record(span)
+
+    def _record(self, span: Span):
+        record = span.to_dict()
+        with self._lock:
+            self.spans_recorded += 1
+            spans = self._traces.get(span.trace_id)
+            if spans is None:
+                spans = self._traces[span.trace_id] = []
+                while len(self._traces) > self.max_traces:
+                    self._traces.popitem(last=False)
+            spans.append(record)
+            if self.path:
+                try:
+                    with open(self.path, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(record, default=str) + '\n')
+                except OSError as e:
+                    logger.warning(f"Could not write span to {self.path}: {e}")
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Summaries of the latest traces, newest first"""
+        with self._lock:
+            traces = list(self._traces.items())[-limit:]
+        summaries = []
+        for trace_id, spans in reversed(traces):
+            roots = [s for s in spans if s['parent_id'] is None]
+            root = roots[0] if roots else min(spans, key=lambda s: s['start'])
+            summaries.append({
+                'trace_id': trace_id,
+                'name': root['name'],
+                'start': root['start'],
+                'duration_ms': root['duration_ms'],
+                'spans': len(spans),
+                'errors': sum(1 for s in spans if s['status'] == 'error')
+            })
+        return summaries
+
+    def get_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """
+        One trace as a span tree plus its slowest spans
+
+        Returns:
+            dict or None: {"trace_id", "duration_ms", "spans" (nested via
+            "children", ordered by start), "slowest"}; None if unknown
+        """
+        with self._lock:
+            spans = [dict(s) for s in self._traces.get(trace_id, [])]
+        if not spans:
+            return None
+
+        spans.sort(key=lambda s: s['start'])
+        start = spans[0]['start']
+        by_id = {}
+        for s in spans:
+            s['offset_ms'] = round((s['start'] - start) * 1000, 3)
+            s['children'] = []
+            by_id[s['span_id']] = s
+        roots = []
+        for s in spans:
+            parent = by_id.get(s['parent_id'])
+            (parent['children'] if parent else roots).append(s)
+
+        end = max(s['start'] + (s['duration_ms'] or 0) / 1000.0 for s in spans)
+        slowest = sorted(spans, key=lambda s: s['duration_ms'] or 0, reverse=True)[:10]
+        return {
+            'trace_id': trace_id,
+            'duration_ms': round((end - start) * 1000, 3),
+            'span_count': len(spans),
+            'spans': roots,
+            'slowest': [
+                {'name': s['name'], 'span_id': s['span_id'], 'duration_ms': s['duration_ms'], 'status': s['status']}
+                for s in slowest
+            ]
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {'traces': len(self._traces), 'spans_recorded': self.spans_recorded, 'file': self.path}
+
+
+tracer = Tracer(os.getenv("TRACE_FILE") or None, max_traces=int(os.getenv("TRACE_MAX_TRACES", "200")))
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def bind_context(fn: Callable) -> Callable:
+    """Run fn in a copy of the caller's context (for run_in_executor)"""
+    return partial(copy_context().run, fn)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator that wraps every call of a function in a span"""
+    def decorate(fn):
+        span_name = name or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,90 @@
+"""
+Single-Flight Scrape Coalescing
+===============================
+
+Concurrent callers asking for the same source share one in-flight scraper
+run instead of each queueing their own on the executor. The first caller
+starts the run; everyone arriving before it finishes awaits the same
+future and receives the same result.
+
+Usage:
+    flight = SingleFlight()
+    result = await flight.do('groww', registry.get('groww').run, executor)
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict
+import asyncio
+import logging
+import time
+
+from scrape_tracing import bind_context, tracer
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Deduplicates concurrent runs of the same keyed loader"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._calls = defaultdict(int)
+        self._executions = defaultdict(int)
+        self._deduplicated = defaultdict(int)
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, loader: Callable[[], Dict[str, Any]], executor) -> Dict[str, Any]:
+        """
+        Run loader for key, or join the run already in progress
+
+        Args:
+            key: Source name ("groww", "pulse")
+            loader: Blocking function that runs the scraper
+            executor: Executor the loader runs on
+
+        Returns:
+            dict: The loader's result (shared by all joined callers)
+        """
+        self._calls[key] += 1
+        future = self._inflight.get(key)
+
+        with tracer.span(f'single_flight.{key}', joined=future is not None):
+            if future is None:
+                self._executions[key] += 1
+                submitted = time.perf_counter()
+
+                def run():
+                    queued_ms = round((time.perf_counter() - submitted) * 1000, 3)
+                    with tracer.span('executor.run', source=key, queued_ms=queued_ms):
+                        return loader()
+
+                # The run's spans join the first caller's trace
+                future = asyncio.get_event_loop().run_in_executor(executor, bind_context(run))
+                self._inflight[key] = future
+                # Cleared on completion, not when the first caller returns, so a
+                # disconnected caller can't orphan the run
+                future.add_done_callback(lambda f, key=key: self._clear(key, f))
+            else:
+                self._deduplicated[key] += 1
+                logger.info(f"Joining in-flight {key} scrape")
+
+            # Shield so one cancelled caller doesn't cancel the shared run
+            return await asyncio.shield(future)
+
+    def _clear(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-key call, execution and dedup counters"""
+        return {
+            key: {
+                'calls': self._calls[key],
+                'executions': self._executions[key],
+                'deduplicated': self._deduplicated[key],
+                'in_flight': key in self._inflight
+            }
+            for key in self._calls
+        }
@@ -0,0 +1,311 @@
+"""
+Stand-in Server
+===============
+
+A local web server that mimics Groww and Pulse from recorded pages, so
+news_api.py and the scrapers can be load-tested and profiled with no
+network and with repeatable timings.
+
+Each site is served under its own prefix:
+    /groww/share-market-today   Recorded Groww page
+    /groww/fragments/<n>        Lazy-loaded fragments, appended as the page scrolls
+    /groww/api/<name>           Recorded JSON responses, fetched by the page on load
+    /pulse/                     Recorded Pulse page
+    /__standin/stats            Request counts and latency settings
+
+Fixtures (in STANDIN_DIR, default ./standin):
+    <site>/index.html           Page source (falls back to BENCHMARK_DIR/<site>.html,
+                                as saved by "benchmark_extractors.py record")
+    <site>/fragments/*.html     HTML appended one file per scroll, in name order
+    <site>/api/<name>.json      Payloads the page fetches (GROWW_PARSE_MODE=network);
+                                name Groww's after the section, e.g. top_gainers.json,
+                                so groww_network.SECTION_ENDPOINTS picks them up
+
+External <script src> tags are removed so recorded pages stay static; inline
+data such as __NEXT_DATA__ is kept. Latency is added per request, with
+optional jitter from a fixed seed.
+
+Point the scrapers at it with the URL overrides:
+    python standin_server.py --latency-ms 400 --fragment-latency-ms 150
+    GROWW_URL=http://127.0.0.1:8765/groww/share-market-today \\
+    PULSE_URL=http://127.0.0.1:8765/pulse/ python news_api.py
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+STANDIN_DIR = os.getenv("STANDIN_DIR", "standin")
+BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "benchmarks")
+
+# Path each site's page is served at, mirroring the live URL
+SITE_PAGES = {'groww': '/groww/share-market-today', 'pulse': '/pulse/'}
+
+_EXTERNAL_SCRIPT = re.compile(r'<script\b[^>]*\bsrc\s*=[^>]*>\s*</script>', re.IGNORECASE)
+
+# Emulates the live pages' background loading: fetch each recorded API
+# payload once, then append the next fragment whenever the viewport nears
+# the bottom (as infinite scroll does)
+LOADER_JS = """
+<script>
+(() => {
+  const base = %(base)s, apis = %(apis)s, fragments = %(fragments)s;
+  apis.forEach(name => fetch(base + '/api/' + name).catch(() => {}));
+  let next = 1, loading = false;
+  const more = () => {
+    if (loading || next > fragments) return;
+    if (window.scrollY + window.innerHeight < document.body.scrollHeight - 400) return;
+    loading = true;
+    fetch(base + '/fragments/' + next).then(r => r.text()).then(html => {
+      const holder = document.createElement('div');
+      holder.setAttribute('data-standin-fragment', String(next));
+      holder.innerHTML = html;
+      document.body.appendChild(holder);
+      next++;
+    }).catch(() => {}).finally(() => { loading = false; more(); });
+  };
+  window.addEventListener('scroll', more, {passive: true});
+  more();
+})();
+</script>
+"""
+
+
+def _list_files(directory: str, suffix: str) -> List[str]:
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name for name in os.listdir(directory) if name.endswith(suffix))
+
+
+def _read(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class SiteFixture:
+    """One site's page, fragments and API payloads, loaded from disk"""
+
+    def __init__(self, site: str, root: str = STANDIN_DIR, keep_scripts: bool = False):
+        """
+        Load a site's fixtures
+
+        Args:
+            site: "groww" or "pulse"
+            root: Fixture directory holding <site>/
+            keep_scripts: Serve the page with its external scripts intact
+
+        Raises:
+            FileNotFoundError: Neither <root>/<site>/index.html nor
+                BENCHMARK_DIR/<site>.html exists
+        """
+        self.site = site
+        site_dir = os.path.join(root, site)
+        page = os.path.join(site_dir, 'index.html')
+        if not os.path.exists(page):
+            page = os.path.join(BENCHMARK_DIR, f'{site}.html')
+        if not os.path.exists(page):
+            raise FileNotFoundError(f"No page for {site}: add {site_dir}/index.html or record {page}")
+
+        fragment_dir = os.path.join(site_dir, 'fragments')
+        self.fragments = [_read(os.path.join(fragment_dir, name)) for name in _list_files(fragment_dir, '.html')]
+        api_dir = os.path.join(site_dir, 'api')
+        self.api = {name[:-len('.json')]: _read(os.path.join(api_dir, name)) for name in _list_files(api_dir, '.json')}
+
+        html = _read(page)
+        if not keep_scripts:
+            html = _EXTERNAL_SCRIPT.sub('', html)
+        if self.fragments or self.api:
+            loader = LOADER_JS % {
+                'base': json.dumps(f'/{site}'),
+                'apis': json.dumps(sorted(self.api)),
+                'fragments': len(self.fragments),
+            }
+            if re.search(r'</body\s*>', html, re.IGNORECASE):
+                html = re.sub(r'(</body\s*>)', lambda m: loader + m.group(1), html, count=1, flags=re.IGNORECASE)
+            else:
+                html += loader
+        self.page = html.encode('utf-8')
+        self.source = page
+
+
+class StandinServer:
+    """Threaded HTTP server for the recorded sites"""
+
+    def __init__(self, root: str = STANDIN_DIR, host: str = '127.0.0.1', port: int = 8765,
+                 latency_ms: float = 0, fragment_latency_ms: float = 0, jitter_ms: float = 0,
+                 seed: Optional[int] = 0, keep_scripts: bool = False):
+        """
+        Load fixtures and bind the server (call start() or serve_forever())
+
+        Args:
+            root: Fixture directory
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            latency_ms: Delay before each page response
+            fragment_latency_ms: Delay before each fragment or API response
+            jitter_ms: Extra random delay, uniform in [0, jitter_ms]
+            seed: Jitter seed, for repeatable runs (None: unseeded)
+            keep_scripts: Serve pages with their external scripts intact
+        """
+        self.sites: Dict[str, SiteFixture] = {}
+        for site in SITE_PAGES:
+            try:
+                self.sites[site] = SiteFixture(site, root, keep_scripts)
+            except FileNotFoundError as e:
+                logger.warning(str(e))
+        if not self.sites:
+            raise FileNotFoundError(f"No fixtures found in {root} or {BENCHMARK_DIR}")
+
+        self.latency_ms = latency_ms
+        self.fragment_latency_ms = fragment_latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self._thread = None
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                logger.debug("%s - %s", self.address_string(), format % args)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+
+    def url(self, site: str) -> str:
+        """Page URL for a site"""
+        return f"http://{self.host}:{self.port}{SITE_PAGES[site]}"
+
+    def env(self) -> Dict[str, str]:
+        """URL overrides that point the scrapers here"""
+        names = {'groww': 'GROWW_URL', 'pulse': 'PULSE_URL'}
+        return {names[site]: self.url(site) for site in self.sites}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = dict(self.requests)
+        return {
+            'requests': requests,
+            'latency_ms': self.latency_ms,
+            'fragment_latency_ms': self.fragment_latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'sites': {
+                site: {'source': f.source, 'fragments': len(f.fragments), 'api': sorted(f.api)}
+                for site, f in self.sites.items()
+            }
+        }
+
+    def _delay(self, base_ms: float):
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        if base_ms + jitter > 0:
+            time.sleep((base_ms + jitter) / 1000.0)
+
+    def _route(self, path: str):
+        """
+        Resolve a request path
+
+        Returns:
+            tuple: (kind, status, content_type, body); kind labels the
+            request in stats and picks the latency
+        """
+        if path == '/__standin/stats':
+            return 'stats', 200, 'application/json', json.dumps(self.stats()).encode('utf-8')
+
+        parts = path.strip('/').split('/', 2)
+        fixture = self.sites.get(parts[0])
+        if fixture is None:
+            return 'missing', 404, 'text/plain', b'Not found'
+        if len(parts) == 1 or path.rstrip('/') == SITE_PAGES[fixture.site].rstrip('/'):
+            return f'{fixture.site}.page', 200, 'text/html; charset=utf-8', fixture.page
+        if len(parts) == 3 and parts[1] == 'fragments' and parts[2].isdigit():
+            index = int(parts[2]) - 1
+            if 0 <= index < len(fixture.fragments):
+                return f'{fixture.site}.fragment', 200, 'text/html; charset=utf-8', fixture.fragments[index].encode('utf-8')
+        if len(parts) == 3 and parts[1] == 'api' and parts[2] in fixture.api:
+            return f'{fixture.site}.api', 200, 'application/json', fixture.api[parts[2]].encode('utf-8')
+        return 'missing', 404, 'text/plain', b'Not found'
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        kind, status, content_type, body = self._route(unquote(urlsplit(request.path).path))
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+
+        if kind.endswith('.page'):
+            self._delay(self.latency_ms)
+        elif kind.endswith(('.fragment', '.api')):
+            self._delay(self.fragment_latency_ms)
+
+        request.send_response(status)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(body)))
+        request.send_header('Cache-Control', 'no-store')
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self) -> 'StandinServer':
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='standin-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def main():
+    """Serve the recorded sites until interrupted"""
+    parser = argparse.ArgumentParser(description="Local stand-in for Groww and Pulse")
+    parser.add_argument('--dir', default=STANDIN_DIR, help="Fixture directory")
+    parser.add_argument('--host', default=os.getenv("STANDIN_HOST", "127.0.0.1"))
+    parser.add_argument('--port', type=int, default=int(os.getenv("STANDIN_PORT", "8765")))
+    parser.add_argument('--latency-ms', type=float, default=float(os.getenv("STANDIN_LATENCY_MS", "0")),
+                        help="Delay before each page response")
+    parser.add_argument('--fragment-latency-ms', type=float,
+                        default=float(os.getenv("STANDIN_FRAGMENT_LATENCY_MS", "0")),
+                        help="Delay before each lazy fragment or API response")
+    parser.add_argument('--jitter-ms', type=float, default=float(os.getenv("STANDIN_JITTER_MS", "0")),
+                        help="Extra random delay per response, up to this much")
+    parser.add_argument('--seed', type=int, default=0, help="Jitter seed")
+    parser.add_argument('--keep-scripts', action='store_true', help="Don't strip external scripts")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = StandinServer(args.dir, args.host, args.port, args.latency_ms, args.fragment_latency_ms,
+                           args.jitter_ms, args.seed, args.keep_scripts)
+    for site, fixture in server.sites.items():
+        logger.info(f"{site}: {server.url(site)} ({len(fixture.fragments)} fragments, {len(fixture.api)} API payloads)")
+    logger.info("Point the scrapers here with: " + ' '.join(f'{k}={v}' for k, v in server.env().items()))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()